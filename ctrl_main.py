@@ -5,12 +5,62 @@
 
 # Version
 # ------------------------------
+# 0.23  -   Failing Event listeners reported, listeners of closed event-loops removed
+#           [18.10.2026] - Jan T. Olsen
+# 0.22  -   Failing Frame listeners reported, listeners of closed event-loops removed
+#           [18.10.2026] - Jan T. Olsen
+# 0.21  -   Reports with dropped events resynchronized from the device state or applied as received
+#           [18.10.2026] - Jan T. Olsen
+# 0.20  -   Settling Axis Filters of the Axis callbacks stepped by update()
+#           [18.10.2026] - Jan T. Olsen
+# 0.19  -   Axis callbacks scaled and filtered like the Joystick and Trigger Classes
+#           [18.10.2026] - Jan T. Olsen
+# 0.18  -   Button edges assigned only to the Controller Classes with changed Button bits
+#           [18.10.2026] - Jan T. Olsen
+# 0.17  -   Device Profile registry and on-disk Device Cache for the Controller type
+#           [18.10.2026] - Jan T. Olsen
+# 0.16  -   Controller profiles loaded from file and hot-reloaded,
+#           Dispatch-Table and Scaling Constants swapped at report and update boundaries
+#           [18.10.2026] - Jan T. Olsen
+# 0.15  -   Controller Constants and Clock parameters, settling of Axis Filters in update()
+#           [18.10.2026] - Jan T. Olsen
+# 0.14  -   Events coalesced per report and committed at the end of the report,
+#           reports with dropped events discarded
+#           [18.10.2026] - Jan T. Olsen
+# 0.13  -   Packed Button bits of the consumed Frame
+#           [18.10.2026] - Jan T. Olsen
+# 0.12  -   Controller State shared by the Back-Frame, the Frames and the Controller Classes as views
+#           [18.10.2026] - Jan T. Olsen
+# 0.11  -   Injectable clock, clear error without connected controller
+#           [18.10.2026] - Jan T. Olsen
+# 0.10  -   Recording of the incomming event stream
+#           [18.10.2026] - Jan T. Olsen
+# 0.9   -   Pluggable Backends, native evdev Backend with integer Event-Keys
+#           [18.10.2026] - Jan T. Olsen
+# 0.8   -   Controller Group reading all connected gamepads from a single thread
+#           [18.10.2026] - Jan T. Olsen
+# 0.7   -   Button press/release counts and pressed latches consumed by update()
+#           [18.10.2026] - Jan T. Olsen
+# 0.6   -   Button press/release and Axis change callbacks
+#           [18.10.2026] - Jan T. Olsen
+# 0.5   -   Asynchronous frames() and next_event() for asyncio applications
+#           [18.10.2026] - Jan T. Olsen
+# 0.4   -   Blocking wait_for_change() signalled by the Controller Monitor
+#           [18.10.2026] - Jan T. Olsen
+# 0.3   -   Incremental update() of changed Controller Classes only
+#           [18.10.2026] - Jan T. Olsen
+# 0.2   -   Consistent Controller Frames between monitor-thread and update()
+#           [18.10.2026] - Jan T. Olsen
+# 0.1   -   Event routing through compiled Dispatch-Table,
+#           single Controller Monitor for all controller types
+#           [18.10.2026] - Jan T. Olsen
 # 0.0   -   Initial version
 #           [20.06.2022] - Jan T. Olsen
 
 # Import packages
+import asyncio
+import selectors
 import threading
-import time
 
 # Import Toolbox
 import ctrl_toolbox as CtrlToolbox
@@ -21,80 +71,150 @@ from lib.trigger import Trigger
 from lib.dpad import DPad
 from lib.button import XboxButton
 from lib.button import PSButton
+from lib.backend import as_backend
+from lib.backend import get_backend
+from lib.backend import get_backends
+from lib.callback import CallbackExecutor
+from lib.callback import Subscriptions
+from lib.record import EventRecorder
+from lib.profile import ProfileWatcher
+from lib.device import DeviceCache
+from lib.clock import SYSTEM_CLOCK
 
 # Controller Class
 # ------------------------------
 class Controller():
+    """
+    Controller Class:
+    Read input values from an external gamepad Controller
+    :param gamepad: Backend or gamepad object of the inputs package (None: first connected gamepad)
+    :param monitor: Start a designated Controller-Monitor thread (bool),
+                    otherwise events are passed in by the owner (e.g. ControllerGroup)
+    :param XBOX_CONST: XBOX Controller Constants (None: CtrlToolbox.XBOXONE_CONST())
+    :param PS3_CONST: PS3 Controller Constants (None: CtrlToolbox.PS3_CONST())
+    :param clock: Clock timing the Axis Filters (lib.clock)
+    :param profile: Path of a Controller profile file applied to the Controller Constants (str)
+    :param device_cache: Device Cache or path of the Device Cache file (lib.device.DeviceCache / str),
+                         caching the connected gamepad and its Device Profile (None: no cache)
+    """
 
     # Class constructor
     # ------------------------------
-    def __init__(self):
+    def __init__(self,
+                 gamepad = None,
+                 monitor : bool = True,
+                 XBOX_CONST : CtrlToolbox.XBOXONE_CONST = None,
+                 PS3_CONST : CtrlToolbox.PS3_CONST = None,
+                 clock = SYSTEM_CLOCK,
+                 profile : str = None,
+                 device_cache = None):
+
+        # Controller State consumed by update()
+        # (the Generic Data and the Controller Classes read it through views)
+        self._update_state = CtrlToolbox.new_state()
 
         # Define Controller Members
-        # (based on Dataclasses from Controller-Toolbox)
-        self.GenericAxis = CtrlToolbox.GenericAxisData()
-        self.GenericButton = CtrlToolbox.GenericButtonData()
+        # (views from Controller-Toolbox)
+        self.GenericAxis = CtrlToolbox.GenericAxisData(self._update_state)
+        self.GenericButton = CtrlToolbox.GenericButtonData(self._update_state)
 
         # Constants
-        self.XBOX_CONST = CtrlToolbox.XBOXONE_CONST()
-        self.PS3_CONST = CtrlToolbox.PS3_CONST()
+        # (e.g. with Axis Filter stages)
+        self.XBOX_CONST = XBOX_CONST if XBOX_CONST is not None else CtrlToolbox.XBOXONE_CONST()
+        self.PS3_CONST = PS3_CONST if PS3_CONST is not None else CtrlToolbox.PS3_CONST()
+
+        # Clock timing the Axis Filters
+        self.clock = clock
         
+        # Device Cache
+        if isinstance(device_cache, str):
+            device_cache = DeviceCache(device_cache)
+        self.device_cache = device_cache
+
         # Search for connected controller
-        # (using CtrlToolbox. function)
-        self.gamepad = CtrlToolbox.get_controller()
+        # (cached gamepad first, otherwise using Backend function)
+        if gamepad is None and device_cache is not None:
+            gamepad = device_cache.get_backend()
+        if gamepad is None:
+            gamepad = get_backend()
+        self.gamepad = as_backend(gamepad)
+
+        # No connected controller
+        # (use lib.synthetic.SyntheticBackend without a gamepad)
+        if self.gamepad is None:
+            # Controller Initialization failed
+            self.init = False
+
+            # Raise Error
+            raise TypeError('No connected Controller')
         
-        # Determine the type of Controller
-        # (using CtrlToolbox. function)
-        self.gamepad_type = CtrlToolbox.get_controller_type(self.gamepad)
+        # Determine the Device Profile and type of Controller
+        # (using the Device Cache or CtrlToolbox. function)
+        if device_cache is not None:
+            self.device_profile = device_cache.resolve(self.gamepad)
+        else:
+            self.device_profile = CtrlToolbox.get_device_profile(self.gamepad)
+        self.gamepad_type = self.device_profile.type if self.device_profile is not None else 'UNKNOWN'
 
         # Controller Initialized
         self.init = False
 
-        # Initialize Controller Monitor on a designated thread
+        # Controller profile
+        # (applied on top of the Controller Constants of the Controller type,
+        #  reloaded profiles are swapped in by the controller-monitor-thread and update())
+        self._profile_lock = threading.Lock()
+        self._pending_table = None
+        self._pending_const = None
+        self._profile_watcher = None
+        if self.gamepad_type in CtrlToolbox.PROFILE_TYPES:
+            # (Device Profile of the gamepad model, e.g. raw ranges of the Joysticks)
+            if self.device_profile.profile:
+                self._set_const(CtrlToolbox.apply_profile(self._get_const(), self.device_profile.profile))
+            self._base_const = self._get_const()
+            if profile is not None:
+                self._set_const(self._build_profile(profile))
+
+        # Initialize Controller Classes and Dispatch-Table
         # ------------------------------
-        # Based on the Controller-Type launch the related controller-monitor-thread
+        # Incomming events are written to the Controller State of the Back-Frame
+        # by the controller-monitor-thread, and published as a copy (Controller Frame)
+        # at the end of each report
 
         # XBOX Controller
         if self.gamepad_type == 'XBOX':
             
             # Define Controller Classes
-            self.JoyLeft = Joystick('JOY_L', self.XBOX_CONST)
-            self.JoyRight = Joystick('JOY_R', self.XBOX_CONST)
-            self.TrigLeft = Trigger('L' ,self.XBOX_CONST)
-            self.TrigRight = Trigger('R' ,self.XBOX_CONST)
+            self.JoyLeft = Joystick('JOY_L', self.XBOX_CONST, clock)
+            self.JoyRight = Joystick('JOY_R', self.XBOX_CONST, clock)
+            self.TrigLeft = Trigger('L' ,self.XBOX_CONST, clock)
+            self.TrigRight = Trigger('R' ,self.XBOX_CONST, clock)
             self.Button = XboxButton()
             self.DPad = DPad()
 
-            # Configure thread
-            self._monitor_thread = threading.Thread(target=self._XBOX_ControllerMonitor, args=())
-            self._monitor_thread.daemon = True
-
-            # Start XBOX-Controller-Monitor
-            self._monitor_thread.start()
+            # Back-Frame written by the controller-monitor-thread
+            self._back_frame = CtrlToolbox.ControllerFrame(ButtonView=CtrlToolbox.XBOX_ButtonData)
+            button_data = 'xboxButtonData'
 
-            # Controller Initialization done
-            self.init = True
+            # Button names related to Generic Button names
+            self._button_names = {'A' : 'S', 'B' : 'E', 'X' : 'W', 'Y' : 'N'}
 
         # Playstation 3 Controller
         elif self.gamepad_type == 'PS3':
 
             # Define Controller Classes
-            self.JoyLeft = Joystick('JOY_L', self.PS3_CONST)
-            self.JoyRight = Joystick('JOY_R', self.PS3_CONST)
-            self.TrigLeft = Trigger('L' ,self.XBOX_CONST)
-            self.TrigRight = Trigger('R' ,self.XBOX_CONST)
+            self.JoyLeft = Joystick('JOY_L', self.PS3_CONST, clock)
+            self.JoyRight = Joystick('JOY_R', self.PS3_CONST, clock)
+            self.TrigLeft = Trigger('L' ,self.PS3_CONST, clock)
+            self.TrigRight = Trigger('R' ,self.PS3_CONST, clock)
             self.Button = PSButton()
             self.DPad = DPad()
 
-            # Configure thread
-            self._monitor_thread = threading.Thread(target=self._PS3_ControllerMonitor, args=())
-            self._monitor_thread.daemon = True
-
-            # Start PS3-Controller-Monitor
-            self._monitor_thread.start()
+            # Back-Frame written by the controller-monitor-thread
+            self._back_frame = CtrlToolbox.ControllerFrame(ButtonView=CtrlToolbox.PS_ButtonData)
+            button_data = 'psButtonData'
 
-            # Controller Initialization done
-            self.init = True
+            # Button names related to Generic Button names
+            self._button_names = {'Cross' : 'S', 'Circle' : 'E', 'Square' : 'W', 'Triangle' : 'N'}
 
         # Unknown Controller
         else:
@@ -104,91 +224,926 @@ class Controller():
             # Raise Error 
             raise TypeError('Unknown Controller')
 
+        # Compile Dispatch-Table for incomming events
+        self._dispatch_table = self._compile_dispatch_table(self._get_const())
+
+        # Input events of the current report
+        # (last event state per Dispatch-Table entry, committed at the end of the report)
+        self._report = dict()
+        self._report_dropped = False
+
+        # Controller Component flags changed since the last published Frame
+        # (set by the controller-monitor-thread when committing a report)
+        self._dirty = 0
+
+        # Published Frame
+        # (replaced as a whole by the controller-monitor-thread, never modified after publishing)
+        self._frame_version = 0
+        self._frame = self._back_frame.copy(self._frame_version)
+
+        # Frame versions consumed by update()
+        self._update_version = None
+        self._update_versions = (None,) * CtrlToolbox.COMPONENT_COUNT
+
+        # Button press/release counts consumed by update()
+        self._update_presses = self._frame.presses
+        self._update_releases = self._frame.releases
+        self._update_latched = 0
+
+        # Condition signalled on published Frames
+        # (only notified when threads are waiting for a change)
+        self._frame_condition = threading.Condition()
+        self._frame_waiters = 0
+
+        # Listeners called by the controller-monitor-thread
+        # (tuples replaced as a whole on change, read without locking)
+        self._listener_lock = threading.Lock()
+        self._frame_listeners = ()
+        self._event_listeners = ()
+
+        # Button and Axis callbacks
+        # (Callback Executor and Subscriptions created on first use)
+        self._callback_executor = None
+        self._subscriptions = None
+
+        # Event Recorder (created by start_recording())
+        self._recorder = None
+
+        # Controller Classes reading the Controller State of update() through views
+        # (in order of the Controller Component flags)
+        state = self._update_state
+        self.JoyLeft.joystickData = CtrlToolbox.JoystickData(state, 'L')
+        self.JoyRight.joystickData = CtrlToolbox.JoystickData(state, 'R')
+        self.TrigLeft.triggerData = CtrlToolbox.TriggerData(state, 'L')
+        self.TrigRight.triggerData = CtrlToolbox.TriggerData(state, 'R')
+        self.DPad.dPadData = CtrlToolbox.DPadData(state)
+        setattr(self.Button, button_data, self._back_frame.ButtonView(state))
+        self._components = (self.JoyLeft, self.JoyRight, self.TrigLeft, self.TrigRight, self.DPad, self.Button)
+
+        # Controller Classes with Axis Filters
+        # (index of the Controller Component, Controller Class)
+        self._filtered = tuple((index, component) for index, component in enumerate(self._components)
+                               if getattr(component, 'filters', None))
+
+        # Initialize Controller Monitor on a designated thread
+        # ------------------------------
+        self._monitor_thread = None
+        if monitor:
+            # Configure thread
+            self._monitor_thread = threading.Thread(target=self._ControllerMonitor, args=())
+            self._monitor_thread.daemon = True
+
+            # Start Controller-Monitor
+            self._monitor_thread.start()
+
+        # Controller Initialization done
+        self.init = True
+
+    # Button bits
+    # ------------------------------
+    @property
+    def buttons(self) -> int:
+        """
+        Packed Button bits consumed by the latest update()
+        (see CtrlToolbox.BUTTON_S ... BUTTON_RB2 and the Button Bitmask helpers)
+        :return buttons: Button bits (int)
+        """
+        return self._update_state[CtrlToolbox.STATE_BUTTONS]
+
+    # Get Controller Frame
+    # ------------------------------
+    def get_frame(self) -> CtrlToolbox.ControllerFrame:
+        """
+        Get the latest published Controller Frame
+        (never blocks on the controller-monitor-thread)
+        :return frame: Controller Frame (CtrlToolbox.ControllerFrame)
+        """
+        return self._frame
+
+    # Get Controller State Version
+    # ------------------------------
+    @property
+    def version(self) -> int:
+        """
+        Version of the latest published Controller Frame
+        (only incremented when Controller Data has changed)
+        :return version: Frame version (int)
+        """
+        return self._frame.version
+
+    # Wait for Controller Change
+    # ------------------------------
+    def wait_for_change(self,
+                        timeout : float = None,
+                        components : int = CtrlToolbox.COMPONENT_ALL) -> bool:
+        """
+        Block until a Frame with changes to the given Controller Components is published
+        (returns immediately if such a change is not yet consumed by update())
+        :param timeout: Maximum time to wait in seconds (None: wait forever)
+        :param components: Controller Component flags to wait for (CtrlToolbox.COMPONENT_*)
+        :return changed: Change available, False if the timeout expired (bool)
+        """
+
+        # Check Component versions against the versions consumed by update()
+        def changed() -> bool:
+            versions = self._frame.versions
+            update_versions = self._update_versions
+            for index in range(CtrlToolbox.COMPONENT_COUNT):
+                if components & (1 << index) and versions[index] != update_versions[index]:
+                    return True
+            return False
+
+        # Wait for change
+        with self._frame_condition:
+            self._frame_waiters += 1
+            try:
+                return self._frame_condition.wait_for(changed, timeout)
+            finally:
+                self._frame_waiters -= 1
+
+    # Add Listener
+    # ------------------------------
+    def _add_listener(self, name : str, listener) -> None:
+        """
+        Add a listener called from the controller-monitor-thread
+        :param name: Listener attribute ('_frame_listeners' or '_event_listeners')
+        :param listener: Function called with the published Frame or incomming event
+        """
+        with self._listener_lock:
+            setattr(self, name, getattr(self, name) + (listener,))
+
+    # Remove Listener
+    # ------------------------------
+    def _remove_listener(self, name : str, listener) -> None:
+        """
+        Remove a listener called from the controller-monitor-thread
+        :param name: Listener attribute ('_frame_listeners' or '_event_listeners')
+        :param listener: Listener to remove
+        """
+        with self._listener_lock:
+            setattr(self, name, tuple(item for item in getattr(self, name) if item is not listener))
+
+    # Asynchronous Controller Frames
+    # ------------------------------
+    async def frames(self, components : int = CtrlToolbox.COMPONENT_ALL):
+        """
+        Asynchronous iterator of published Controller Frames
+        Starts with the latest Frame, then yields each new Frame with changes to the given
+        Controller Components. A slow consumer receives the latest Frame and skips older ones.
+        :param components: Controller Component flags to wait for (CtrlToolbox.COMPONENT_*)
+        :return frames: Asynchronous iterator of Controller Frames (CtrlToolbox.ControllerFrame)
+        """
+
+        # Event-loop wakeup, scheduled by the controller-monitor-thread
+        loop = asyncio.get_running_loop()
+        wakeup = asyncio.Event()
+        pending = [False]
+
+        def wake() -> None:
+            pending[0] = False
+            wakeup.set()
+
+        def listener(frame) -> None:
+            if frame.changed & components and not pending[0]:
+                pending[0] = True
+                try:
+                    loop.call_soon_threadsafe(wake)
+
+                # Event-loop closed without closing the iterator
+                except RuntimeError:
+                    self._remove_listener('_frame_listeners', listener)
+
+        self._add_listener('_frame_listeners', listener)
+        try:
+            # Latest Frame
+            frame = self._frame
+            yield frame
+
+            while True:
+                # Wait for a Frame with changes to the given Components
+                wakeup.clear()
+                latest = self._frame
+                if not self._frame_changed(frame, latest, components):
+                    await wakeup.wait()
+                    latest = self._frame
+                    if not self._frame_changed(frame, latest, components):
+                        continue
+
+                frame = latest
+                yield frame
+
+        finally:
+            self._remove_listener('_frame_listeners', listener)
+
+    # Asynchronous Controller Event
+    # ------------------------------
+    async def next_event(self):
+        """
+        Wait for the next incomming event of the Backend
+        :return event: Input event (ev_type, code, state)
+        """
+
+        # Future completed in the event-loop by the controller-monitor-thread
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def set_result(event) -> None:
+            if not future.done():
+                future.set_result(event)
+
+        def listener(event) -> None:
+            try:
+                loop.call_soon_threadsafe(set_result, event)
+
+            # Event-loop closed while waiting
+            except RuntimeError:
+                self._remove_listener('_event_listeners', listener)
+
+        self._add_listener('_event_listeners', listener)
+        try:
+            return await future
+        finally:
+            self._remove_listener('_event_listeners', listener)
+
+    # Start Recording
+    # ------------------------------
+    def start_recording(self, path : str, clock = SYSTEM_CLOCK) -> EventRecorder:
+        """
+        Record all incomming events to a recording file
+        (replay the recording with lib.record.ReplayBackend)
+        :param path: Path of the recording file (str)
+        :param clock: Clock for the event timestamps (lib.clock.MonotonicClock / ManualClock)
+        :return recorder: Event Recorder (EventRecorder)
+        """
+        self.stop_recording()
+        self._recorder = EventRecorder(self, path, clock)
+
+        return self._recorder
+
+    # Stop Recording
+    # ------------------------------
+    def stop_recording(self) -> None:
+        """
+        Stop recording and close the recording file
+        """
+        if self._recorder is not None:
+            self._recorder.close()
+            self._recorder = None
+
+    # Load Controller Profile
+    # ------------------------------
+    def load_profile(self, path : str) -> CtrlToolbox._GAMEPAD_CONST:
+        """
+        Load a Controller profile file and swap it in while events are processed
+        The Controller Constants, Scaling Lookup-Tables and the Dispatch-Table are built on the calling thread,
+        then the Dispatch-Table is swapped by the controller-monitor-thread at the end of the next report
+        and the Scaling Constants by the next update(), so no report or update sees a half-applied profile
+        :param path: Path of the Controller profile file (str)
+        :return GAMEPAD_CONST: Controller Constants of the profile
+        """
+        const = self._build_profile(path)
+        table = self._compile_dispatch_table(const)
+
+        # Hand over to the controller-monitor-thread and update()
+        with self._profile_lock:
+            self._pending_table = (table, const)
+            self._pending_const = const
+
+        return const
+
+    # Start Watching Controller Profile
+    # ------------------------------
+    def start_watching_profile(self, path : str, interval : float = 1.0) -> ProfileWatcher:
+        """
+        Reload a Controller profile file whenever it changes
+        (invalid profiles are reported, the previous profile stays in use)
+        :param path: Path of the Controller profile file (str)
+        :param interval: Polling interval in seconds (float)
+        :return watcher: Profile Watcher (ProfileWatcher)
+        """
+        self.stop_watching_profile()
+        self._profile_watcher = ProfileWatcher(path, self.load_profile, interval)
+
+        return self._profile_watcher
+
+    # Stop Watching Controller Profile
+    # ------------------------------
+    def stop_watching_profile(self) -> None:
+        """
+        Stop reloading the Controller profile file
+        """
+        if self._profile_watcher is not None:
+            self._profile_watcher.stop()
+            self._profile_watcher = None
+
+    # Get Controller Constants
+    # ------------------------------
+    def _get_const(self) -> CtrlToolbox._GAMEPAD_CONST:
+        """
+        Get the Controller Constants of the Controller type
+        :return GAMEPAD_CONST: Controller Constants (XBOXONE_CONST / PS3_CONST)
+        """
+        return self.PS3_CONST if self.gamepad_type == 'PS3' else self.XBOX_CONST
+
+    # Set Controller Constants
+    # ------------------------------
+    def _set_const(self, const : CtrlToolbox._GAMEPAD_CONST) -> None:
+        """
+        Set the Controller Constants of the Controller type
+        :param const: Controller Constants (XBOXONE_CONST / PS3_CONST)
+        """
+        if self.gamepad_type == 'PS3':
+            self.PS3_CONST = const
+        else:
+            self.XBOX_CONST = const
+
+    # Build Controller Profile
+    # ------------------------------
+    def _build_profile(self, path : str) -> CtrlToolbox._GAMEPAD_CONST:
+        """
+        Build the Controller Constants of a Controller profile file with all Scaling Lookup-Tables
+        :param path: Path of the Controller profile file (str)
+        :return GAMEPAD_CONST: Controller Constants of the profile
+        """
+        if self.gamepad_type not in CtrlToolbox.PROFILE_TYPES:
+            raise TypeError('No Controller profile for Controller type: {}'.format(self.gamepad_type))
+
+        profile = CtrlToolbox.read_profile(path)
+        return CtrlToolbox.compile_scaling(CtrlToolbox.apply_profile(self._base_const, profile))
+
+    # Compile Dispatch-Table
+    # ------------------------------
+    def _compile_dispatch_table(self, const : CtrlToolbox._GAMEPAD_CONST) -> dict:
+        """
+        Compile the Dispatch-Table of the Controller type writing to the Back-Frame
+        :param const: Controller Constants (XBOXONE_CONST / PS3_CONST)
+        :return table: Dispatch-Table (dict)
+        """
+        if self.gamepad_type == 'PS3':
+            table = CtrlToolbox.PS3_dispatch_table(const, self._back_frame.state)
+        else:
+            table = CtrlToolbox.XBOX_dispatch_table(const, self._back_frame.state)
+
+        # Commit the report and publish the Frame at the end of each report,
+        # resynchronize reports with dropped events
+        # (part of the Dispatch-Table, no extra cost per event)
+        EVENTKEY = const.EVENTKEY
+        table[(EVENTKEY.SYNC_EVENT, EVENTKEY.SYNC_REPORT)] = (self._commit_report, 0)
+        table[(EVENTKEY.SYNC_EVENT, EVENTKEY.SYNC_DROPPED)] = (self._drop_report, 0)
+
+        # Backend reporting integer Event-Keys
+        if self.gamepad.int_keys:
+            table = CtrlToolbox.translate_dispatch_table(table)
+
+        return table
+
+    # Swap Profile Dispatch-Table
+    # ------------------------------
+    def _swap_profile_table(self) -> None:
+        """
+        Swap in the Dispatch-Table of a loaded Controller profile
+        (called by the controller-monitor-thread at the end of a report)
+        """
+        with self._profile_lock:
+            table, const = self._pending_table
+            self._pending_table = None
+
+        # Axis subscriptions scale with the profile from the next report on
+        self._dispatch_table = table
+        if self._subscriptions is not None:
+            self._subscriptions.set_scaling(const.JOYSTICK_SCALING, const.TRIGGER_SCALING)
+
+    # Swap Profile Constants
+    # ------------------------------
+    def _swap_profile_const(self) -> None:
+        """
+        Swap in the Controller Constants of a loaded Controller profile
+        and recompute all Controller Classes with the next update
+        (called by update())
+        """
+        with self._profile_lock:
+            const = self._pending_const
+            self._pending_const = None
+
+        # Scaling Constants of all Controller Classes at once
+        self.JoyLeft.ScalingData = const.JOYSTICK_SCALING
+        self.JoyRight.ScalingData = const.JOYSTICK_SCALING
+        self.TrigLeft.ScalingDataConstants = const.TRIGGER_SCALING
+        self.TrigRight.ScalingDataConstants = const.TRIGGER_SCALING
+        self._set_const(const)
+        self._update_version = None
+        self._update_versions = (None,) * CtrlToolbox.COMPONENT_COUNT
+
+    # Configure Callbacks
+    # ------------------------------
+    def configure_callbacks(self,
+                            workers : int = 1,
+                            queue_size : int = 64,
+                            drop_policy : str = CallbackExecutor.DROP_OLDEST) -> None:
+        """
+        Configure the thread pool running Button and Axis callbacks
+        (must be called before the first callback is subscribed)
+        :param workers: Number of worker threads (int)
+        :param queue_size: Maximum number of queued callbacks (int)
+        :param drop_policy: Policy for a full queue, 'drop_newest' or 'drop_oldest' (str)
+        """
+        if self._callback_executor is not None:
+            raise RuntimeError('Callbacks already configured')
+
+        self._callback_executor = CallbackExecutor(workers, queue_size, drop_policy)
+
+    # Get Subscriptions
+    # ------------------------------
+    def _get_subscriptions(self) -> Subscriptions:
+        # Create Callback Executor and Subscriptions on first use
+        if self._subscriptions is None:
+            if self._callback_executor is None:
+                self.configure_callbacks()
+            self._subscriptions = Subscriptions(self._callback_executor, self._frame, self.clock)
+            self._add_listener('_frame_listeners', self._subscriptions)
+
+        return self._subscriptions
+
+    # Get Generic Button name
+    # ------------------------------
+    def _get_button_name(self, button : str) -> str:
+        # Controller specific Button name or Generic Button name
+        name = self._button_names.get(button, button)
+        if name not in CtrlToolbox.GENERIC_BUTTONS:
+            raise ValueError('Unknown Button: {}'.format(button))
+
+        return name
+
+    # Button Press Callback
+    # ------------------------------
+    def on_press(self, button : str, callback):
+        """
+        Call a function when a Button is pressed
+        (called on a worker thread of the Callback Executor)
+        :param button: Button name, Generic (e.g. 'S', 'DPad_L') or Controller specific (e.g. 'A', 'Cross')
+        :param callback: Function called with the Generic Button name
+        :return callback: Subscribed function
+        """
+        self._get_subscriptions().add_button(self._get_button_name(button), True, callback)
+        return callback
+
+    # Button Release Callback
+    # ------------------------------
+    def on_release(self, button : str, callback):
+        """
+        Call a function when a Button is released
+        (called on a worker thread of the Callback Executor)
+        :param button: Button name, Generic (e.g. 'S', 'DPad_L') or Controller specific (e.g. 'A', 'Cross')
+        :param callback: Function called with the Generic Button name
+        :return callback: Subscribed function
+        """
+        self._get_subscriptions().add_button(self._get_button_name(button), False, callback)
+        return callback
+
+    # Axis Change Callback
+    # ------------------------------
+    def on_axis_change(self, axis : str, callback, threshold : float = 1.0):
+        """
+        Call a function when the scaled value of an Axis changed by at least the threshold
+        (called on a worker thread of the Callback Executor,
+         filtered values keep settling after the last event while update() is called)
+        :param axis: Generic Axis name ('JoyL_X', 'JoyL_Y', 'JoyR_X', 'JoyR_Y', 'Trig_L', 'Trig_R')
+        :param callback: Function called with the Axis name and scaled value
+        :param threshold: Minimum change of the scaled value since the last call (float)
+        :return callback: Subscribed function
+        """
+        # Scaling Constants and Filter stages of the Axis
+        # (same Deadzone, Response Curve and Axis Filters as the Controller Class)
+        const = self._get_const()
+        axis_scaling = {'JoyL_X' : (self.JoyLeft.ScalingData, const.JOYSTICK_FILTER),
+                        'JoyL_Y' : (self.JoyLeft.ScalingData, const.JOYSTICK_FILTER),
+                        'JoyR_X' : (self.JoyRight.ScalingData, const.JOYSTICK_FILTER),
+                        'JoyR_Y' : (self.JoyRight.ScalingData, const.JOYSTICK_FILTER),
+                        'Trig_L' : (self.TrigLeft.ScalingDataConstants, const.TRIGGER_FILTER),
+                        'Trig_R' : (self.TrigRight.ScalingDataConstants, const.TRIGGER_FILTER)}
+        if axis not in axis_scaling:
+            raise ValueError('Unknown Axis: {}'.format(axis))
+
+        scaling, filter_stages = axis_scaling[axis]
+        self._get_subscriptions().add_axis(axis, callback, threshold, scaling, filter_stages)
+        return callback
+
+    # Remove Callback
+    # ------------------------------
+    def remove_callback(self, callback) -> None:
+        """
+        Remove all Button and Axis subscriptions of a callback
+        :param callback: Subscribed function
+        """
+        if self._subscriptions is not None:
+            self._subscriptions.remove(callback)
+
+    # Compare Frames
+    # ------------------------------
+    @staticmethod
+    def _frame_changed(frame, latest, components : int) -> bool:
+        """
+        Check if the given Controller Components changed between two Frames
+        :param frame: Previous Frame (CtrlToolbox.ControllerFrame)
+        :param latest: Latest Frame (CtrlToolbox.ControllerFrame)
+        :param components: Controller Component flags (CtrlToolbox.COMPONENT_*)
+        :return changed: Components changed (bool)
+        """
+        for index in range(CtrlToolbox.COMPONENT_COUNT):
+            if components & (1 << index) and frame.versions[index] != latest.versions[index]:
+                return True
+        return False
+
     # Update Controller values
     # ------------------------------
-    def update(self):
+    def update(self) -> bool:
+        """
+        Update the Controller Classes from the latest published Controller Frame
+        (only Controller Classes changed since the previous update are recomputed)
+        :return changed: Controller Data changed since the previous update (bool)
+        """
 
-        # Joystick Update
-        self.JoyLeft.update()
-        self.JoyRight.update()
+        # Scaling Constants of a loaded Controller profile
+        if self._pending_const is not None:
+            self._swap_profile_const()
 
-        # Trigger Update
-        self.TrigLeft.update()
-        self.TrigRight.update()
+        # Axis Filters of the Axis callbacks still settling
+        # (no Frames are published while the input is unchanged)
+        if self._subscriptions is not None:
+            self._subscriptions.settle()
 
-        # Button update
-        self.DPad.update()
-        self.Button.update()
-        
-    # XBOX Controller Monitor
-    # ------------------------------    
-    def _XBOX_ControllerMonitor(self):
-        
-        # While-Loop for detecting controller inputs
-        while(True):
-            
-            # Get Controller Action from reading Gamepad object
-            events = self.gamepad.read()
+        # Get latest published Frame
+        # (single reference read, the Frame is complete and consistent)
+        frame = self._frame
+
+        # No change since previous update
+        if frame.version == self._update_version:
+
+            # Reset pressed latches of the previous update
+            if self._update_latched:
+                self._clear_latched(0)
+
+            # Axis Filters still settling after the last change
+            if self._filtered:
+                return self._update_filtered(frame.versions)
+
+            return False
+
+        # Button press/release counts since the previous update
+        # (taken from the same Frame, so no edge is lost or counted twice)
+        self._update_edges(frame)
+
+        # Copy the Frame State to the Controller State read by the Controller Classes
+        # and the Generic Data (single memcpy)
+        self._update_state[:] = frame.state
+
+        # Update the changed Controller Classes
+        # (Joystick, Trigger, D-Pad and Button updates)
+        versions = frame.versions
+        update_versions = self._update_versions
+        for index, component in enumerate(self._components):
+            if versions[index] != update_versions[index]:
+                component.update()
+
+        # Axis Filters of unchanged Controller Classes still settling
+        if self._filtered:
+            self._update_filtered(versions)
+
+        # Store consumed Frame versions
+        self._update_version = frame.version
+        self._update_versions = versions
+
+        return True
+
+    # Update settling Axis Filters
+    # ------------------------------
+    def _update_filtered(self, versions : tuple) -> bool:
+        """
+        Update the unchanged Controller Classes whose Axis Filters have not settled yet
+        (time-based filters move towards the input without new events)
+        :param versions: Component versions of the consumed Frame (tuple)
+        :return changed: Any Controller Class updated (bool)
+        """
+        changed = False
+        update_versions = self._update_versions
+        for index, component in self._filtered:
+            if versions[index] == update_versions[index] and not component.settled:
+                component.update()
+                changed = True
+
+        return changed
+
+    # Update Button Edges
+    # ------------------------------
+    def _update_edges(self, frame : CtrlToolbox.ControllerFrame) -> None:
+        """
+        Assign the Button press/release counts since the previous update to the Controller Classes
+        (only Controller Classes with Button edges are updated, counts and latches are updated in place)
+        :param frame: Controller Frame consumed by update() (CtrlToolbox.ControllerFrame)
+        """
+        presses = frame.presses
+        releases = frame.releases
+        previous_presses = self._update_presses
+        previous_releases = self._update_releases
+
+        # No edges since the previous update
+        if presses is previous_presses and releases is previous_releases:
+            if self._update_latched:
+                self._clear_latched(0)
+            return
+
+        # Button bits with edges since the previous update
+        edges = 0
+        for name, mask in CtrlToolbox.BUTTON_MASKS.items():
+            if presses[name] != previous_presses[name] or releases[name] != previous_releases[name]:
+                edges |= mask
+
+        # Assign to the Controller Classes with edges,
+        # reset the latches of the previous update of the other Controller Classes
+        latched = 0
+        for index, component in enumerate(self._components):
+            if component.buttonMask & edges:
+                component.update_edges(presses, releases, previous_presses, previous_releases)
+                latched |= 1 << index
+        self._clear_latched(latched)
+        self._update_latched = latched
+
+        # Store consumed counts
+        self._update_presses = presses
+        self._update_releases = releases
+
+    # Clear Button Latches
+    # ------------------------------
+    def _clear_latched(self, keep : int) -> None:
+        """
+        Reset the Button counts and latches of the Controller Classes latched by the previous update
+        :param keep: Controller Component flags of the Controller Classes not to reset (int)
+        """
+        latched = self._update_latched & ~keep
+        if latched:
+            for index, component in enumerate(self._components):
+                if latched & (1 << index):
+                    component.clear_edges()
+        self._update_latched &= keep
+
+    # Commit Report
+    # ------------------------------
+    def _commit_report(self, state : int = 0) -> None:
+        """
+        Write the coalesced input events of the report to the Back-Frame
+        and publish it as the latest Controller Frame
+        (called by the controller-monitor-thread on the Synchronization Event ending the report)
+        :param state: Event state of the Synchronization Event (unused)
+        """
+        report = self._report
+
+        # Events dropped by the device during the report
+        # (the report is incomplete and no event is repeated for unchanged values)
+        if self._report_dropped:
+            self._report_dropped = False
+            self._resync_report(report)
+
+        # Write the last event state per Dispatch-Table entry
+        # (writes without change do not mark Controller Components)
+        dirty = self._dirty
+        for entry, value in report.items():
+            if entry[0](value):
+                dirty |= entry[1]
+        report.clear()
+        self._dirty = dirty
+
+        self._publish_frame()
+
+        # Dispatch-Table of a loaded Controller profile
+        # (swapped between reports, the next report uses the new table)
+        if self._pending_table is not None:
+            self._swap_profile_table()
+
+    # Drop Report
+    # ------------------------------
+    def _drop_report(self, state : int = 0) -> None:
+        """
+        Mark the current report as incomplete, resynchronized at the next end of report
+        (called by the controller-monitor-thread on the SYN_DROPPED Synchronization Event)
+        :param state: Event state of the Synchronization Event (unused)
+        """
+        self._report_dropped = True
+
+    # Resynchronize Report
+    # ------------------------------
+    def _resync_report(self, report : dict) -> None:
+        """
+        Replace the events of an incomplete report by the current device state
+        (Backends without access to the device state keep the partial report, applied as received)
+        :param report: Coalesced input events of the report (dict)
+        """
+        resync = getattr(self.gamepad, 'resync', None)
+        if resync is None:
+            return
+
+        # Current state of every input event of the Dispatch-Table
+        dispatch_table = self._dispatch_table
+        events = resync([key for key, entry in dispatch_table.items() if entry[1]])
+        if events is None:
+            return
+
+        report.clear()
+        for event in events:
+            entry = dispatch_table.get((event[0], event[1]))
+            if entry is not None:
+                report[entry] = event[2]
+
+    # Publish Controller Frame
+    # ------------------------------
+    def _publish_frame(self) -> None:
+        """
+        Publish a copy of the Back-Frame as the latest Controller Frame
+        (called by the controller-monitor-thread at the end of each report)
+        """
+
+        # Nothing changed since the previous Frame
+        dirty = self._dirty
+        if not dirty:
+            return
+        self._dirty = 0
+
+        # Copy changed Back-Frame members and swap the published Frame reference
+        self._frame_version += 1
+        self._frame = self._back_frame.copy_changed(self._frame, self._frame_version, dirty)
+
+        # Wake threads waiting for a change
+        if self._frame_waiters:
+            with self._frame_condition:
+                self._frame_condition.notify_all()
+
+        # Call Frame listeners
+        # (a failing listener does not stop the controller-monitor-thread or the other listeners)
+        for listener in self._frame_listeners:
+            try:
+                listener(self._frame)
+            except Exception as error:
+                # Print Error
+                print('ERROR: Controller: Frame listener {}: {}'.format(listener, error))
+
+    # Process Controller Events
+    # ------------------------------
+    def _process_events(self, events) -> None:
+        """
+        Collect incomming events of the current report through the Dispatch-Table
+        Input events are coalesced to the last event state per Dispatch-Table entry,
+        Synchronization events commit (or drop) the report
+        (called by the controller-monitor-thread)
+        :param events: Input events (ev_type, code, state) from the Backend
+        """
+
+        # Use local references to the compiled Dispatch-Table and the current report
+        dispatch_table = self._dispatch_table
+        report = self._report
+
+        # Loop through all event in events
+        for event in events:
+
+            # Call Event listeners
+            # (a failing listener does not stop the controller-monitor-thread or the other listeners)
+            if self._event_listeners:
+                for listener in self._event_listeners:
+                    try:
+                        listener(event)
+                    except Exception as error:
+                        # Print Error
+                        print('ERROR: Controller: Event listener {}: {}'.format(listener, error))
+
+            # Lookup incomming Axis- or Button-Input
+            # (single dictionary lookup per event)
+            entry = dispatch_table.get((event[0], event[1]))
+            if entry is not None:
+
+                # Input event: keep the last event state of the report
+                if entry[1]:
+                    report[entry] = event[2]
+
+                # Synchronization event: commit or drop the report
+                # (the Dispatch-Table may be swapped at the end of the report)
+                else:
+                    entry[0](event[2])
+                    dispatch_table = self._dispatch_table
+
+    # Controller Monitor
+    # ------------------------------
+    def _ControllerMonitor(self):
 
-            # Loop through all event in events
-            for event in events:
-                
-                # Axis Event
-                # Get incomming Axis-Input from Controller (integer values)
-                CtrlToolbox.XBOX_event_Axis(event,
-                                        self.XBOX_CONST,
-                                        self.JoyLeft.joystickData,
-                                        self.JoyRight.joystickData,
-                                        self.TrigLeft.triggerData,
-                                        self.TrigRight.triggerData,
-                                        self.GenericAxis)
-
-                # Button Event
-                # Get incomming Button-Input from Controller (bool values)
-                CtrlToolbox.XBOX_event_Button(event,
-                                          self.XBOX_CONST,
-                                          self.JoyLeft.joystickData,
-                                          self.JoyRight.joystickData,
-                                          self.TrigLeft.triggerData,
-                                          self.TrigRight.triggerData,
-                                          self.DPad.dPadData,
-                                          self.Button.xboxButtonData,
-                                          self.GenericButton)
-
-    # Playstation 3 Controller Monitor
-    # ------------------------------    
-    def _PS3_ControllerMonitor(self):
-        
         # While-Loop for detecting controller inputs
         while True:
-            
-            # Get Controller Action
+
+            # Get Controller Action from reading the Backend
             events = self.gamepad.read()
 
-            # Loop through all event in events
-            for event in events:
-
-                # Axis Event
-                # Get incomming Axis-Input from Controller (integer values)
-                CtrlToolbox.PS3_event_Axis(event,
-                                       self.PS3_CONST,
-                                       self.JoyLeft.joystickData,
-                                       self.JoyRight.joystickData,
-                                       self.TrigLeft.triggerData,
-                                       self.TrigRight.triggerData,
-                                       self.GenericAxis)
-
-                # Button Event
-                # Get incomming Button-Input from Controller (bool values)
-                CtrlToolbox.PS3_event_Button(event,
-                                         self.PS3_CONST,
-                                         self.JoyLeft.joystickData,
-                                         self.JoyRight.joystickData,
-                                         self.TrigLeft.triggerData,
-                                         self.TrigRight.triggerData,
-                                         self.DPad.dPadData,
-                                         self.Button.psButtonData,
-                                         self.GenericButton)
+            # Process events
+            self._process_events(events)
+
+# Controller Group Class
+# ------------------------------
+class ControllerGroup():
+    """
+    Controller Group Class:
+    Open every connected gamepad Controller and read all of them
+    from a single thread multiplexing the gamepad devices with a selector
+    (requires backends with a readable device, as on Linux)
+    :param gamepads: Backends or gamepad objects of the inputs package (None: all connected gamepads)
+    :param device_cache: Device Cache or path of the Device Cache file for the Device Profiles
+                         (lib.device.DeviceCache / str, None: no cache)
+    """
+
+    # Class constructor
+    # ------------------------------
+    def __init__(self, gamepads : list = None, device_cache = None):
+
+        # Search for connected controllers
+        # (using Backend function)
+        if gamepads is None:
+            gamepads = get_backends()
+
+        # Device Cache shared by all Controllers
+        if isinstance(device_cache, str):
+            device_cache = DeviceCache(device_cache)
+
+        # Define Controllers and register their character devices
+        self.controllers = []
+        self._selector = selectors.DefaultSelector()
+        for gamepad in gamepads:
+
+            # Skip unknown Controllers
+            try:
+                controller = Controller(gamepad, monitor=False, device_cache=device_cache)
+            except TypeError as error:
+                # Print Error
+                print('ERROR: ControllerGroup: {}: {}'.format(gamepad, error))
+                continue
+
+            # Register device of the Backend
+            self._selector.register(controller.gamepad.fileno(), selectors.EVENT_READ, controller)
+            self.controllers.append(controller)
+
+        # Controller Group Initialized
+        self.init = len(self.controllers) > 0
+
+        # Initialize Group Monitor on a designated thread
+        # ------------------------------
+        # Configure thread
+        self._monitor_thread = threading.Thread(target=self._GroupMonitor, args=())
+        self._monitor_thread.daemon = True
+
+        # Start Group-Monitor
+        self._monitor_thread.start()
+
+    # Get Controller Frames
+    # ------------------------------
+    def get_frames(self) -> tuple:
+        """
+        Get the latest published Controller Frame of every Controller
+        (never blocks on the group-monitor-thread)
+        :return frames: Controller Frames in order of Controllers (tuple)
+        """
+        return tuple(controller.get_frame() for controller in self.controllers)
+
+    # Update Controller values
+    # ------------------------------
+    def update(self) -> bool:
+        """
+        Update all Controllers from their latest published Controller Frames
+        :return changed: Controller Data of any Controller changed since the previous update (bool)
+        """
+        changed = False
+        for controller in self.controllers:
+            changed |= controller.update()
+
+        return changed
+
+    # Group Monitor
+    # ------------------------------
+    def _GroupMonitor(self):
+
+        # While-Loop for detecting controller inputs of all Controllers
+        while self._selector.get_map():
+
+            # Wait for any readable character device
+            for key, _ in self._selector.select():
+                controller = key.data
+
+                # Read all pending events
+                try:
+                    events = controller.gamepad.read_available()
+
+                # Controller disconnected
+                except OSError as error:
+                    # Print Error
+                    print('ERROR: ControllerGroup: {}: {}'.format(controller.gamepad, error))
+                    self._selector.unregister(key.fd)
+                    controller.gamepad.close()
+                    continue
+
+                # Process events
+                controller._process_events(events)
 
 # Main Function
 # ------------------------------   
@@ -197,7 +1152,11 @@ if __name__ == '__main__':
     xboxController = Controller()
 
     while xboxController.init:
-        
+
+        # Wait for controller input
+        if not xboxController.wait_for_change(timeout=1.0):
+            continue
+
         xboxController.update()
 
         print('Xbox Controller:')
@@ -211,6 +1170,4 @@ if __name__ == '__main__':
         print(xboxController.Button.get_buttons())
         print('\n')
 
-        time.sleep(0.100)
-
         
\ No newline at end of file
@@ -6,6 +6,56 @@
 
 # Version
 # ------------------------------
+# 0.26  -   8BitDo Device Profile limited to the X-input product IDs
+#           [18.10.2026] - Jan T. Olsen
+# 0.25  -   Scaling values of Controller profiles checked before use
+#           [18.10.2026] - Jan T. Olsen
+# 0.24  -   Size guard of the raw-indexed Lookup-Tables on the allocated list size
+#           [18.10.2026] - Jan T. Olsen
+# 0.23  -   Documented D-Pad hat difference of the XBOX Dispatch-Table to the event functions
+#           [18.10.2026] - Jan T. Olsen
+# 0.22  -   Packed Button bits of the Controller State Views
+#           [18.10.2026] - Jan T. Olsen
+# 0.21  -   Generic Axis scaling and batch scaling with the radial Deadzone of the Joystick
+#           [18.10.2026] - Jan T. Olsen
+# 0.20  -   Joystick Deadband centered on the middle of unsigned raw ranges
+#           [18.10.2026] - Jan T. Olsen
+# 0.19  -   Button edges of the Controller Classes updated in place
+#           [18.10.2026] - Jan T. Olsen
+# 0.18  -   Device Profile registry keyed by USB vendor/product ID with name-based fallback
+#           [18.10.2026] - Jan T. Olsen
+# 0.17  -   Controller profiles loaded from JSON files
+#           [18.10.2026] - Jan T. Olsen
+# 0.16  -   Radial Deadzone and Response Curves of the Joystick Scaling Constants
+#           [18.10.2026] - Jan T. Olsen
+# 0.15  -   Axis Filter stages per Controller Constants profile
+#           [18.10.2026] - Jan T. Olsen
+# 0.14  -   Dispatch-Table setters report changes, SYN_DROPPED Event-Key
+#           [18.10.2026] - Jan T. Olsen
+# 0.13  -   Packed Button bitmask helpers and Button edges per Frame
+#           [18.10.2026] - Jan T. Olsen
+# 0.12  -   Array-backed Controller State with Data classes as views
+#           [18.10.2026] - Jan T. Olsen
+# 0.11  -   Read States and Lookup-Tables indexed by raw value
+#           [18.10.2026] - Jan T. Olsen
+# 0.10  -   Bulk decoding of input event records
+#           [18.10.2026] - Jan T. Olsen
+# 0.9   -   Integer Event-Keys, inputs package made optional
+#           [18.10.2026] - Jan T. Olsen
+# 0.8   -   Get all connected controllers and input event record layout
+#           [18.10.2026] - Jan T. Olsen
+# 0.7   -   Button press/release counts in Controller Frame
+#           [18.10.2026] - Jan T. Olsen
+# 0.6   -   Controller Component flags in Dispatch-Table and Frame versions
+#           [18.10.2026] - Jan T. Olsen
+# 0.5   -   Controller Frame for consistent snapshots of Controller Data
+#           [18.10.2026] - Jan T. Olsen
+# 0.4   -   NumPy batch scaling of raw-input arrays
+#           [18.10.2026] - Jan T. Olsen
+# 0.3   -   Lookup-Table scaling for Joystick and Trigger values
+#           [18.10.2026] - Jan T. Olsen
+# 0.2   -   Compiled Dispatch-Table for event routing
+#           [18.10.2026] - Jan T. Olsen
 # 0.1   -   Redesign constants dataclasses.
 #           Now divided into multiple and nested dataclasses
 #           [24.06.2022] - Jan T. Olsen
@@ -13,107 +63,643 @@
 #           [20.06.2022] - Jan T. Olsen
 
 # Import packages
-from dataclasses import dataclass, field
-from inputs import devices
+import json
+import math
+import struct
+from array import array
+from dataclasses import dataclass, field, fields
+
+# Import optional packages
+# (the inputs package is used as fallback backend, see lib/backend.py)
+try:
+    from inputs import devices
+except ImportError:
+    devices = None
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Controller State
+# ------------------------------
+# All Controller Data is held in one contiguous array of 32-bit integers:
+# the raw value of each Generic Axis, followed by one word of packed Button bits.
+# The Data classes below are lightweight views reading and writing this array,
+# so each event is written once and a whole-state copy is a single memcpy
+
+# Generic Axis names
+# (in order of the Controller State)
+GENERIC_AXES = ('JoyL_X',   # Joystick Left - Axis X
+                'JoyL_Y',   # Joystick Left - Axis Y
+                'JoyR_X',   # Joystick Right - Axis X
+                'JoyR_Y',   # Joystick Right - Axis Y
+                'Trig_L',   # Trigger Left - Axis
+                'Trig_R')   # Trigger Right - Axis
+
+# Generic Button names
+# (in order of the Button bits)
+GENERIC_BUTTONS = ('S',         # Button - South
+                   'E',         # Button - East
+                   'W',         # Button - West
+                   'N',         # Button - North
+                   'Start',     # Button - Start
+                   'Select',    # Button - Select
+                   'PB_L',      # Joystick Left - Pushbutton
+                   'PB_R',      # Joystick Right - Pushbutton
+                   'DPad_L',    # D-Pad - Left
+                   'DPad_R',    # D-Pad - Right
+                   'DPad_U',    # D-Pad - Up
+                   'DPad_D',    # D-Pad - Down
+                   'LB1',       # Button - Left-Back Bumper No. 1
+                   'RB1',       # Button - Right-Back Bumper No. 1
+                   'LB2',       # Button - Left-Back Bumper No. 2
+                   'RB2')       # Button - Right-Back Bumper No. 2
+
+# Controller State layout
+STATE_AXES = {name : index for index, name in enumerate(GENERIC_AXES)}          # Generic Axis name -> State index
+STATE_BUTTONS = len(GENERIC_AXES)                                               # State index of the Button bits
+STATE_SIZE = STATE_BUTTONS + 1                                                  # Number of State values
+BUTTON_MASKS = {name : 1 << index for index, name in enumerate(GENERIC_BUTTONS)}# Generic Button name -> Button bit
+
+# Button bits
+# (bit position equals the position in GENERIC_BUTTONS)
+BUTTON_S        = 1 << 0    # Button - South
+BUTTON_E        = 1 << 1    # Button - East
+BUTTON_W        = 1 << 2    # Button - West
+BUTTON_N        = 1 << 3    # Button - North
+BUTTON_START    = 1 << 4    # Button - Start
+BUTTON_SELECT   = 1 << 5    # Button - Select
+BUTTON_PB_L     = 1 << 6    # Joystick Left - Pushbutton
+BUTTON_PB_R     = 1 << 7    # Joystick Right - Pushbutton
+BUTTON_DPAD_L   = 1 << 8    # D-Pad - Left
+BUTTON_DPAD_R   = 1 << 9    # D-Pad - Right
+BUTTON_DPAD_U   = 1 << 10   # D-Pad - Up
+BUTTON_DPAD_D   = 1 << 11   # D-Pad - Down
+BUTTON_LB1      = 1 << 12   # Button - Left-Back Bumper No. 1
+BUTTON_RB1      = 1 << 13   # Button - Right-Back Bumper No. 1
+BUTTON_LB2      = 1 << 14   # Button - Left-Back Bumper No. 2
+BUTTON_RB2      = 1 << 15   # Button - Right-Back Bumper No. 2
+BUTTON_ALL      = (1 << 16) - 1
+
+# Button Bitmask
+# ------------------------------
+# Helpers working on the packed Button bits of a Controller State
+# (e.g. ControllerFrame.buttons), so chords, logging and encoding use a single int
+def buttons_pressed(new : int, old : int) -> int:
+    """
+    Buttons pressed between two Button bitmasks
+    :param new: New Button bits (int)
+    :param old: Old Button bits (int)
+    :return pressed: Button bits set in new but not in old (int)
+    """
+    return new & ~old
+
+def buttons_released(new : int, old : int) -> int:
+    """
+    Buttons released between two Button bitmasks
+    :param new: New Button bits (int)
+    :param old: Old Button bits (int)
+    :return released: Button bits set in old but not in new (int)
+    """
+    return old & ~new
+
+def button_mask(*names : str) -> int:
+    """
+    Button bitmask of Generic Button names (e.g. for chords)
+    :param names: Generic Button names
+    :return mask: Button bits (int)
+    """
+    mask = 0
+    for name in names:
+        if name not in BUTTON_MASKS:
+            raise ValueError('Unknown Button: {}'.format(name))
+        mask |= BUTTON_MASKS[name]
+
+    return mask
 
-# Dataclass - Axis 
+def button_names(buttons : int) -> tuple:
+    """
+    Generic Button names of a Button bitmask (e.g. for logging)
+    :param buttons: Button bits (int)
+    :return names: Generic Button names in order of GENERIC_BUTTONS (tuple)
+    """
+    return tuple(name for name, mask in BUTTON_MASKS.items() if buttons & mask)
+
+def get_button(buttons : int, name : str) -> bool:
+    """
+    State of one Button in a Button bitmask
+    :param buttons: Button bits (int)
+    :param name: Generic Button name
+    :return pressed: Button pressed (bool)
+    """
+    return bool(buttons & BUTTON_MASKS[name])
+
+def is_chord(buttons : int, mask : int) -> bool:
+    """
+    Check if all Buttons of a chord are pressed
+    :param buttons: Button bits (int)
+    :param mask: Button bits of the chord (int, see button_mask())
+    :return pressed: All Buttons of the chord pressed (bool)
+    """
+    return buttons & mask == mask
+
+# New Controller State
 # ------------------------------
-# Member related to Controller Axis
-@dataclass()
-class GenericAxisData:
-    
-    # Declare Axis members
-    JoyL_X : float = 0.0    # Joystick Left - Axis X
-    JoyL_Y : float = 0.0    # Joystick Left - Axis Y
-    JoyR_X : float = 0.0    # Joystick Right - Axis X
-    JoyR_Y : float = 0.0    # Joystick Right - Axis Y
-    Trig_L : float = 0.0    # Trigger Left - Axis
-    Trig_R : float = 0.0    # Trigger Left - Axis
+def new_state() -> array:
+    """
+    Create a zeroed Controller State
+    :return state: Controller State (array of 32-bit integers)
+    """
+    return array('i', bytes(STATE_SIZE * 4))
 
-# Dataclass - Buttons 
+# Controller State Views
 # ------------------------------
-# Members related to Controller Buttons
-@dataclass()
-class GenericButtonData:
-    
+def _axis_member(position : int) -> property:
+    # View member reading and writing an Axis value of the Controller State
+    # (position in the State indices of the view)
+    def get(view):
+        return view._state[view._index[position]]
+    def set(view, value):
+        view._state[view._index[position]] = value
+    return property(get, set)
+
+def _button_member(position : int) -> property:
+    # View member reading and writing a Button bit of the Controller State
+    # (position in the Button masks of the view)
+    def get(view):
+        return 1 if view._state[STATE_BUTTONS] & view._index[position] else 0
+    def set(view, value):
+        if value:
+            view._state[STATE_BUTTONS] |= view._index[position]
+        else:
+            view._state[STATE_BUTTONS] &= ~view._index[position]
+    return property(get, set)
+
+class _STATE_VIEW:
+    """
+    Controller State View
+    Base for the Data classes, reading and writing their members in a Controller State
+    :param state: Controller State (None: new Controller State)
+    :param side: Side of the Controller Component ('L' / 'R', None: Component without sides)
+    """
+    __slots__ = ('_state', '_index')
+
+    # View members (in order of the State indices / Button masks in _LAYOUT)
+    _MEMBERS = ()
+    # State indices or Button masks of the members per side
+    _LAYOUT = {}
+
+    # Class Constructor
+    def __init__(self, state : array = None, side : str = None) -> None:
+        self._state = new_state() if state is None else state
+        self._index = self._LAYOUT[side]
+
+    # Packed Button bits
+    # (read once per update of a Controller Class, instead of once per Button member)
+    @property
+    def buttons(self) -> int:
+        return self._state[STATE_BUTTONS]
+
+    # Representation
+    def __repr__(self) -> str:
+        return '{}({})'.format(type(self).__name__,
+                               ', '.join('{}={!r}'.format(name, getattr(self, name)) for name in self._MEMBERS))
+
+    # Compare members
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self._MEMBERS)
+
+    __hash__ = None
+
+# Data - Axis
+# ------------------------------
+# View of all Controller Axis
+class GenericAxisData(_STATE_VIEW):
+    __slots__ = ()
+    _MEMBERS = GENERIC_AXES
+    _LAYOUT = {None : tuple(range(len(GENERIC_AXES)))}
+
+    # Declare Axis members
+    JoyL_X = _axis_member(0)    # Joystick Left - Axis X
+    JoyL_Y = _axis_member(1)    # Joystick Left - Axis Y
+    JoyR_X = _axis_member(2)    # Joystick Right - Axis X
+    JoyR_Y = _axis_member(3)    # Joystick Right - Axis Y
+    Trig_L = _axis_member(4)    # Trigger Left - Axis
+    Trig_R = _axis_member(5)    # Trigger Right - Axis
+
+# Data - Buttons
+# ------------------------------
+# View of all Controller Buttons
+class GenericButtonData(_STATE_VIEW):
+    __slots__ = ()
+    _MEMBERS = GENERIC_BUTTONS
+    _LAYOUT = {None : tuple(BUTTON_MASKS[name] for name in GENERIC_BUTTONS)}
+
     # Declare Button members
-    S : bool = False        # Button - South
-    E : bool = False        # Button - East
-    W : bool = False        # Button - West
-    N : bool = False        # Button - North
-    
-    Start   : bool = False  # Button - Start
-    Select  : bool = False  # Button - Select
+    S = _button_member(0)       # Button - South
+    E = _button_member(1)       # Button - East
+    W = _button_member(2)       # Button - West
+    N = _button_member(3)       # Button - North
 
-    PB_L : bool = False     # Joystick Left - Pushbutton
-    PB_R : bool = False     # Joystick Right - Pushbutton
+    Start = _button_member(4)   # Button - Start
+    Select = _button_member(5)  # Button - Select
 
-    DPad_L : bool = False   # D-Pad - Left
-    DPad_R : bool = False   # D-Pad - Right
-    DPad_U : bool = False   # D-Pad - Up
-    DPad_D : bool = False   # D-Pad - Down
+    PB_L = _button_member(6)    # Joystick Left - Pushbutton
+    PB_R = _button_member(7)    # Joystick Right - Pushbutton
 
-    LB1: bool = False       # Button - Left-Back Bumper No. 1
-    RB1: bool = False       # Button - Right-Back Bumper No. 1
-    LB2: bool = False       # Button - Left-Back Bumper No. 2
-    RB2: bool = False       # Button - Right-Back Bumper No. 2
+    DPad_L = _button_member(8)  # D-Pad - Left
+    DPad_R = _button_member(9)  # D-Pad - Right
+    DPad_U = _button_member(10) # D-Pad - Up
+    DPad_D = _button_member(11) # D-Pad - Down
 
-# Dataclass - Joystick Data
-# ------------------------------
-# Member to hold Controller Input
-@dataclass()
-class JoystickData:
-    # Define Joystick Data members
-    X   : int = 0       # Joystick - X-Axis
-    Y   : int = 0       # Joystick - Y-Axis
-    PB  : bool = False  # Joystick - Pushbutton
+    LB1 = _button_member(12)    # Button - Left-Back Bumper No. 1
+    RB1 = _button_member(13)    # Button - Right-Back Bumper No. 1
+    LB2 = _button_member(14)    # Button - Left-Back Bumper No. 2
+    RB2 = _button_member(15)    # Button - Right-Back Bumper No. 2
 
-# Dataclass - Directional-Pad Data
+# Data - Joystick Data
 # ------------------------------
-# Member to hold Controller Input
-@dataclass()
-class DPadData:
+# View of one Joystick
+class JoystickData(_STATE_VIEW):
+    __slots__ = ()
+    _MEMBERS = ('X', 'Y', 'PB')
+    _LAYOUT = {'L' : (STATE_AXES['JoyL_X'], STATE_AXES['JoyL_Y'], BUTTON_MASKS['PB_L']),
+               'R' : (STATE_AXES['JoyR_X'], STATE_AXES['JoyR_Y'], BUTTON_MASKS['PB_R'])}
+
+    # Class Constructor
+    def __init__(self, state : array = None, side : str = 'L') -> None:
+        super().__init__(state, side)
+
     # Define Joystick Data members
-    L  : bool = 0   # D-Pad - Left
-    R  : bool = 0   # D-Pad - Right
-    U  : bool = 0   # D-Pad - Up
-    D  : bool = 0   # D-Pad - Down
+    X   = _axis_member(0)   # Joystick - X-Axis
+    Y   = _axis_member(1)   # Joystick - Y-Axis
+    PB  = _button_member(2) # Joystick - Pushbutton
 
-# Dataclass - Trigger Data
+# Data - Directional-Pad Data
 # ------------------------------
-# Member to hold Controller Input
-@dataclass()
-class TriggerData:
+# View of the D-Pad
+class DPadData(_STATE_VIEW):
+    __slots__ = ()
+    _MEMBERS = ('L', 'R', 'U', 'D')
+    _LAYOUT = {None : (BUTTON_MASKS['DPad_L'], BUTTON_MASKS['DPad_R'], BUTTON_MASKS['DPad_U'], BUTTON_MASKS['DPad_D'])}
+
+    # Define D-Pad Data members
+    L  = _button_member(0)  # D-Pad - Left
+    R  = _button_member(1)  # D-Pad - Right
+    U  = _button_member(2)  # D-Pad - Up
+    D  = _button_member(3)  # D-Pad - Down
+
+# Data - Trigger Data
+# ------------------------------
+# View of one Trigger
+class TriggerData(_STATE_VIEW):
+    __slots__ = ()
+    _MEMBERS = ('VAL', 'B1', 'B2')
+    _LAYOUT = {'L' : (STATE_AXES['Trig_L'], BUTTON_MASKS['LB1'], BUTTON_MASKS['LB2']),
+               'R' : (STATE_AXES['Trig_R'], BUTTON_MASKS['RB1'], BUTTON_MASKS['RB2'])}
+
+    # Class Constructor
+    def __init__(self, state : array = None, side : str = 'L') -> None:
+        super().__init__(state, side)
+
     # Define Trigger Data members
-    VAL : int = 0   # Trigger - Value
-    B1  : bool = False  # Back Bumper No. 1
-    B2  : bool = False  # Back Bumper No. 2
+    VAL = _axis_member(0)   # Trigger - Value
+    B1  = _button_member(1) # Back Bumper No. 1
+    B2  = _button_member(2) # Back Bumper No. 2
 
-# Dataclass - Button Data (XBOX)
+# Data - Button Data (XBOX)
 # ------------------------------
-# Member to hold Controller Input
-@dataclass()
-class XBOX_ButtonData:
+# View of the XBOX Buttons
+class XBOX_ButtonData(_STATE_VIEW):
+    __slots__ = ()
+    _MEMBERS = ('A', 'B', 'X', 'Y', 'Start', 'Select')
+    _LAYOUT = {None : tuple(BUTTON_MASKS[name] for name in ('S', 'E', 'W', 'N', 'Start', 'Select'))}
+
     # Define Button Data members
-    A       : bool = 0  # Button - A
-    B       : bool = 0  # Button - B
-    X       : bool = 0  # Button - X
-    Y       : bool = 0  # Button - Y
-    Start   : bool = 0  # Button - Start
-    Select  : bool = 0  # Button - Select
+    A       = _button_member(0) # Button - A
+    B       = _button_member(1) # Button - B
+    X       = _button_member(2) # Button - X
+    Y       = _button_member(3) # Button - Y
+    Start   = _button_member(4) # Button - Start
+    Select  = _button_member(5) # Button - Select
+
+# Data - Button Data (PS)
+# ------------------------------
+# View of the Playstation Buttons
+class PS_ButtonData(_STATE_VIEW):
+    __slots__ = ()
+    _MEMBERS = ('Cross', 'Circle', 'Triangle', 'Square', 'Start', 'Select')
+    _LAYOUT = {None : tuple(BUTTON_MASKS[name] for name in ('S', 'E', 'N', 'W', 'Start', 'Select'))}
+
+    # Define Button Data members
+    Cross       = _button_member(0) # Button - Cross
+    Circle      = _button_member(1) # Button - Circle
+    Triangle    = _button_member(2) # Button - Triangle
+    Square      = _button_member(3) # Button - Square
+    Start       = _button_member(4) # Button - Start
+    Select      = _button_member(5) # Button - Select
+
+# Read States
+# ------------------------------
+# Preallocated read structures of the Controller Classes
+# (filled in place by update() / read(), rounded to two decimals)
+class _READ_STATE:
+    """
+    Read State
+    Base for preallocated read structures with fixed members (__slots__)
+    """
+    __slots__ = ()
+
+    # Class Constructor
+    def __init__(self) -> None:
+        for name in self.__slots__:
+            object.__setattr__(self, name, 0)
+
+    # Representation
+    def __repr__(self) -> str:
+        return '{}({})'.format(type(self).__name__,
+                               ', '.join('{}={!r}'.format(name, getattr(self, name)) for name in self.__slots__))
+
+    # Compare members
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+class JoystickState(_READ_STATE):
+    __slots__ = ('X', 'Y', 'PB')
+
+class TriggerState(_READ_STATE):
+    __slots__ = ('T', 'B1', 'B2')
+
+class DPadState(_READ_STATE):
+    __slots__ = ('L', 'R', 'U', 'D')
+
+class XBOX_ButtonState(_READ_STATE):
+    __slots__ = ('A', 'B', 'X', 'Y', 'Start', 'Select')
+
+class PS_ButtonState(_READ_STATE):
+    __slots__ = ('Cross', 'Circle', 'Triangle', 'Square', 'Start', 'Select')
 
-# Dataclass - Button Data (PS)
+# Controller Components
 # ------------------------------
-# Member to hold Controller Input
+# Flags identifying the Controller Classes changed by an event
+# (bit position equals the position in ControllerFrame.versions)
+COMPONENT_JOY_L     = 1 << 0    # Joystick Left
+COMPONENT_JOY_R     = 1 << 1    # Joystick Right
+COMPONENT_TRIG_L    = 1 << 2    # Trigger Left
+COMPONENT_TRIG_R    = 1 << 3    # Trigger Right
+COMPONENT_DPAD      = 1 << 4    # D-Pad
+COMPONENT_BUTTON    = 1 << 5    # Buttons
+COMPONENT_ALL       = (1 << 6) - 1
+COMPONENT_COUNT     = 6
+
+# Dataclass - Controller Frame
+# ------------------------------
+# Members holding one complete report of Controller Input
 @dataclass()
-class PS_ButtonData:
-    # Define Button Data members
-    Cross       : bool = 0  # Button - Cross
-    Circle      : bool = 0  # Button - Circle
-    Triangle    : bool = 0  # Button - Triangle
-    Square      : bool = 0  # Button - Square
-    Start       : bool = 0  # Button - Start
-    Select      : bool = 0  # Button - Select
+class ControllerFrame:
+    """
+    Controller Frame:
+    Complete and consistent state of all Controller Data from one report
+    (the Data members are views of the Controller State of the Frame)
+    :param state: Controller State (array)
+    :param ButtonView: Button Data view (XBOX_ButtonData / PS_ButtonData)
+    :param version: Frame version, incremented for every published frame (int)
+    :param versions: Frame version of the last change per Controller Component (tuple)
+    :param changed: Controller Component flags changed in this frame (int)
+    :param pressed: Button bits pressed since the previous frame (int)
+    :param released: Button bits released since the previous frame (int)
+    :param presses: Number of presses per Generic Button name since start (dict)
+    :param releases: Number of releases per Generic Button name since start (dict)
+    """
+    # Define Frame Data members
+    state           : array = field(default_factory = new_state)                   # Controller State
+    ButtonView      : type = XBOX_ButtonData                                        # Button Data view
+    version         : int = 0                                                       # Frame version
+    versions        : tuple = (0,) * COMPONENT_COUNT                                # Component versions
+    changed         : int = 0                                                       # Changed Components
+    pressed         : int = 0                                                       # Pressed Button bits
+    released        : int = 0                                                       # Released Button bits
+    presses         : dict = field(default_factory = lambda: dict.fromkeys(GENERIC_BUTTONS, 0))    # Button press counts
+    releases        : dict = field(default_factory = lambda: dict.fromkeys(GENERIC_BUTTONS, 0))    # Button release counts
+
+    # Button bits
+    @property
+    def buttons(self) -> int:
+        return self.state[STATE_BUTTONS]
+
+    # Joystick Left
+    @property
+    def JoyL(self) -> JoystickData:
+        return JoystickData(self.state, 'L')
+
+    # Joystick Right
+    @property
+    def JoyR(self) -> JoystickData:
+        return JoystickData(self.state, 'R')
+
+    # Trigger Left
+    @property
+    def TrigL(self) -> TriggerData:
+        return TriggerData(self.state, 'L')
+
+    # Trigger Right
+    @property
+    def TrigR(self) -> TriggerData:
+        return TriggerData(self.state, 'R')
+
+    # D-Pad
+    @property
+    def DPad(self) -> DPadData:
+        return DPadData(self.state)
+
+    # Buttons (XBOX_ButtonData / PS_ButtonData)
+    @property
+    def Button(self):
+        return self.ButtonView(self.state)
+
+    # Generic Axis
+    @property
+    def GenericAxis(self) -> GenericAxisData:
+        return GenericAxisData(self.state)
+
+    # Generic Buttons
+    @property
+    def GenericButton(self) -> GenericButtonData:
+        return GenericButtonData(self.state)
+
+    # Copy Frame
+    def copy(self, version : int):
+        """
+        Copy of the Frame and its Controller State
+        :param version: Frame version of the copy
+        :return frame: Copied Frame (ControllerFrame)
+        """
+        return ControllerFrame(self.state[:],
+                               self.ButtonView,
+                               version,
+                               (version,) * COMPONENT_COUNT,
+                               COMPONENT_ALL,
+                               0,
+                               0,
+                               self.presses,
+                               self.releases)
+
+    # Copy changed Frame
+    def copy_changed(self, previous, version : int, changed : int):
+        """
+        Copy of the Frame, where the versions of the changed Controller Components are updated
+        and the Button press/release counts are carried on from the previous (published) Frame
+        :param previous: Previous published Frame (ControllerFrame)
+        :param version: Frame version of the copy
+        :param changed: Controller Component flags changed since the previous Frame
+        :return frame: Copied Frame (ControllerFrame)
+        """
+        versions = tuple(version if changed & (1 << index) else previous_version
+                         for index, previous_version in enumerate(previous.versions))
+
+        # Count Button press and release edges since the previous Frame
+        # (count dictionaries are only replaced when an edge occured)
+        presses = previous.presses
+        releases = previous.releases
+        buttons = self.state[STATE_BUTTONS]
+        previous_buttons = previous.state[STATE_BUTTONS]
+        pressed = buttons_pressed(buttons, previous_buttons)
+        released = buttons_released(buttons, previous_buttons)
+        if pressed:
+            presses = dict(presses)
+            for name, mask in BUTTON_MASKS.items():
+                if pressed & mask:
+                    presses[name] += 1
+        if released:
+            releases = dict(releases)
+            for name, mask in BUTTON_MASKS.items():
+                if released & mask:
+                    releases[name] += 1
+
+        return ControllerFrame(self.state[:],
+                               self.ButtonView,
+                               version,
+                               versions,
+                               changed,
+                               pressed,
+                               released,
+                               presses,
+                               releases)
+
+# Input Event Record
+# ------------------------------
+# Binary layout of an input event record read from a character device
+# (struct input_event: seconds, microseconds, type, code, value)
+EVENT_FORMAT = 'llHHi'
+EVENT_SIZE = struct.calcsize(EVENT_FORMAT)
+
+# NumPy record type of an input event record
+# (same layout as EVENT_FORMAT)
+if np is not None:
+    EVENT_DTYPE = np.dtype([('tv_sec', 'l'),
+                            ('tv_usec', 'l'),
+                            ('type', 'H'),
+                            ('code', 'H'),
+                            ('value', 'i')])
+    assert EVENT_DTYPE.itemsize == EVENT_SIZE
+else:
+    EVENT_DTYPE = None
+
+# Decode Input Event Records
+# ------------------------------
+def decode_events(data) -> list:
+    """
+    Decode a block of input event records in a single pass
+    (timestamps are dropped, trailing partial records are ignored)
+    :param data: Input event records (bytes, bytearray or memoryview)
+    :return events: Input events (type, code, value) (list)
+    """
+    # Whole records only
+    size = len(data) - len(data) % EVENT_SIZE
+    if size != len(data):
+        data = memoryview(data)[:size]
+
+    return [(ev_type, code, value) for _, _, ev_type, code, value in struct.iter_unpack(EVENT_FORMAT, data)]
+
+# Decode Input Event Records (NumPy)
+# ------------------------------
+def decode_events_array(data) -> any:
+    """
+    Decode a block of input event records into a NumPy record array without copying
+    (the array refers to the memory of data; copy it before reusing a read buffer)
+    :param data: Input event records (bytes, bytearray or memoryview)
+    :return events: Input events with fields tv_sec, tv_usec, type, code, value (np.ndarray)
+    """
+    if np is None:
+        raise ImportError('decode_events_array requires numpy')
+
+    return np.frombuffer(data, dtype=EVENT_DTYPE, count=len(data) // EVENT_SIZE)
+
+# Input Event Types and Codes
+# ------------------------------
+# Integer values of the Event-Key names
+# (as defined by linux/input-event-codes.h)
+EVENT_TYPES = {'Sync'       : 0x00,
+               'Key'        : 0x01,
+               'Relative'   : 0x02,
+               'Absolute'   : 0x03,
+               'Misc'       : 0x04}
+
+EVENT_CODES = {'SYN_REPORT'     : 0x00,
+               'SYN_CONFIG'     : 0x01,
+               'SYN_MT_REPORT'  : 0x02,
+               'SYN_DROPPED'    : 0x03,
+               'ABS_X'          : 0x00,
+               'ABS_Y'          : 0x01,
+               'ABS_Z'          : 0x02,
+               'ABS_RX'         : 0x03,
+               'ABS_RY'         : 0x04,
+               'ABS_RZ'         : 0x05,
+               'ABS_THROTTLE'   : 0x06,
+               'ABS_RUDDER'     : 0x07,
+               'ABS_WHEEL'      : 0x08,
+               'ABS_GAS'        : 0x09,
+               'ABS_BRAKE'      : 0x0a,
+               'ABS_HAT0X'      : 0x10,
+               'ABS_HAT0Y'      : 0x11,
+               'MSC_SCAN'       : 0x04,
+               'BTN_SOUTH'      : 0x130,
+               'BTN_EAST'       : 0x131,
+               'BTN_C'          : 0x132,
+               'BTN_NORTH'      : 0x133,
+               'BTN_WEST'       : 0x134,
+               'BTN_Z'          : 0x135,
+               'BTN_TL'         : 0x136,
+               'BTN_TR'         : 0x137,
+               'BTN_TL2'        : 0x138,
+               'BTN_TR2'        : 0x139,
+               'BTN_SELECT'     : 0x13a,
+               'BTN_START'      : 0x13b,
+               'BTN_MODE'       : 0x13c,
+               'BTN_THUMBL'     : 0x13d,
+               'BTN_THUMBR'     : 0x13e,
+               'BTN_DPAD_UP'    : 0x220,
+               'BTN_DPAD_DOWN'  : 0x221,
+               'BTN_DPAD_LEFT'  : 0x222,
+               'BTN_DPAD_RIGHT' : 0x223}
+
+# Get Integer Event-Key
+# ------------------------------
+def get_event_key(ev_type : str, code : str) -> tuple:
+    """
+    Get the integer Event-Key of an Event-Key given by names
+    :param ev_type: Event-Type name (e.g. 'Absolute')
+    :param code: Event-Code name (e.g. 'ABS_X')
+    :return key: Integer Event-Key (type, code) or None if the names are unknown
+    """
+    if ev_type not in EVENT_TYPES or code not in EVENT_CODES:
+        return None
+
+    return (EVENT_TYPES[ev_type], EVENT_CODES[code])
 
 # Dataclass - Controller Event-Key Constants
 # ------------------------------
@@ -153,10 +739,171 @@ class _EVENTKEY_CONST:
     BTN_START   : str = 'BTN_START'         # Button - Start
     BTN_SELECT  : str = 'BTN_SELECT'        # Button - Select
 
+    # Synchronization key constants
+    SYNC_EVENT  : str = 'Sync'              # Synchronization Event
+    SYNC_REPORT : str = 'SYN_REPORT'        # Synchronization - End of Report
+    SYNC_DROPPED: str = 'SYN_DROPPED'       # Synchronization - Events dropped
+
+# Scaling Constants - Lookup-Table
+# ------------------------------
+class _SCALING_LUT:
+    """
+    Scaling Lookup-Table
+    Base for Scaling Constants dataclasses, holding the scaled value
+    of every raw-input value in range [RAW_MIN, RAW_MAX].
+    The Lookup-Table is built on first use and automatically rebuilt
+    after any of the scaling constants are changed
+    """
+    # Lookup-Table (built on first use)
+    _lut = None
+    _lut_array = None
+    _lut_raw = None
+    _lut_rounded = None
+
+    # Lookup-Tables reset when a scaling constant is changed
+    _CACHES = ('_lut', '_lut_array', '_lut_raw', '_lut_rounded')
+
+    # Maximum number of Lookup-Table entries
+    _LUT_MAX_SIZE = 1 << 17
+
+    # Invalidate Lookup-Table when a scaling constant is changed
+    def __setattr__(self, name, value) -> None:
+        object.__setattr__(self, name, value)
+        if not name.startswith('_'):
+            for cache in self._CACHES:
+                object.__setattr__(self, cache, None)
+
+    # Get Response Curve
+    def get_curve(self):
+        """
+        Get the Response Curve applied to the scaled values
+        :return curve: Function of the normalized magnitude [0, 1] or None for a linear response
+        """
+        return None
+
+    # Get raw center value
+    def get_raw_center(self) -> float:
+        """
+        Get the raw value the Deadband is centered on
+        (rest position of the Axis, raw value 0 by default)
+        :return raw_center: Raw center value
+        """
+        return 0
+
+    # Shape scaled value
+    def shape(self, value : float) -> float:
+        """
+        Apply the Response Curve to a scaled value
+        :param value: Scaled Value
+        :return value: Shaped Value
+        """
+        return shape_value(value, self.get_curve(), self.MIN, self.MAX)
+
+    # Shape scaled values (NumPy)
+    def shape_array(self, values):
+        """
+        Apply the Response Curve to an array of scaled values
+        :param values: Scaled Values (numpy.ndarray)
+        :return values: Shaped Values (numpy.ndarray)
+        """
+        return shape_value_array(values, self.get_curve(), self.MIN, self.MAX)
+
+    # Get Lookup-Table
+    def get_lut(self) -> list:
+        """
+        Get the Lookup-Table of scaled values, indexed by (raw_value - RAW_MIN)
+        :return lut: Scaled values (list) or None if the raw range is too large
+        """
+        # Build Lookup-Table
+        if self._lut is None:
+            size = self.RAW_MAX - self.RAW_MIN + 1
+            if 0 < size <= self._LUT_MAX_SIZE:
+                curve = self.get_curve()
+                raw_center = self.get_raw_center()
+                lut = [shape_value(calc_minmax_scaling_deadband(raw_value,
+                                                                self.RAW_MIN,
+                                                                self.RAW_MAX,
+                                                                self.RAW_DB,
+                                                                self.MIN,
+                                                                self.MAX,
+                                                                raw_center),
+                                   curve,
+                                   self.MIN,
+                                   self.MAX) for raw_value in range(self.RAW_MIN, self.RAW_MAX + 1)]
+                object.__setattr__(self, '_lut', lut)
+
+        # Function Return
+        return self._lut
+
+    # Get Lookup-Table as NumPy array
+    def get_lut_array(self):
+        """
+        Get the Lookup-Table of scaled values as NumPy array, indexed by (raw_value - RAW_MIN)
+        :return lut_array: Scaled values (numpy.ndarray) or None if no Lookup-Table is available
+        """
+        # Build Lookup-Table array
+        if self._lut_array is None and np is not None:
+            lut = self.get_lut()
+            if lut is not None:
+                object.__setattr__(self, '_lut_array', np.asarray(lut, dtype=np.float64))
+
+        # Function Return
+        return self._lut_array
+
+    # Get Lookup-Table indexed by raw value
+    def get_raw_lut(self, rounded : bool = False) -> list:
+        """
+        Get the Lookup-Table of scaled values, indexed directly by raw_value in range [RAW_MIN, RAW_MAX]
+        (negative raw values index from the end of the list, so no index arithmetic is needed per lookup)
+        :param rounded: Scaled values rounded to two decimals (bool)
+        :return lut: Scaled values (list) or None if no Lookup-Table is available
+                     (raw ranges far from raw value 0, e.g. [1000000, 1000255], need too large a list)
+        """
+        attribute = '_lut_rounded' if rounded else '_lut_raw'
+
+        # Build Lookup-Table
+        if getattr(self, attribute) is None:
+            lut = self.get_lut()
+            if lut is None or not 0 < self._get_raw_lut_size() <= self._LUT_MAX_SIZE:
+                return None
+            if rounded:
+                lut = [round_value(value) for value in lut]
+
+            object.__setattr__(self, attribute, self._index_by_raw(lut))
+
+        # Function Return
+        return getattr(self, attribute)
+
+    # Size of Lookup-Table indexed by raw value
+    def _get_raw_lut_size(self) -> int:
+        """
+        Get the number of list entries needed to index the raw range [RAW_MIN, RAW_MAX] directly by raw_value
+        (raw values >= 0 at their index, raw values < 0 at the end)
+        :return size: Number of list entries (int)
+        """
+        if self.RAW_MAX >= 0:
+            return self.RAW_MAX + 1 + max(0, -self.RAW_MIN)
+        return -self.RAW_MIN
+
+    # Index values by raw value
+    def _index_by_raw(self, values : list) -> list:
+        """
+        Arrange values of the raw range [RAW_MIN, RAW_MAX] in a list indexed directly by raw_value
+        :param values: Values in order of the raw range (list)
+        :return lut: Values indexed by raw value (list)
+        """
+        # Raw values >= 0 at their index, raw values < 0 at the end
+        lut_raw = [None] * self._get_raw_lut_size()
+        for raw_value, value in zip(range(self.RAW_MIN, self.RAW_MAX + 1), values):
+            lut_raw[raw_value] = value
+
+        # Function Return
+        return lut_raw
+
 # Dataclass - Controller Joystick Scaling Constans
 # ------------------------------
 @dataclass()
-class _JOYSTICK_SCALING_CONST:
+class _JOYSTICK_SCALING_CONST(_SCALING_LUT):
     """
     Controller Joystick Scaling Constans
     Data constants for scaling Controller Joystick values
@@ -170,10 +917,91 @@ class _JOYSTICK_SCALING_CONST:
     MIN     : float = -100.0   # Trigger Minimum Scaling value
     MAX     : float = 100.0    # Trigger Maximum Scaling value
 
+    # Deadzone and Response Curve of the Joystick
+    # (DEADZONE 'axial': RAW_DB applied to each Axis (square deadzone),
+    #  DEADZONE 'radial': RAW_DB applied to the length of the stick vector (circular deadzone),
+    #  CURVE 'linear', 'expo' or a function of the normalized magnitude [0, 1] -> [0, 1])
+    DEADZONE    : str = 'axial'     # Deadzone shape ('axial' / 'radial')
+    CURVE       : any = 'linear'    # Response Curve ('linear' / 'expo' / function)
+    EXPO        : float = 0.0       # Expo share of the 'expo' Response Curve [0, 1]
+
+    # Radial Deadzone Lookup-Tables (built on first use)
+    _radial_axis = None
+    _radial_gain = None
+    _CACHES = _SCALING_LUT._CACHES + ('_radial_axis', '_radial_gain')
+
+    # Number of radius steps of the radial gain Lookup-Table
+    _RADIAL_LUT_SIZE = 1024
+
+    # Get Response Curve
+    def get_curve(self):
+        """
+        Get the Response Curve applied to the scaled values
+        :return curve: Function of the normalized magnitude [0, 1] or None for a linear response
+        """
+        if callable(self.CURVE):
+            return self.CURVE
+        if self.CURVE == 'linear':
+            return None
+        if self.CURVE == 'expo':
+            return expo_curve(self.EXPO)
+        raise ValueError('Unknown Joystick Response Curve: {}'.format(self.CURVE))
+
+    # Get raw center value
+    def get_raw_center(self) -> float:
+        """
+        Get the raw value the Deadband is centered on
+        (middle of unsigned raw ranges e.g. [0, 255], raw value 0 for signed raw ranges)
+        :return raw_center: Raw center value
+        """
+        if self.RAW_MIN >= 0:
+            return (self.RAW_MIN + self.RAW_MAX) / 2
+        return 0
+
+    # Get radial Deadzone Lookup-Tables
+    def get_radial_lut(self) -> tuple:
+        """
+        Get the Lookup-Tables of the radial Deadzone:
+        the normalized Axis value [-1, 1] indexed directly by raw_value (list or None if the raw range is too large)
+        and the gain of the stick vector per radius step of 1 / _RADIAL_LUT_SIZE in range [0, 1],
+        with Deadzone and Response Curve applied (list)
+        :return axis_lut, gain_lut: Lookup-Tables (tuple)
+        """
+        # Build Lookup-Tables
+        if self._radial_gain is None:
+            size = self.RAW_MAX - self.RAW_MIN + 1
+            axis_lut = None
+            if 0 < size and 0 < self._get_raw_lut_size() <= self._LUT_MAX_SIZE:
+                axis_lut = self._index_by_raw([calc_minmax_scaling(raw_value, self.RAW_MIN, self.RAW_MAX, -1.0, 1.0)
+                                               for raw_value in range(self.RAW_MIN, self.RAW_MAX + 1)])
+
+            # Gain per radius step: shaped magnitude / radius
+            deadzone = self.get_radial_deadzone()
+            curve = self.get_curve()
+            steps = self._RADIAL_LUT_SIZE
+            gain_lut = [calc_radial_magnitude(step / steps, deadzone, curve) / (step / steps) if step else 0.0
+                        for step in range(steps + 1)]
+            if deadzone <= 0.0:
+                gain_lut[0] = gain_lut[1]
+
+            object.__setattr__(self, '_radial_axis', axis_lut)
+            object.__setattr__(self, '_radial_gain', gain_lut)
+
+        # Function Return
+        return self._radial_axis, self._radial_gain
+
+    # Get radial Deadzone
+    def get_radial_deadzone(self) -> float:
+        """
+        Get the radius of the radial Deadzone, normalized to the half raw range
+        :return deadzone: Deadzone radius [0, 1]
+        """
+        return min(max(self.RAW_DB / ((self.RAW_MAX - self.RAW_MIN) / 2), 0.0), 1.0)
+
 # Dataclass - Controller Trigger Scaling Constans
 # ------------------------------
 @dataclass()
-class _TRIGGER_SCALING_CONST:
+class _TRIGGER_SCALING_CONST(_SCALING_LUT):
     """
     Controller Trigger Scaling Constans
     Data constants for scaling Controller Trigger values
@@ -197,12 +1025,19 @@ class _GAMEPAD_CONST:
     :param (optional)  _EVENTKEY:   Event-Key Constants ()
     :param (optional) _JOY_SCALING:   Joystick Scaling Constants
     :param (optional) _TRIG_SCALING:  Trigger Scaling Constants
+    :param (optional) JOYSTICK_FILTER: Filter stages of the scaled Joystick Axes (lib/filter.py)
+    :param (optional) TRIGGER_FILTER: Filter stages of the scaled Trigger Axes (lib/filter.py)
     """
     # XBOX-One Constants
     EVENTKEY            : _EVENTKEY_CONST = field(init=False, default_factory = _EVENTKEY_CONST)         
     JOYSTICK_SCALING    : _JOYSTICK_SCALING_CONST = field(init=False, default_factory = _JOYSTICK_SCALING_CONST)
     TRIGGER_SCALING     : _TRIGGER_SCALING_CONST = field(init=False, default_factory = _TRIGGER_SCALING_CONST)
 
+    # Axis Filter stages
+    # (no stages: scaled values are not filtered)
+    JOYSTICK_FILTER     : tuple = field(init=False, default = ())
+    TRIGGER_FILTER      : tuple = field(init=False, default = ())
+
 # Dataclass - XBOX One Controller Constants
 # ------------------------------
 @dataclass()
@@ -251,6 +1086,11 @@ class XBOXONE_CONST(_GAMEPAD_CONST):
         self.EVENTKEY.BTN_START = 'BTN_START'   # Button - Start
         self.EVENTKEY.BTN_SELECT = 'BTN_SELECT' # Button - Select
 
+        # Defining Synchronization Event-Key Constants
+        self.EVENTKEY.SYNC_EVENT = 'Sync'           # Synchronization Event
+        self.EVENTKEY.SYNC_REPORT = 'SYN_REPORT'    # Synchronization - End of Report
+        self.EVENTKEY.SYNC_DROPPED = 'SYN_DROPPED'  # Synchronization - Events dropped
+
     # Overwrite Joystick Scaling Constants with controller specific values
     def init_joystick_scaling_const(self) -> None:
         # Defining Joystick Scaling Constants
@@ -317,6 +1157,11 @@ class PS3_CONST(_GAMEPAD_CONST):
         self.EVENTKEY.BTN_START = 'BTN_START'   # Button - Start
         self.EVENTKEY.BTN_SELECT = 'BTN_SELECT' # Button - Select
 
+        # Defining Synchronization Event-Key Constants
+        self.EVENTKEY.SYNC_EVENT = 'Sync'           # Synchronization Event
+        self.EVENTKEY.SYNC_REPORT = 'SYN_REPORT'    # Synchronization - End of Report
+        self.EVENTKEY.SYNC_DROPPED = 'SYN_DROPPED'  # Synchronization - Events dropped
+
     # Overwrite Joystick Scaling Constants with controller specific values
     def init_joystick_scaling_const(self) -> None:
         # Defining Joystick Scaling Constants
@@ -335,6 +1180,265 @@ class PS3_CONST(_GAMEPAD_CONST):
         self.TRIGGER_SCALING.MIN = 0.0       # Joystick Minimum Scaling value
         self.TRIGGER_SCALING.MAX = 100.0     # Joystick Maximum Scaling value
 
+# Controller Profiles
+# ------------------------------
+# Controller Constants loaded from a JSON profile file, e.g.:
+# {"type": "XBOX",
+#  "EVENTKEY": {"BTN_S": "BTN_SOUTH"},
+#  "JOYSTICK_SCALING": {"RAW_DB": 1500, "DEADZONE": "radial", "CURVE": "expo", "EXPO": 0.3},
+#  "TRIGGER_SCALING": {"MAX": 1.0}}
+# Omitted members keep the value of the base Controller Constants
+# (the Trigger Deadband is centered on raw value 0, not on RAW_MIN,
+#  so a Trigger RAW_DB scales a released Trigger below MIN)
+
+# Controller Constants per Controller type
+PROFILE_TYPES = {'XBOX' : XBOXONE_CONST,
+                 'PS3' : PS3_CONST}
+
+# Profile sections (Controller Constants members)
+PROFILE_SECTIONS = ('EVENTKEY', 'JOYSTICK_SCALING', 'TRIGGER_SCALING')
+
+# Read Profile
+# -----------------------------
+def read_profile(path : str) -> dict:
+    """
+    Read a Controller profile from a JSON file
+    :param path: Path of the profile file
+    :return profile: Controller profile (dict)
+    """
+    with open(path, 'r') as file:
+        profile = json.load(file)
+
+    # Check Profile
+    if not isinstance(profile, dict):
+        raise ValueError('Controller profile is not a JSON object: {}'.format(path))
+
+    return profile
+
+# Apply Profile
+# -----------------------------
+def apply_profile(GAMEPAD_CONST : _GAMEPAD_CONST, profile : dict) -> _GAMEPAD_CONST:
+    """
+    Create new Controller Constants from the base Controller Constants and a Controller profile
+    (the base Controller Constants are not modified, so a profile can be built
+     while the base Controller Constants are in use)
+    :param GAMEPAD_CONST: Base Controller Constants (XBOXONE_CONST / PS3_CONST)
+    :param profile: Controller profile (dict)
+    :return GAMEPAD_CONST: New Controller Constants (same type as the base)
+    """
+    # Check Controller type and sections
+    for name in profile:
+        if name != 'type' and name not in PROFILE_SECTIONS:
+            raise ValueError('Unknown Controller profile section: {}'.format(name))
+    if 'type' in profile and PROFILE_TYPES.get(profile['type']) is not type(GAMEPAD_CONST):
+        raise ValueError('Controller profile type {} does not match {}'.format(profile['type'], type(GAMEPAD_CONST).__name__))
+
+    # Copy base Controller Constants
+    # (Axis Filter stages are shared, Lookup-Tables are rebuilt)
+    new_const = type(GAMEPAD_CONST)()
+    new_const.JOYSTICK_FILTER = GAMEPAD_CONST.JOYSTICK_FILTER
+    new_const.TRIGGER_FILTER = GAMEPAD_CONST.TRIGGER_FILTER
+    for section in PROFILE_SECTIONS:
+        base = getattr(GAMEPAD_CONST, section)
+        target = getattr(new_const, section)
+        members = [member.name for member in fields(base)]
+        for member in members:
+            setattr(target, member, getattr(base, member))
+
+        # Apply profile values
+        values = profile.get(section, dict())
+        if not isinstance(values, dict):
+            raise ValueError('Controller profile section {} is not a JSON object'.format(section))
+        for member, value in values.items():
+            if member not in members:
+                raise ValueError('Unknown Controller profile member: {}.{}'.format(section, member))
+            setattr(target, member, value)
+
+    # Check Scaling values
+    # (before any Lookup-Table is built from them)
+    for section in ('JOYSTICK_SCALING', 'TRIGGER_SCALING'):
+        check_scaling(section, getattr(new_const, section))
+
+    # Check Response Curve
+    new_const.JOYSTICK_SCALING.get_curve()
+    if new_const.JOYSTICK_SCALING.DEADZONE not in ('axial', 'radial'):
+        raise ValueError('Unknown Joystick Deadzone: {}'.format(new_const.JOYSTICK_SCALING.DEADZONE))
+
+    return new_const
+
+# Check Scaling Constants
+# -----------------------------
+def check_scaling(section : str, SCALING_CONST) -> None:
+    """
+    Check the raw range, Deadband and scaling range of Scaling Constants
+    (raises ValueError for values the Lookup-Tables cannot be built from)
+    :param section: Profile section name, used in the error message (str)
+    :param SCALING_CONST: Joystick or Trigger Scaling Constants
+    """
+    # Raw values are integers, scaling values numbers
+    # (bool is excluded, JSON true/false are no values)
+    for member, types in (('RAW_MIN', int), ('RAW_MAX', int), ('RAW_DB', int), ('MIN', (int, float)), ('MAX', (int, float))):
+        value = getattr(SCALING_CONST, member)
+        if isinstance(value, bool) or not isinstance(value, types):
+            raise ValueError('Controller profile member {}.{} is not a number: {!r}'.format(section, member, value))
+
+    # Raw range
+    if not SCALING_CONST.RAW_MIN < SCALING_CONST.RAW_MAX:
+        raise ValueError('Controller profile member {}.RAW_MIN must be less than RAW_MAX'.format(section))
+
+    # Deadband on both sides of the raw center leaves a raw range to scale
+    if not 0 <= 2 * SCALING_CONST.RAW_DB < SCALING_CONST.RAW_MAX - SCALING_CONST.RAW_MIN:
+        raise ValueError('Controller profile member {}.RAW_DB out of range: {}'.format(section, SCALING_CONST.RAW_DB))
+
+# Compile Scaling Lookup-Tables
+# -----------------------------
+def compile_scaling(GAMEPAD_CONST : _GAMEPAD_CONST) -> _GAMEPAD_CONST:
+    """
+    Build all Scaling Lookup-Tables of the Controller Constants ahead of use,
+    so the first read after a profile change does not build them
+    :param GAMEPAD_CONST: Controller Constants
+    :return GAMEPAD_CONST: Same Controller Constants with built Lookup-Tables
+    """
+    for SCALING_CONST in (GAMEPAD_CONST.JOYSTICK_SCALING, GAMEPAD_CONST.TRIGGER_SCALING):
+        SCALING_CONST.get_raw_lut()
+        SCALING_CONST.get_raw_lut(rounded=True)
+    if GAMEPAD_CONST.JOYSTICK_SCALING.DEADZONE == 'radial':
+        GAMEPAD_CONST.JOYSTICK_SCALING.get_radial_lut()
+
+    return GAMEPAD_CONST
+
+# Dataclass - Device Profile
+# ------------------------------
+@dataclass()
+class DeviceProfile:
+    """
+    Device Profile:
+    Controller type and Controller profile of a gamepad model,
+    identified by USB vendor/product ID or by keywords of the device name
+    :param name: Device Profile name (str)
+    :param type: Controller type of the event layout, 'XBOX' or 'PS3' (str)
+    :param ids: USB IDs (vendor, product), product None matches every product of the vendor (tuple)
+    :param names: Keywords of the device name, used when no USB ID matches (tuple)
+    :param profile: Controller profile applied to the Controller Constants of the type (dict, see apply_profile)
+    """
+    name        : str
+    type        : str
+    ids         : tuple = ()
+    names       : tuple = ()
+    profile     : dict = field(default_factory = dict)
+
+# Device Profile Registry
+# ------------------------------
+# Registered Device Profiles by name and by USB ID
+# (profiles registered later take precedence)
+DEVICE_PROFILES = dict()
+_DEVICE_IDS = dict()
+
+# Register Device Profile
+# -----------------------------
+def register_device_profile(profile : DeviceProfile) -> DeviceProfile:
+    """
+    Register a Device Profile, replacing a registered profile of the same name
+    :param profile: Device Profile (DeviceProfile)
+    :return profile: Registered Device Profile (DeviceProfile)
+    """
+    # Check Controller type and profile
+    if profile.type not in PROFILE_TYPES:
+        raise ValueError('Unknown Controller type of Device Profile {}: {}'.format(profile.name, profile.type))
+    apply_profile(PROFILE_TYPES[profile.type](), profile.profile)
+
+    # Replace registered profile
+    previous = DEVICE_PROFILES.pop(profile.name, None)
+    if previous is not None:
+        for device_id in previous.ids:
+            if _DEVICE_IDS.get(device_id) is previous:
+                del _DEVICE_IDS[device_id]
+
+    DEVICE_PROFILES[profile.name] = profile
+    for vendor, product in profile.ids:
+        _DEVICE_IDS[(vendor, product)] = profile
+
+    return profile
+
+# Find Device Profile
+# -----------------------------
+def find_device_profile(vendor : int, product : int, name : str) -> DeviceProfile:
+    """
+    Find the Device Profile of a gamepad by USB vendor/product ID,
+    then by the vendor ID alone and finally by keywords of the device name
+    :param vendor: USB vendor ID (int or None if unknown)
+    :param product: USB product ID (int or None if unknown)
+    :param name: Device name (str)
+    :return profile: Device Profile (DeviceProfile) or None for unknown gamepads
+    """
+    # USB ID
+    if vendor is not None:
+        profile = _DEVICE_IDS.get((vendor, product)) or _DEVICE_IDS.get((vendor, None))
+        if profile is not None:
+            return profile
+
+    # Name-based fallback
+    # (latest registered profile first)
+    for profile in reversed(list(DEVICE_PROFILES.values())):
+        for keyword in profile.names:
+            if keyword in name:
+                return profile
+
+    return None
+
+# Get Device Profile
+# -----------------------------
+def get_device_profile(gamepad) -> DeviceProfile:
+    """
+    Get the Device Profile of a gamepad
+    (USB IDs from the vendor and product attributes of the Backend, if available)
+    :param gamepad: Backend or gamepad object of the inputs package
+    :return profile: Device Profile (DeviceProfile) or None for unknown gamepads
+    """
+    return find_device_profile(getattr(gamepad, 'vendor', None),
+                               getattr(gamepad, 'product', None),
+                               format(gamepad))
+
+# Built-in Device Profiles
+# ------------------------------
+# XBOX 360 / One / Elite Controller (xpad driver), and pads in X-input mode reporting as XBOX 360 Controller
+register_device_profile(DeviceProfile('XBOX', 'XBOX',
+                                      ids = ((0x045e, 0x028e), (0x045e, 0x02d1), (0x045e, 0x02dd),
+                                             (0x045e, 0x02e3), (0x045e, 0x02ea), (0x045e, 0x0b00)),
+                                      names = ('Microsoft',)))
+
+# Playstation 3 Controller (DualShock 3)
+register_device_profile(DeviceProfile('PS3', 'PS3',
+                                      ids = ((0x054c, 0x0268),),
+                                      names = ('PLAYSTATION(R)3',)))
+
+# XBOX Series X|S Controller
+register_device_profile(DeviceProfile('XBOX_SERIES', 'XBOX',
+                                      ids = ((0x045e, 0x0b12), (0x045e, 0x0b13)),
+                                      names = ('Xbox Wireless Controller', 'Xbox Series')))
+
+# Playstation 4 Controller (DualShock 4)
+# (D-Pad as hat axes and Joystick Axes in range [0, 255], radial Deadzone around the center)
+register_device_profile(DeviceProfile('DUALSHOCK4', 'XBOX',
+                                      ids = ((0x054c, 0x05c4), (0x054c, 0x09cc)),
+                                      names = ('Sony Interactive Entertainment Wireless Controller',
+                                               'Sony Computer Entertainment Wireless Controller'),
+                                      profile = {'JOYSTICK_SCALING' : {'RAW_MIN' : 0, 'RAW_MAX' : 255, 'RAW_DB' : 8,
+                                                                       'DEADZONE' : 'radial'}}))
+
+# Playstation 5 Controller (DualSense / DualSense Edge)
+register_device_profile(DeviceProfile('DUALSENSE', 'XBOX',
+                                      ids = ((0x054c, 0x0ce6), (0x054c, 0x0df2)),
+                                      names = ('DualSense',),
+                                      profile = {'JOYSTICK_SCALING' : {'RAW_MIN' : 0, 'RAW_MAX' : 255, 'RAW_DB' : 8,
+                                                                       'DEADZONE' : 'radial'}}))
+
+# 8BitDo Controllers in X-input mode (xpad driver)
+# (Pro 2 Wired for Xbox, Ultimate Wired / Wireless, Ultimate Bluetooth, Ultimate 2C Wireless;
+#  other products and modes of the vendor use other layouts and are left to the name-based detection)
+register_device_profile(DeviceProfile('8BITDO', 'XBOX',
+                                      ids = ((0x2dc8, 0x2000), (0x2dc8, 0x3106), (0x2dc8, 0x3109), (0x2dc8, 0x310a))))
+
 # Get Connected Controller
 # -----------------------------
 def get_controller():
@@ -346,6 +1450,8 @@ def get_controller():
 
     # Using the first valid gamepad
     try:
+        if devices is None:
+            raise IndexError
         gamepad = devices.gamepads[0]
 
         # Return gamepad object
@@ -357,32 +1463,39 @@ def get_controller():
         print('ERROR: getController: No connected gamepad found!')
         return None
     
+# Get Connected Controllers
+# -----------------------------
+def get_controllers() -> list:
+    """
+    Get all connected gamepad controller objects
+    :return gamepads: Gamepad objects (list)
+    """
+
+    # inputs package not available
+    if devices is None:
+        return []
+
+    # Function Return
+    return list(devices.gamepads)
+
 # Get Controller Type
 # -----------------------------
 def get_controller_type(gamepad) -> str:
     """
     Get the gamepad controller type
+    (Controller type of the Device Profile, see get_device_profile)
     :return gampad_type: Gamepad type (str)
     """
-    # Convert type to string 
-    gamepad_typename = format(gamepad)
-    
     # Determine type
-    # (search for keyword within Gamepad typename)
-    if 'Microsoft' in gamepad_typename:
-        # XBOX Controller
-        gamepad_type = 'XBOX'
-    
-    elif 'PLAYSTATION(R)3' in gamepad_typename:
-        # Playstation 3 Controller
-        gamepad_type = 'PS3'
+    # (by USB ID, or by keyword within Gamepad typename)
+    profile = get_device_profile(gamepad)
 
-    else:
-        # Unknown Controller
-        gamepad_type = 'UNKNOWN'
+    # Unknown Controller
+    if profile is None:
+        return 'UNKNOWN'
 
     # Return Controller Type
-    return gamepad_type
+    return profile.type
 
 # XBOX Controller - Axis Event
 # ------------------------------
@@ -736,6 +1849,336 @@ def PS3_event_Button(event : any,
             TrigR.B2 = event.state
             ButtonData.RB2 = event.state
 
+# Button Edges
+# ------------------------------
+def get_button_edges(button_names : dict,
+                     presses : dict,
+                     releases : dict) -> tuple:
+    """
+    Get the Button press/release counts of a Controller Class
+    from the counts per Generic Button name
+    :param button_names: Button names of the Controller Class related to Generic Button names (dict)
+    :param presses: Number of presses per Generic Button name (dict)
+    :param releases: Number of releases per Generic Button name (dict)
+    :return edges: Press counts, release counts and pressed latches per Button name (dict, dict, dict)
+    """
+    button_presses = {name : presses.get(generic_name, 0) for name, generic_name in button_names.items()}
+    button_releases = {name : releases.get(generic_name, 0) for name, generic_name in button_names.items()}
+    button_pressed = {name : count > 0 for name, count in button_presses.items()}
+
+    return (button_presses, button_releases, button_pressed)
+
+# Update Button Edges
+# ------------------------------
+def update_button_edges(button_names : dict,
+                        edges : tuple,
+                        presses : dict,
+                        releases : dict,
+                        previous_presses : dict = None,
+                        previous_releases : dict = None) -> None:
+    """
+    Update the Button press/release counts and pressed latches of a Controller Class in place
+    (the counts are the difference to the previous counts, if given)
+    :param button_names: Button names of the Controller Class related to Generic Button names (dict)
+    :param edges: Press counts, release counts and pressed latches per Button name (dict, dict, dict)
+    :param presses: Number of presses per Generic Button name (dict)
+    :param releases: Number of releases per Generic Button name (dict)
+    :param previous_presses: Number of presses per Generic Button name at the previous update (dict)
+    :param previous_releases: Number of releases per Generic Button name at the previous update (dict)
+    """
+    button_presses, button_releases, button_pressed = edges
+    for name, generic_name in button_names.items():
+        press_count = presses.get(generic_name, 0)
+        release_count = releases.get(generic_name, 0)
+        if previous_presses is not None:
+            press_count -= previous_presses.get(generic_name, 0)
+            release_count -= previous_releases.get(generic_name, 0)
+        button_presses[name] = press_count
+        button_releases[name] = release_count
+        button_pressed[name] = press_count > 0
+
+# Clear Button Edges
+# ------------------------------
+def clear_button_edges(edges : tuple) -> None:
+    """
+    Reset the Button press/release counts and pressed latches of a Controller Class in place
+    :param edges: Press counts, release counts and pressed latches per Button name (dict, dict, dict)
+    """
+    button_presses, button_releases, button_pressed = edges
+    for name in button_presses:
+        button_presses[name] = 0
+        button_releases[name] = 0
+        button_pressed[name] = False
+
+# Dispatch Table - Add Entry
+# ------------------------------
+def _add_dispatch_entry(table : dict,
+                        ev_type : str,
+                        code : str,
+                        setter,
+                        components : int) -> None:
+    """
+    Add an entry (setter, components) to the Dispatch-Table under the key (ev_type, code)
+    Blank Event-Key Constants are not used by the controller and are skipped.
+    If the key is already assigned, both setters are called on the event
+    (setters return True if the Controller State changed)
+    :param table: Dispatch-Table (dict)
+    :param ev_type: Event-Type key
+    :param code: Event-Code key
+    :param setter: Function called with the event state
+    :param components: Controller Component flags changed by the setter (int)
+    """
+
+    # Skip Event-Keys not used by the controller
+    if not ev_type.strip() or not code.strip():
+        return
+
+    # Key already assigned
+    # (combine the existing and new setter)
+    key = (ev_type, code)
+    if key in table:
+        first, first_components = table[key]
+        def combined(state, first=first, second=setter):
+            return first(state) | second(state)
+        table[key] = (combined, first_components | components)
+
+    # New key
+    else:
+        table[key] = (setter, components)
+
+# Dispatch Table - Setter
+# ------------------------------
+def _axis_setter(state : array, name : str):
+    """
+    Create a setter which writes the event state to an Axis of the Controller State
+    (the setter returns True if the value changed)
+    :param state: Controller State (array)
+    :param name: Generic Axis name
+    :return setter: Setter function
+    """
+    index = STATE_AXES[name]
+
+    def setter(value):
+        if state[index] == value:
+            return False
+        state[index] = value
+        return True
+
+    return setter
+
+def _button_setter(state : array, name : str):
+    """
+    Create a setter which writes the event state to a Button bit of the Controller State
+    (any non-zero event state sets the Button, the setter returns True if the Button changed)
+    :param state: Controller State (array)
+    :param name: Generic Button name
+    :return setter: Setter function
+    """
+    mask = BUTTON_MASKS[name]
+    clear = ~mask
+
+    def setter(value):
+        buttons = state[STATE_BUTTONS]
+        new_buttons = buttons | mask if value else buttons & clear
+        if new_buttons == buttons:
+            return False
+        state[STATE_BUTTONS] = new_buttons
+        return True
+
+    return setter
+
+def _hat_setter(state : array, negative : str, positive : str):
+    """
+    Create a setter which writes a D-Pad hat axis to two Button bits of the Controller State
+    (negative event state sets the first, positive event state the second Button,
+     the setter returns True if a Button changed)
+    A hat axis points in one direction only, so the opposite direction is always cleared.
+    XBOX_event_Button keeps the opposite direction set when the hat moves from -1 to +1
+    without a 0 event in between, leaving both directions pressed
+    :param state: Controller State (array)
+    :param negative: Generic Button name of the negative direction
+    :param positive: Generic Button name of the positive direction
+    :return setter: Setter function
+    """
+    negative_mask = BUTTON_MASKS[negative]
+    positive_mask = BUTTON_MASKS[positive]
+    clear = ~(negative_mask | positive_mask)
+
+    def setter(value):
+        buttons = state[STATE_BUTTONS]
+        new_buttons = buttons & clear
+        if value < 0:
+            new_buttons |= negative_mask
+        elif value > 0:
+            new_buttons |= positive_mask
+        if new_buttons == buttons:
+            return False
+        state[STATE_BUTTONS] = new_buttons
+        return True
+
+    return setter
+
+# XBOX Controller - Dispatch Table
+# ------------------------------
+def XBOX_dispatch_table(XBOXONE_CONST : XBOXONE_CONST,
+                        state : array) -> dict:
+    """
+    XBOX Controller
+    Compile the Controller Constants once into a Dispatch-Table
+    mapping (ev_type, code) to a setter function and the flags
+    of the Controller Components changed by the setter.
+    Each incomming event is then handled with a single lookup
+    and a single write to the Controller State,
+    with the same result as XBOX_event_Axis and XBOX_event_Button,
+    except for D-Pad hat events: a hat event clears the opposite direction (see _hat_setter)
+    :param XBOXONE_CONST: XBOX Controller Constants (_XBOXONE_CONST)
+    :param state: Controller State written by the setters (array)
+    :return table: Dispatch-Table (dict)
+    """
+
+    # Local variables
+    table = dict()
+    KEY = XBOXONE_CONST.EVENTKEY
+
+    # Axis Event
+    # ------------------------------
+    axis_setters = [(KEY.JOYL_X, _axis_setter(state, 'JoyL_X'), COMPONENT_JOY_L),     # Joystick Left - Axis X
+                    (KEY.JOYL_Y, _axis_setter(state, 'JoyL_Y'), COMPONENT_JOY_L),     # Joystick Left - Axis Y
+                    (KEY.JOYR_X, _axis_setter(state, 'JoyR_X'), COMPONENT_JOY_R),     # Joystick Right - Axis X
+                    (KEY.JOYR_Y, _axis_setter(state, 'JoyR_Y'), COMPONENT_JOY_R),     # Joystick Right - Axis Y
+                    (KEY.TRIG_L, _axis_setter(state, 'Trig_L'), COMPONENT_TRIG_L),    # Trigger Left - Axis
+                    (KEY.TRIG_R, _axis_setter(state, 'Trig_R'), COMPONENT_TRIG_R)]    # Trigger Right - Axis
+
+    for code, setter, component in axis_setters:
+        _add_dispatch_entry(table, KEY.AXIS_EVENT, code, setter, component)
+
+    # Button Event
+    # ------------------------------
+    button_setters = [(KEY.BTN_S, _button_setter(state, 'S'), COMPONENT_BUTTON),               # Button - A
+                      (KEY.BTN_E, _button_setter(state, 'E'), COMPONENT_BUTTON),               # Button - B
+                      (KEY.BTN_W, _button_setter(state, 'W'), COMPONENT_BUTTON),               # Button - X
+                      (KEY.BTN_N, _button_setter(state, 'N'), COMPONENT_BUTTON),               # Button - Y
+                      (KEY.BTN_LB1, _button_setter(state, 'LB1'), COMPONENT_TRIG_L),           # Button - Left-Back Bumper No. 1
+                      (KEY.BTN_RB1, _button_setter(state, 'RB1'), COMPONENT_TRIG_R),           # Button - Right-Back Bumper No. 1
+                      (KEY.BTN_PBL, _button_setter(state, 'PB_L'), COMPONENT_JOY_L),           # Button - Joystick Left Push
+                      (KEY.BTN_PBR, _button_setter(state, 'PB_R'), COMPONENT_JOY_R),           # Button - Joystick Right Push
+                      (KEY.BTN_START, _button_setter(state, 'Start'), COMPONENT_BUTTON),       # Button - Start
+                      (KEY.BTN_SELECT, _button_setter(state, 'Select'), COMPONENT_BUTTON)]     # Button - Select
+
+    for code, setter, component in button_setters:
+        _add_dispatch_entry(table, KEY.BTN_EVENT, code, setter, component)
+
+    # Axis Event
+    # Special case for D-PAD and Trigger buttons
+    # ------------------------------
+    _add_dispatch_entry(table, KEY.AXIS_EVENT, KEY.DPAD_X, _hat_setter(state, 'DPad_L', 'DPad_R'), COMPONENT_DPAD)   # D-PAD - Left / Right
+    _add_dispatch_entry(table, KEY.AXIS_EVENT, KEY.DPAD_Y, _hat_setter(state, 'DPad_U', 'DPad_D'), COMPONENT_DPAD)   # D-PAD - Up / Down
+    _add_dispatch_entry(table, KEY.AXIS_EVENT, KEY.TRIG_L, _button_setter(state, 'LB2'), COMPONENT_TRIG_L)          # Button - Left-Back Bumper No. 2
+    _add_dispatch_entry(table, KEY.AXIS_EVENT, KEY.TRIG_R, _button_setter(state, 'RB2'), COMPONENT_TRIG_R)          # Button - Right-Back Bumper No. 2
+
+    # Function Return
+    return table
+
+# PS3 Controller - Dispatch Table
+# ------------------------------
+def PS3_dispatch_table(PS3_CONST : PS3_CONST,
+                       state : array) -> dict:
+    """
+    PS3 Controller
+    Compile the Controller Constants once into a Dispatch-Table
+    mapping (ev_type, code) to a setter function and the flags
+    of the Controller Components changed by the setter.
+    Each incomming event is then handled with a single lookup
+    and a single write to the Controller State,
+    with the same result as PS3_event_Axis and PS3_event_Button
+    :param PS3_CONST: PS3 Controller Constants (_PS3_CONST)
+    :param state: Controller State written by the setters (array)
+    :return table: Dispatch-Table (dict)
+    """
+
+    # Local variables
+    table = dict()
+    KEY = PS3_CONST.EVENTKEY
+
+    # Axis Event
+    # ------------------------------
+    axis_setters = [(KEY.JOYL_X, _axis_setter(state, 'JoyL_X'), COMPONENT_JOY_L),     # Joystick Left - Axis X
+                    (KEY.JOYL_Y, _axis_setter(state, 'JoyL_Y'), COMPONENT_JOY_L),     # Joystick Left - Axis Y
+                    (KEY.JOYR_X, _axis_setter(state, 'JoyR_X'), COMPONENT_JOY_R),     # Joystick Right - Axis X
+                    (KEY.JOYR_Y, _axis_setter(state, 'JoyR_Y'), COMPONENT_JOY_R),     # Joystick Right - Axis Y
+                    (KEY.TRIG_L, _axis_setter(state, 'Trig_L'), COMPONENT_TRIG_L),    # Trigger Left - Axis
+                    (KEY.TRIG_R, _axis_setter(state, 'Trig_R'), COMPONENT_TRIG_R)]    # Trigger Right - Axis
+
+    for code, setter, component in axis_setters:
+        _add_dispatch_entry(table, KEY.AXIS_EVENT, code, setter, component)
+
+    # Button Event
+    # ------------------------------
+    button_setters = [(KEY.BTN_S, _button_setter(state, 'S'), COMPONENT_BUTTON),               # Button - Cross
+                      (KEY.BTN_E, _button_setter(state, 'E'), COMPONENT_BUTTON),               # Button - Circle
+                      (KEY.BTN_W, _button_setter(state, 'W'), COMPONENT_BUTTON),               # Button - Square
+                      (KEY.BTN_N, _button_setter(state, 'N'), COMPONENT_BUTTON),               # Button - Triangle
+                      (KEY.BTN_LB1, _button_setter(state, 'LB1'), COMPONENT_TRIG_L),           # Button - Left-Back Bumper No. 1
+                      (KEY.BTN_RB1, _button_setter(state, 'RB1'), COMPONENT_TRIG_R),           # Button - Right-Back Bumper No. 1
+                      (KEY.BTN_PBL, _button_setter(state, 'PB_L'), COMPONENT_JOY_L),           # Button - Joystick Left Push
+                      (KEY.BTN_PBR, _button_setter(state, 'PB_R'), COMPONENT_JOY_R),           # Button - Joystick Right Push
+                      (KEY.BTN_START, _button_setter(state, 'Start'), COMPONENT_BUTTON),       # Button - Start
+                      (KEY.BTN_SELECT, _button_setter(state, 'Select'), COMPONENT_BUTTON),     # Button - Select
+                      (KEY.DPAD_L, _button_setter(state, 'DPad_L'), COMPONENT_DPAD),           # D-PAD - Left
+                      (KEY.DPAD_R, _button_setter(state, 'DPad_R'), COMPONENT_DPAD),           # D-PAD - Right
+                      (KEY.DPAD_U, _button_setter(state, 'DPad_U'), COMPONENT_DPAD),           # D-PAD - Up
+                      (KEY.DPAD_D, _button_setter(state, 'DPad_D'), COMPONENT_DPAD),           # D-PAD - Down
+                      (KEY.BTN_LB2, _button_setter(state, 'LB2'), COMPONENT_TRIG_L),           # Button - Left-Back Bumper No. 2
+                      (KEY.BTN_RB2, _button_setter(state, 'RB2'), COMPONENT_TRIG_R)]           # Button - Right-Back Bumper No. 2
+
+    for code, setter, component in button_setters:
+        _add_dispatch_entry(table, KEY.BTN_EVENT, code, setter, component)
+
+    # Function Return
+    return table
+
+# Dispatch Table - Integer Event-Keys
+# ------------------------------
+def translate_dispatch_table(table : dict) -> dict:
+    """
+    Translate a Dispatch-Table from Event-Key names to integer Event-Keys
+    for backends reporting integer event types and codes
+    (entries with unknown Event-Key names are dropped)
+    :param table: Dispatch-Table with keys (ev_type, code) given by names
+    :return int_table: Dispatch-Table with integer keys (type, code)
+    """
+    int_table = dict()
+    for (ev_type, code), entry in table.items():
+        key = get_event_key(ev_type, code)
+        if key is not None:
+            int_table[key] = entry
+
+    return int_table
+
+# Dispatch Event
+# ------------------------------
+def dispatch_event(table : dict, event : any) -> int:
+    """
+    Dispatch a single incomming event through a compiled Dispatch-Table
+    :param table: Dispatch-Table (XBOX_dispatch_table / PS3_dispatch_table)
+    :param event: Element of Events from Connected Gamepad object
+    :return components: Controller Component flags changed by the event (int, 0 if not used or unchanged)
+    """
+
+    # Lookup setter for the event
+    entry = table.get((event.ev_type, event.code))
+
+    # Event not used by the controller
+    if entry is None:
+        return 0
+
+    # Assign event state
+    setter, components = entry
+    if not setter(event.state):
+        return 0
+
+    return components
+
 # Scale Input Value
 # -----------------------------
 def calc_minmax_scaling(raw_value : int,
@@ -768,7 +2211,8 @@ def calc_minmax_scaling_deadband(raw_value : int,
                                  raw_max : int,
                                  raw_db : int,
                                  min : float,
-                                 max : float) -> float:
+                                 max : float,
+                                 raw_center : float = 0) -> float:
     """
     Rescale the raw input value from range [raw_min, raw_max] to a desired range [min, max]
     with neglecting Deadband value on the raw input value 
@@ -778,29 +2222,32 @@ def calc_minmax_scaling_deadband(raw_value : int,
     :param raw_db:  Raw Deadband Value
     :param min: Scaled Minimum value
     :param max: Scaled Maximum value
+    :param raw_center: Raw Value the Deadband is centered on (default 0)
     :return value: Scaled Value
     """
 
     # Use local variable
+    # (raw values relative to the Deadband center)
     tmp_raw_value = 0
-    tmp_raw_min = raw_min + raw_db
-    tmp_raw_max = raw_max - raw_db
+    rel_raw_value = raw_value - raw_center
+    tmp_raw_min = raw_min - raw_center + raw_db
+    tmp_raw_max = raw_max - raw_center - raw_db
     tmp_raw_db_neg = (-1) * raw_db 
     tmp_raw_db_pos = raw_db
 
     # Deadband Calculation
     # -----------------------------
     # Raw value is whithin deadband range
-    if (abs(raw_value) < abs(raw_db)):
+    if (abs(rel_raw_value) < abs(raw_db)):
         tmp_raw_value = 0
 
     # Raw value is below deadband range
-    elif (raw_value < tmp_raw_db_neg):
-        tmp_raw_value = raw_value + raw_db
+    elif (rel_raw_value < tmp_raw_db_neg):
+        tmp_raw_value = rel_raw_value + raw_db
 
     # Raw value is above deadband range
-    elif (raw_value > tmp_raw_db_pos):
-        tmp_raw_value = raw_value - raw_db
+    elif (rel_raw_value > tmp_raw_db_pos):
+        tmp_raw_value = rel_raw_value - raw_db
 
     # Rescaling
     # -----------------------------
@@ -819,19 +2266,72 @@ def scale_input_joystick(raw_value : int,
     """
     Rescale the raw Joystick input value from range [raw_min, raw_max] to a desired range [min, max]
     with neglecting Joystick Deadband 
+    (Uses the Lookup-Table of the Scaling Constants for raw values within range)
     :param raw_value: Raw Input Value
     :param JOY_SCALE: Joystick Scaling Constans Dataclass 
     :return value: Scaled Value
     """
-    
+
+    # Lookup scaled value
+    # (indexed by raw value, no allocation for integer raw values)
+    if JOYSTICK_SCALING_CONST.RAW_MIN <= raw_value <= JOYSTICK_SCALING_CONST.RAW_MAX:
+        lut = JOYSTICK_SCALING_CONST._lut_raw or JOYSTICK_SCALING_CONST.get_raw_lut()
+        if lut is not None:
+            try:
+                return lut[raw_value]
+            except TypeError:
+                pass
+
+    # Raw value outside Lookup-Table
     joy_value = calc_minmax_scaling_deadband(raw_value, 
                                              JOYSTICK_SCALING_CONST.RAW_MIN,
                                              JOYSTICK_SCALING_CONST.RAW_MAX,
                                              JOYSTICK_SCALING_CONST.RAW_DB,
                                              JOYSTICK_SCALING_CONST.MIN,
-                                             JOYSTICK_SCALING_CONST.MAX)
+                                             JOYSTICK_SCALING_CONST.MAX,
+                                             JOYSTICK_SCALING_CONST.get_raw_center())
     
-    return joy_value
+    return JOYSTICK_SCALING_CONST.shape(joy_value)
+
+# Scale Input Value rounded to two decimals
+# -----------------------------
+def scale_input_rounded(raw_value : int, SCALING_CONST : _SCALING_LUT) -> float:
+    """
+    Rescale the raw Joystick or Trigger input value, rounded to two decimals
+    (Uses the pre-rounded Lookup-Table of the Scaling Constants for raw values within range)
+    :param raw_value: Raw Input Value
+    :param SCALING_CONST: Joystick or Trigger Scaling Constants Dataclass
+    :return value: Scaled and rounded Value
+    """
+
+    # Lookup scaled and rounded value
+    if SCALING_CONST.RAW_MIN <= raw_value <= SCALING_CONST.RAW_MAX:
+        lut = SCALING_CONST._lut_rounded or SCALING_CONST.get_raw_lut(rounded=True)
+        if lut is not None:
+            try:
+                return lut[raw_value]
+            except TypeError:
+                pass
+
+    # Raw value outside Lookup-Table
+    return round_value(SCALING_CONST.shape(calc_minmax_scaling_deadband(raw_value,
+                                                                        SCALING_CONST.RAW_MIN,
+                                                                        SCALING_CONST.RAW_MAX,
+                                                                        SCALING_CONST.RAW_DB,
+                                                                        SCALING_CONST.MIN,
+                                                                        SCALING_CONST.MAX,
+                                                                        SCALING_CONST.get_raw_center())))
+
+# Round Value
+# -----------------------------
+def round_value(value : float) -> float:
+    """
+    Round a scaled value to two decimals
+    (same result as the formatted rounding of the Controller Class dictionaries)
+    :param value: Scaled Value
+    :return value: Rounded Value
+    """
+    return float("{:.2f}".format(value))
 
 # Scale Trigger Input Value with Deadband
 # -----------------------------
@@ -840,16 +2340,378 @@ def scale_input_trigger(raw_value : int,
     """
     Rescale the raw Trigger input value from range [raw_min, raw_max] to a desired range [min, max]
     with neglecting Trigger Deadband 
+    (Uses the Lookup-Table of the Scaling Constants for raw values within range)
     :param raw_value: Raw Input Value
     :param TRIG_SCALE: Trigger Scaling Constans Dataclass 
     :return value: Scaled Value
     """
-    
+
+    # Lookup scaled value
+    # (indexed by raw value, no allocation for integer raw values)
+    if TRIGGER_SCALING_CONST.RAW_MIN <= raw_value <= TRIGGER_SCALING_CONST.RAW_MAX:
+        lut = TRIGGER_SCALING_CONST._lut_raw or TRIGGER_SCALING_CONST.get_raw_lut()
+        if lut is not None:
+            try:
+                return lut[raw_value]
+            except TypeError:
+                pass
+
+    # Raw value outside Lookup-Table
     trigger_value = calc_minmax_scaling_deadband(raw_value, 
                                                  TRIGGER_SCALING_CONST.RAW_MIN,
                                                  TRIGGER_SCALING_CONST.RAW_MAX,
                                                  TRIGGER_SCALING_CONST.RAW_DB,
                                                  TRIGGER_SCALING_CONST.MIN,
-                                                 TRIGGER_SCALING_CONST.MAX)
+                                                 TRIGGER_SCALING_CONST.MAX,
+                                                 TRIGGER_SCALING_CONST.get_raw_center())
     
-    return trigger_value
\ No newline at end of file
+    return trigger_value
+
+# Expo Response Curve
+# -----------------------------
+def expo_curve(expo : float):
+    """
+    Create an exponential Response Curve, blending a linear and a cubic response
+    (value = (1 - expo) * n + expo * n^3, fine control around center with full deflection kept)
+    :param expo: Expo share [0, 1]
+    :return curve: Function of the normalized magnitude [0, 1]
+    """
+    linear = 1.0 - expo
+
+    def curve(magnitude):
+        return linear * magnitude + expo * magnitude * magnitude * magnitude
+
+    return curve
+
+# Shape Value with Response Curve
+# -----------------------------
+def shape_value(value : float,
+                curve,
+                min : float,
+                max : float) -> float:
+    """
+    Apply a Response Curve to a scaled value in range [min, max],
+    on the magnitude normalized to the extent of its sign (min < 0 < max)
+    :param value: Scaled Value
+    :param curve: Function of the normalized magnitude [0, 1] or None for a linear response
+    :param min: Scaled Minimum value
+    :param max: Scaled Maximum value
+    :return value: Shaped Value
+    """
+    # Linear response, or no extent on the side of the value
+    if curve is None:
+        return value
+    extent = max if value >= 0.0 else min
+    if value == 0.0 or extent == 0.0 or (extent > 0.0) != (value > 0.0):
+        return value
+
+    magnitude = value / extent
+    if magnitude > 1.0:
+        magnitude = 1.0
+
+    return curve(magnitude) * extent
+
+# Shape Values with Response Curve (NumPy)
+# -----------------------------
+def shape_value_array(values,
+                      curve,
+                      min : float,
+                      max : float):
+    """
+    Apply a Response Curve to an array of scaled values in range [min, max]
+    (vectorized counterpart of shape_value, the curve is called with a NumPy array)
+    :param values: Scaled Values (numpy.ndarray)
+    :param curve: Function of the normalized magnitude [0, 1] or None for a linear response
+    :param min: Scaled Minimum value
+    :param max: Scaled Maximum value
+    :return values: Shaped Values (numpy.ndarray)
+    """
+    # Linear response
+    if curve is None:
+        return values
+
+    extent = np.where(values >= 0.0, max, min)
+    valid = (extent != 0.0) & ((extent > 0.0) == (values > 0.0))
+    magnitude = np.minimum(np.divide(values, extent, out=np.zeros_like(values), where=valid), 1.0)
+    return np.where(valid, np.asarray(curve(magnitude), dtype=np.float64) * extent, values)
+
+# Radial Deadzone - Magnitude
+# -----------------------------
+def calc_radial_magnitude(radius : float,
+                          deadzone : float,
+                          curve) -> float:
+    """
+    Shaped magnitude of a normalized stick vector with radial Deadzone:
+    the length within the Deadzone is neglected and the remaining range is rescaled to [0, 1]
+    before the Response Curve is applied
+    :param radius: Length of the normalized stick vector
+    :param deadzone: Radius of the Deadzone [0, 1]
+    :param curve: Function of the normalized magnitude [0, 1] or None for a linear response
+    :return magnitude: Shaped magnitude [0, 1]
+    """
+    # Within Deadzone
+    if radius <= deadzone:
+        return 0.0
+
+    magnitude = 1.0 if deadzone >= 1.0 else min((radius - deadzone) / (1.0 - deadzone), 1.0)
+    if curve is not None:
+        magnitude = curve(magnitude)
+
+    return magnitude
+
+# Scale Joystick Input Values with radial Deadzone
+# -----------------------------
+def scale_input_radial(raw_x : int,
+                       raw_y : int,
+                       JOYSTICK_SCALING_CONST : _JOYSTICK_SCALING_CONST) -> tuple:
+    """
+    Rescale the raw X and Y input values of a Joystick to the range [min, max]
+    with a radial Deadzone and the Response Curve on the length of the stick vector
+    (Uses the radial Lookup-Tables of the Scaling Constants:
+     one lookup per Axis, one square root and an interpolated gain per read)
+    :param raw_x: Raw Input Value of Axis X
+    :param raw_y: Raw Input Value of Axis Y
+    :param JOYSTICK_SCALING_CONST: Joystick Scaling Constans Dataclass
+    :return x, y: Scaled Values (tuple)
+    """
+    C = JOYSTICK_SCALING_CONST
+    axis_lut = C._radial_axis
+    gain_lut = C._radial_gain
+    if gain_lut is None:
+        axis_lut, gain_lut = C.get_radial_lut()
+
+    # Normalized Axis values [-1, 1]
+    if axis_lut is not None and C.RAW_MIN <= raw_x <= C.RAW_MAX and C.RAW_MIN <= raw_y <= C.RAW_MAX:
+        x = axis_lut[raw_x]
+        y = axis_lut[raw_y]
+    else:
+        x = calc_minmax_scaling(raw_x, C.RAW_MIN, C.RAW_MAX, -1.0, 1.0)
+        y = calc_minmax_scaling(raw_y, C.RAW_MIN, C.RAW_MAX, -1.0, 1.0)
+
+    # Gain of the stick vector
+    # (linear interpolation between the radius steps, full deflection outside the unit circle)
+    radius = math.sqrt(x * x + y * y)
+    if radius < 1.0:
+        position = radius * C._RADIAL_LUT_SIZE
+        index = int(position)
+        gain = gain_lut[index]
+        gain += (gain_lut[index + 1] - gain) * (position - index)
+    else:
+        gain = gain_lut[-1] / radius
+    x *= gain
+    y *= gain
+
+    # Scaling to range: [min , max]
+    return (x * C.MAX if x >= 0.0 else -x * C.MIN,
+            y * C.MAX if y >= 0.0 else -y * C.MIN)
+
+# Joystick Axes scaled together with radial Deadzone
+# (Generic Axis name -> Generic Axis names X and Y, index of the Axis)
+JOYSTICK_AXIS_PAIRS = {'JoyL_X' : ('JoyL_X', 'JoyL_Y', 0),
+                       'JoyL_Y' : ('JoyL_X', 'JoyL_Y', 1),
+                       'JoyR_X' : ('JoyR_X', 'JoyR_Y', 0),
+                       'JoyR_Y' : ('JoyR_X', 'JoyR_Y', 1)}
+
+# Scale Generic Axis Value
+# -----------------------------
+def scale_generic_axis(axes, name : str, SCALING_CONST : _SCALING_LUT) -> float:
+    """
+    Rescale a Generic Axis value the same way as the related Joystick or Trigger Class
+    (Deadzone shape and Response Curve of the Scaling Constants,
+     Joystick Axes with radial Deadzone are scaled together with the other Axis of the Joystick)
+    :param axes: Generic Axis Data (GenericAxisData or Frame.GenericAxis)
+    :param name: Generic Axis name (GenericAxisData member)
+    :param SCALING_CONST: Joystick or Trigger Scaling Constants Dataclass
+    :return value: Scaled Value
+    """
+    pair = JOYSTICK_AXIS_PAIRS.get(name)
+
+    # Trigger Axis
+    if pair is None:
+        return scale_input_trigger(getattr(axes, name), SCALING_CONST)
+
+    # Joystick Axis with radial Deadzone
+    if SCALING_CONST.DEADZONE == 'radial':
+        name_x, name_y, index = pair
+        return scale_input_radial(getattr(axes, name_x), getattr(axes, name_y), SCALING_CONST)[index]
+
+    # Joystick Axis with axial Deadzone
+    return scale_input_joystick(getattr(axes, name), SCALING_CONST)
+
+# Batch Scaling - Raw Input Array
+# -----------------------------
+def _as_raw_array(raw_values):
+    """
+    Convert raw input values to a NumPy array suitable for batch scaling
+    (integer values are widened to int64 to avoid overflow in the scaling)
+    :param raw_values: Raw Input Values (array-like)
+    :return raw_array: Raw Input Values (numpy.ndarray)
+    """
+
+    # NumPy is required for batch scaling
+    if np is None:
+        raise ImportError('NumPy is required for batch scaling')
+
+    raw_array = np.asarray(raw_values)
+
+    # Widen integer and boolean values
+    if raw_array.dtype.kind in 'biu':
+        return raw_array.astype(np.int64)
+
+    # Use double precision for other values
+    return raw_array.astype(np.float64, copy=False)
+
+# Batch Scale Input Values
+# -----------------------------
+def calc_minmax_scaling_array(raw_values,
+                              raw_min : int,
+                              raw_max : int,
+                              min : float,
+                              max : float):
+    """
+    Rescale an array of raw input values from range [raw_min, raw_max] to a desired range [min, max]
+    (vectorized counterpart of calc_minmax_scaling)
+    :param raw_values: Raw Input Values (numpy.ndarray or array-like)
+    :param raw_min: Raw Minimum Value
+    :param raw_max: Raw Maximum Value
+    :param min: Scaled Minimum value
+    :param max: Scaled Maximum value
+    :return values: Scaled Values (numpy.ndarray of float64)
+    """
+
+    raw_array = _as_raw_array(raw_values)
+
+    # Scaling input-values to range: [0 , 1]
+    tmp_values = (raw_array - raw_min) / (raw_max - raw_min)
+
+    # Scaling input-values to range: [min , max]
+    values = tmp_values * (max - min) + min
+
+    return values
+
+# Batch Scale Input Values with Deadband
+# -----------------------------
+def calc_minmax_scaling_deadband_array(raw_values,
+                                       raw_min : int,
+                                       raw_max : int,
+                                       raw_db : int,
+                                       min : float,
+                                       max : float,
+                                       raw_center : float = 0):
+    """
+    Rescale an array of raw input values from range [raw_min, raw_max] to a desired range [min, max]
+    with neglecting Deadband value on the raw input values
+    (vectorized counterpart of calc_minmax_scaling_deadband)
+    :param raw_values: Raw Input Values (numpy.ndarray or array-like)
+    :param raw_min: Raw Minimum Value
+    :param raw_max: Raw Maximum Value
+    :param raw_db:  Raw Deadband Value
+    :param min: Scaled Minimum value
+    :param max: Scaled Maximum value
+    :param raw_center: Raw Value the Deadband is centered on (default 0)
+    :return values: Scaled Values (numpy.ndarray of float64)
+    """
+
+    # Raw values relative to the Deadband center
+    raw_array = _as_raw_array(raw_values)
+    if raw_center:
+        raw_array = raw_array - raw_center
+
+    # Use local variable
+    tmp_raw_min = raw_min - raw_center + raw_db
+    tmp_raw_max = raw_max - raw_center - raw_db
+    tmp_raw_db_neg = (-1) * raw_db
+    tmp_raw_db_pos = raw_db
+
+    # Deadband Calculation
+    # -----------------------------
+    # (conditions evaluated in the same order as calc_minmax_scaling_deadband,
+    # raw values within deadband range or matching no condition are set to 0)
+    tmp_raw_values = np.select([np.abs(raw_array) < abs(raw_db),    # Raw value is whithin deadband range
+                                raw_array < tmp_raw_db_neg,         # Raw value is below deadband range
+                                raw_array > tmp_raw_db_pos],        # Raw value is above deadband range
+                               [0,
+                                raw_array + raw_db,
+                                raw_array - raw_db],
+                               default=0)
+
+    # Rescaling
+    # -----------------------------
+    # Scaling input-values to range: [0 , 1]
+    tmp_values = (tmp_raw_values - tmp_raw_min) / (tmp_raw_max - tmp_raw_min)
+
+    # Scaling input-values to range: [min , max]
+    values = tmp_values * (max - min) + min
+
+    return values
+
+# Batch Scale Input Values with Scaling Constants
+# -----------------------------
+def scale_input_array(raw_values,
+                      SCALING_CONST : _SCALING_LUT):
+    """
+    Rescale an array of raw Joystick or Trigger input values from range [raw_min, raw_max]
+    to a desired range [min, max] with neglecting Deadband
+    (vectorized counterpart of scale_input_joystick and scale_input_trigger)
+    (Joystick Axes with radial Deadzone are scaled together: scale_input_radial_array)
+    :param raw_values: Raw Input Values (numpy.ndarray or array-like)
+    :param SCALING_CONST: Joystick or Trigger Scaling Constans Dataclass
+    :return values: Scaled Values (numpy.ndarray of float64)
+    """
+
+    # Radial Deadzone depends on both Axis values
+    if getattr(SCALING_CONST, 'DEADZONE', 'axial') == 'radial':
+        raise ValueError('Radial Deadzone scales the X and Y Axis together, use scale_input_radial_array()')
+
+    raw_array = _as_raw_array(raw_values)
+
+    # Integer raw values within range: gather from the Lookup-Table
+    lut_array = SCALING_CONST.get_lut_array()
+    if lut_array is not None and raw_array.dtype.kind == 'i' and raw_array.size > 0:
+        if raw_array.min() >= SCALING_CONST.RAW_MIN and raw_array.max() <= SCALING_CONST.RAW_MAX:
+            return np.take(lut_array, raw_array - SCALING_CONST.RAW_MIN)
+
+    values = calc_minmax_scaling_deadband_array(raw_array,
+                                                SCALING_CONST.RAW_MIN,
+                                                SCALING_CONST.RAW_MAX,
+                                                SCALING_CONST.RAW_DB,
+                                                SCALING_CONST.MIN,
+                                                SCALING_CONST.MAX,
+                                                SCALING_CONST.get_raw_center())
+
+    return SCALING_CONST.shape_array(values)
+
+# Batch Scale Joystick Input Values with radial Deadzone
+# -----------------------------
+def scale_input_radial_array(raw_x,
+                             raw_y,
+                             JOYSTICK_SCALING_CONST : _JOYSTICK_SCALING_CONST) -> tuple:
+    """
+    Rescale arrays of raw X and Y input values of a Joystick to the range [min, max]
+    with a radial Deadzone and the Response Curve on the length of the stick vectors
+    (vectorized counterpart of scale_input_radial, same radial gain Lookup-Table)
+    :param raw_x: Raw Input Values of Axis X (numpy.ndarray or array-like)
+    :param raw_y: Raw Input Values of Axis Y (numpy.ndarray or array-like)
+    :param JOYSTICK_SCALING_CONST: Joystick Scaling Constans Dataclass
+    :return x, y: Scaled Values (tuple of numpy.ndarray of float64)
+    """
+    C = JOYSTICK_SCALING_CONST
+    gain_lut = np.asarray(C.get_radial_lut()[1], dtype=np.float64)
+
+    # Normalized Axis values [-1, 1]
+    x = calc_minmax_scaling_array(raw_x, C.RAW_MIN, C.RAW_MAX, -1.0, 1.0)
+    y = calc_minmax_scaling_array(raw_y, C.RAW_MIN, C.RAW_MAX, -1.0, 1.0)
+
+    # Gain of the stick vectors
+    # (linear interpolation between the radius steps, full deflection outside the unit circle)
+    radius = np.sqrt(x * x + y * y)
+    steps = C._RADIAL_LUT_SIZE
+    gain = np.where(radius < 1.0,
+                    np.interp(radius * steps, np.arange(steps + 1), gain_lut),
+                    gain_lut[-1] / np.maximum(radius, 1.0))
+    x = x * gain
+    y = y * gain
+
+    # Scaling to range: [min , max]
+    return (np.where(x >= 0.0, x * C.MAX, -x * C.MIN),
+            np.where(y >= 0.0, y * C.MAX, -y * C.MIN))
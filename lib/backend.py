@@ -0,0 +1,321 @@
+# Controller Backend
+# ------------------------------
+# Description:
+# Controller Backend Classes reading input events from a gamepad device
+# To be used together with the main Controller Class
+#
+# A backend reports input events as tuples (ev_type, code, state).
+# Backends with integer Event-Keys (int_keys = True) report the event type
+# and code as integers, otherwise as Event-Key names (e.g. 'Absolute', 'ABS_X')
+
+# Version
+# ------------------------------
+# 0.3   -   Device state read after dropped events (SYN_DROPPED)
+#           [18.10.2026] - Jan T. Olsen
+# 0.2   -   USB vendor/product ID of the gamepad device
+#           [18.10.2026] - Jan T. Olsen
+# 0.1   -   Bulk decoding into a reusable read buffer
+#           [18.10.2026] - Jan T. Olsen
+# 0.0   -   Initial version
+#           [18.10.2026] - Jan T. Olsen
+
+# Import packages
+import glob
+import os
+import struct
+
+import ctrl_toolbox as CtrlToolbox
+
+# Device state ioctls (Linux only)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Number of input event records read at once
+# (covers the event buffer of the kernel evdev client)
+_READ_EVENTS = 256
+
+# evdev ioctls of the device state
+# (as defined by linux/input.h: _IOC(_IOC_READ, 'E', nr, size))
+_KEY_BYTES = 0x2ff // 8 + 1                                                 # Key bitmask up to KEY_MAX
+_ABSINFO_FORMAT = '6i'                                                      # struct input_absinfo, value first
+_EVIOCGKEY = (2 << 30) | (_KEY_BYTES << 16) | (ord('E') << 8) | 0x18        # Get global Key state
+_EVIOCGABS = (2 << 30) | (struct.calcsize(_ABSINFO_FORMAT) << 16) | (ord('E') << 8) | 0x40  # + Absolute Axis code
+
+# inputs Backend Class
+# -----------------------------
+# Read input events through the inputs package
+class InputsBackend():
+    """
+    inputs Backend Class:
+    Read input events of a gamepad through the inputs package (fallback backend)
+    Events are reported with Event-Key names, e.g. ('Absolute', 'ABS_X', 1200)
+    :param gamepad: Gamepad object of the inputs package
+    """
+    # Event-Keys given by names
+    int_keys = False
+
+    # Class Constructor
+    def __init__(self, gamepad) -> None:
+
+        # Class Variables
+        self.gamepad = gamepad
+        self.name = str(gamepad)
+        self._fd = None
+
+        # USB vendor/product ID (None if unknown)
+        try:
+            self.vendor, self.product = get_evdev_id(gamepad.get_char_device_path())
+        except (AttributeError, OSError):
+            self.vendor, self.product = None, None
+
+    # Backend name
+    def __str__(self) -> str:
+        return self.name
+
+    # Read Events
+    def read(self) -> list:
+        """
+        Read the next input events (blocking)
+        :return events: Input events (ev_type, code, state) (list)
+        """
+        return [(event.ev_type, event.code, event.state) for event in self.gamepad.read()]
+
+    # Get File Descriptor
+    def fileno(self) -> int:
+        """
+        File descriptor of the character device for use with a selector
+        (opened without blocking, requires a character device as on Linux)
+        :return fd: File descriptor (int)
+        """
+        if self._fd is None:
+            self._fd = os.open(self.gamepad.get_char_device_path(), os.O_RDONLY | os.O_NONBLOCK)
+
+        return self._fd
+
+    # Read Available Events
+    def read_available(self) -> list:
+        """
+        Read all pending input events without blocking
+        (using the event conversion of the gamepad object)
+        :return events: Input events (ev_type, code, state) (list)
+        """
+        try:
+            data = os.read(self.fileno(), CtrlToolbox.EVENT_SIZE * _READ_EVENTS)
+        except BlockingIOError:
+            return []
+
+        events = [self.gamepad._make_event(*values) for values in struct.iter_unpack(CtrlToolbox.EVENT_FORMAT, data)]
+        return [(event.ev_type, event.code, event.state) for event in events]
+
+    # Read Device State
+    def resync(self, keys) -> None:
+        """
+        Device state is not read through the inputs package
+        (the partial report of dropped events is applied instead)
+        :param keys: Event-Keys (ev_type, code) of the input events (list)
+        :return events: None
+        """
+        return None
+
+    # Close Backend
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+# evdev Backend Class
+# -----------------------------
+# Read input events directly from an event device (/dev/input/eventN)
+class EvdevBackend():
+    """
+    evdev Backend Class:
+    Read input events directly from a Linux event device, without the inputs package
+    Events are reported with integer Event-Keys, e.g. (3, 0, 1200)
+    :param path: Path of the event device (e.g. '/dev/input/event9')
+    """
+    # Integer Event-Keys
+    int_keys = True
+
+    # Class Constructor
+    def __init__(self, path : str) -> None:
+
+        # Class Variables
+        self.path = os.path.realpath(path)
+        self.name = get_evdev_name(self.path)
+        self.vendor, self.product = get_evdev_id(self.path)
+        self._fd = os.open(self.path, os.O_RDONLY)
+
+        # Reusable read buffer
+        # (all pending records are drained with a single read)
+        self._buffer = bytearray(CtrlToolbox.EVENT_SIZE * _READ_EVENTS)
+        self._view = memoryview(self._buffer)
+
+    # Backend name
+    def __str__(self) -> str:
+        return self.name
+
+    # Read Events
+    def read(self) -> list:
+        """
+        Read all pending input events, blocks until at least one event is available
+        :return events: Input events (type, code, value) (list)
+        """
+        size = os.readv(self._fd, (self._buffer,))
+
+        return CtrlToolbox.decode_events(self._view[:size])
+
+    # Get File Descriptor
+    def fileno(self) -> int:
+        """
+        File descriptor of the event device for use with a selector
+        :return fd: File descriptor (int)
+        """
+        return self._fd
+
+    # Read Available Events
+    # (called when the selector reports the device as readable)
+    read_available = read
+
+    # Read Device State
+    def resync(self, keys) -> list:
+        """
+        Read the current device state after events were dropped by the kernel (SYN_DROPPED)
+        :param keys: Event-Keys (type, code) of the input events (list)
+        :return events: Current state of the Key and Absolute events (type, code, value) (list)
+                        or None if the device state cannot be read
+        """
+        if fcntl is None:
+            return None
+
+        EV_KEY = CtrlToolbox.EVENT_TYPES['Key']
+        EV_ABS = CtrlToolbox.EVENT_TYPES['Absolute']
+        try:
+            # Pressed Keys as bitmask
+            key_bits = bytearray(_KEY_BYTES)
+            fcntl.ioctl(self._fd, _EVIOCGKEY, key_bits)
+
+            events = []
+            absinfo = bytearray(struct.calcsize(_ABSINFO_FORMAT))
+            for ev_type, code in keys:
+                if ev_type == EV_KEY:
+                    events.append((ev_type, code, (key_bits[code >> 3] >> (code & 7)) & 1))
+                elif ev_type == EV_ABS:
+                    fcntl.ioctl(self._fd, _EVIOCGABS + code, absinfo)
+                    events.append((ev_type, code, struct.unpack_from(_ABSINFO_FORMAT, absinfo)[0]))
+
+        # No event device (e.g. a file of input event records)
+        except OSError:
+            return None
+
+        return events
+
+    # Close Backend
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+# Get Event Device Name
+# -----------------------------
+def get_evdev_name(path : str) -> str:
+    """
+    Get the device name of an event device
+    :param path: Path of the event device (e.g. '/dev/input/event9')
+    :return name: Device name (str)
+    """
+    try:
+        with open('/sys/class/input/{}/device/name'.format(os.path.basename(path))) as name_file:
+            return name_file.read().strip()
+    except OSError:
+        return path
+
+# Get Event Device USB ID
+# -----------------------------
+def get_evdev_id(path : str) -> tuple:
+    """
+    Get the USB vendor and product ID of an event device
+    :param path: Path of the event device (e.g. '/dev/input/event9')
+    :return vendor, product: USB IDs (int) or (None, None) if unknown
+    """
+    try:
+        device = '/sys/class/input/{}/device/id/'.format(os.path.basename(path))
+        with open(device + 'vendor') as vendor_file, open(device + 'product') as product_file:
+            return int(vendor_file.read(), 16), int(product_file.read(), 16)
+    except (OSError, ValueError):
+        return None, None
+
+# Find Event Devices of Gamepads
+# -----------------------------
+def find_evdev_gamepads() -> list:
+    """
+    Find the event devices of all connected gamepads
+    :return paths: Paths of the event devices (list)
+    """
+    paths = []
+    for link in sorted(glob.glob('/dev/input/by-id/*-event-joystick')) + sorted(glob.glob('/dev/input/by-path/*-event-joystick')):
+        path = os.path.realpath(link)
+        if path not in paths:
+            paths.append(path)
+
+    return paths
+
+# Get Backends of Connected Controllers
+# -----------------------------
+def get_backends() -> list:
+    """
+    Get a backend for every connected gamepad
+    Event devices are read directly when available, otherwise the inputs package is used
+    :return backends: Backends (list)
+    """
+    backends = []
+
+    # Read event devices directly
+    for path in find_evdev_gamepads():
+        try:
+            backends.append(EvdevBackend(path))
+        except OSError as error:
+            # Print Error
+            print('ERROR: get_backends: {}: {}'.format(path, error))
+
+    # Fallback to the inputs package
+    if not backends:
+        backends = [InputsBackend(gamepad) for gamepad in CtrlToolbox.get_controllers()]
+
+    return backends
+
+# Get Backend of Connected Controller
+# -----------------------------
+def get_backend():
+    """
+    Get a backend for the first connected gamepad
+    :return backend: Backend or None if no gamepad is connected
+    """
+    backends = get_backends()
+
+    # No connected gamepad
+    if not backends:
+        # Print Error
+        print('ERROR: get_backend: No connected gamepad found!')
+        return None
+
+    # Close unused backends
+    for backend in backends[1:]:
+        backend.close()
+
+    return backends[0]
+
+# Get Backend of Gamepad
+# -----------------------------
+def as_backend(gamepad):
+    """
+    Get a backend for a gamepad object
+    (gamepad objects of the inputs package are wrapped in an InputsBackend)
+    :param gamepad: Backend or gamepad object of the inputs package
+    :return backend: Backend
+    """
+    if gamepad is None or hasattr(gamepad, 'int_keys'):
+        return gamepad
+
+    return InputsBackend(gamepad)
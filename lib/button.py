@@ -6,6 +6,14 @@
 
 # Version
 # ------------------------------
+# 0.5   -   Packed Button bits read once per update
+#           [18.10.2026] - Jan T. Olsen
+# 0.4   -   Button edges updated in place, Button bits of the Class
+#           [18.10.2026] - Jan T. Olsen
+# 0.3   -   Preallocated read structure, dictionary built on access
+#           [18.10.2026] - Jan T. Olsen
+# 0.2   -   Button press/release counts and pressed latches
+#           [18.10.2026] - Jan T. Olsen
 # 0.1   -   Moved library files to designated folder
 #           and updated Toolbox import
 #           [30.06.2022] - Jan T. Olsen
@@ -33,7 +41,6 @@ class XboxButton():
 
         # Class Variables
         self.name = 'Btn_'
-        self.xboxButton = dict()
         self.A = 0        # Button - A
         self.B = 0        # Button - B
         self.X = 0        # Button - X
@@ -41,22 +48,95 @@ class XboxButton():
         self.Start = 0    # Button - Start
         self.Select = 0   # Button - Select
 
+        # Preallocated read structure and precomputed dictionary keys
+        self.state = CtrlToolbox.XBOX_ButtonState()
+        self._keys = tuple(self.name + member for member in CtrlToolbox.XBOX_ButtonState.__slots__)
+
+        # Button press/release counts and pressed latches since the previous update
+        # (Button names related to Generic Button names)
+        self.buttonNames = {'A' : 'S', 'B' : 'E', 'X' : 'W', 'Y' : 'N', 'Start' : 'Start', 'Select' : 'Select'}
+        self.presses, self.releases, self.pressed = CtrlToolbox.get_button_edges(self.buttonNames, dict(), dict())
+        self.buttonMask = CtrlToolbox.button_mask(*self.buttonNames.values())
+        self._edges = (self.presses, self.releases, self.pressed)
+
+        # Button bits of the Class members (in order of buttonNames)
+        self._masks = tuple(CtrlToolbox.BUTTON_MASKS[name] for name in self.buttonNames.values())
+
         # Call Update at Class construction
         self.update()
     
     # Update Joystick Value(s)
     def update(self) -> None:
 
-        # Call internal get-function
-        self.get_buttons()
-
-        # Class dictionary
-        self.xboxButton = {self.name + 'A' : self.A,
-                           self.name + 'B' : self.B,
-                           self.name + 'X' : self.X,
-                           self.name + 'Y' : self.Y,
-                           self.name + 'Start'  : self.Start,
-                           self.name + 'Select' : self.Select}
+        # Packed Button bits read once
+        # (get_buttons() would build the class dictionary)
+        buttons = self.xboxButtonData.buttons
+        mask_A, mask_B, mask_X, mask_Y, mask_Start, mask_Select = self._masks
+
+        # Assign Button values and fill read structure
+        state = self.state
+        state.A = self.A = 1 if buttons & mask_A else 0
+        state.B = self.B = 1 if buttons & mask_B else 0
+        state.X = self.X = 1 if buttons & mask_X else 0
+        state.Y = self.Y = 1 if buttons & mask_Y else 0
+        state.Start = self.Start = 1 if buttons & mask_Start else 0
+        state.Select = self.Select = 1 if buttons & mask_Select else 0
+
+    # Read Button Values
+    def read(self, state : CtrlToolbox.XBOX_ButtonState = None) -> CtrlToolbox.XBOX_ButtonState:
+        """
+        Fill a preallocated read structure with the Button values
+        :param state: Read structure to fill (None: read structure of the Buttons)
+        :return state: Filled read structure (CtrlToolbox.XBOX_ButtonState)
+        """
+        if state is None:
+            state = self.state
+
+        data = self.xboxButtonData
+        state.A = data.A
+        state.B = data.B
+        state.X = data.X
+        state.Y = data.Y
+        state.Start = data.Start
+        state.Select = data.Select
+
+        return state
+
+    # Class dictionary
+    # (built from the read structure on access)
+    @property
+    def xboxButton(self) -> dict:
+        keys = self._keys
+        return {keys[0] : self.state.A,
+                keys[1] : self.state.B,
+                keys[2] : self.state.X,
+                keys[3] : self.state.Y,
+                keys[4] : self.state.Start,
+                keys[5] : self.state.Select}
+
+    # Update Button Edges
+    def update_edges(self,
+                     presses : dict,
+                     releases : dict,
+                     previous_presses : dict = None,
+                     previous_releases : dict = None) -> None:
+        """
+        Update Button press/release counts since the previous update
+        (in place, the count dictionaries of the Class are kept)
+        :param presses: Number of presses per Generic Button name (dict)
+        :param releases: Number of releases per Generic Button name (dict)
+        :param previous_presses: Number of presses per Generic Button name at the previous update
+                                 (None: presses are counted since the previous update)
+        :param previous_releases: Number of releases per Generic Button name at the previous update
+        """
+        CtrlToolbox.update_button_edges(self.buttonNames, self._edges, presses, releases, previous_presses, previous_releases)
+
+    # Clear Button Edges
+    def clear_edges(self) -> None:
+        """
+        Reset Button press/release counts and pressed latches of the previous update
+        """
+        CtrlToolbox.clear_button_edges(self._edges)
 
     # Get Button A Value
     def get_button_A(self):
@@ -138,7 +218,6 @@ class PSButton():
 
         # Class Variables
         self.name = 'Btn_'
-        self.psButton = dict()
         self.Cross = 0       # Button - Cross
         self.Circle = 0      # Button - Circle
         self.Triangle = 0    # Button - Triangle
@@ -146,22 +225,95 @@ class PSButton():
         self.Start = 0       # Button - Start
         self.Select = 0      # Button - Select
 
+        # Preallocated read structure and precomputed dictionary keys
+        self.state = CtrlToolbox.PS_ButtonState()
+        self._keys = tuple(self.name + member for member in CtrlToolbox.PS_ButtonState.__slots__)
+
+        # Button press/release counts and pressed latches since the previous update
+        # (Button names related to Generic Button names)
+        self.buttonNames = {'Cross' : 'S', 'Circle' : 'E', 'Triangle' : 'N', 'Square' : 'W', 'Start' : 'Start', 'Select' : 'Select'}
+        self.presses, self.releases, self.pressed = CtrlToolbox.get_button_edges(self.buttonNames, dict(), dict())
+        self.buttonMask = CtrlToolbox.button_mask(*self.buttonNames.values())
+        self._edges = (self.presses, self.releases, self.pressed)
+
+        # Button bits of the Class members (in order of buttonNames)
+        self._masks = tuple(CtrlToolbox.BUTTON_MASKS[name] for name in self.buttonNames.values())
+
         # Call Update at Class construction
         self.update()
     
     # Update Joystick Value(s)
     def update(self) -> None:
 
-        # Call internal get-function
-        self.get_buttons()
-
-        # Class dictionary
-        self.psButton = {self.name + 'Cross' : self.Cross,
-                        self.name + 'Circle' : self.Circle,
-                        self.name + 'Triangle' : self.Triangle,
-                        self.name + 'Square' : self.Square,
-                        self.name + 'Start'  : self.Start,
-                        self.name + 'Select' : self.Select}
+        # Packed Button bits read once
+        # (get_buttons() would build the class dictionary)
+        buttons = self.psButtonData.buttons
+        mask_Cross, mask_Circle, mask_Triangle, mask_Square, mask_Start, mask_Select = self._masks
+
+        # Assign Button values and fill read structure
+        state = self.state
+        state.Cross = self.Cross = 1 if buttons & mask_Cross else 0
+        state.Circle = self.Circle = 1 if buttons & mask_Circle else 0
+        state.Triangle = self.Triangle = 1 if buttons & mask_Triangle else 0
+        state.Square = self.Square = 1 if buttons & mask_Square else 0
+        state.Start = self.Start = 1 if buttons & mask_Start else 0
+        state.Select = self.Select = 1 if buttons & mask_Select else 0
+
+    # Read Button Values
+    def read(self, state : CtrlToolbox.PS_ButtonState = None) -> CtrlToolbox.PS_ButtonState:
+        """
+        Fill a preallocated read structure with the Button values
+        :param state: Read structure to fill (None: read structure of the Buttons)
+        :return state: Filled read structure (CtrlToolbox.PS_ButtonState)
+        """
+        if state is None:
+            state = self.state
+
+        data = self.psButtonData
+        state.Cross = data.Cross
+        state.Circle = data.Circle
+        state.Triangle = data.Triangle
+        state.Square = data.Square
+        state.Start = data.Start
+        state.Select = data.Select
+
+        return state
+
+    # Class dictionary
+    # (built from the read structure on access)
+    @property
+    def psButton(self) -> dict:
+        keys = self._keys
+        return {keys[0] : self.state.Cross,
+                keys[1] : self.state.Circle,
+                keys[2] : self.state.Triangle,
+                keys[3] : self.state.Square,
+                keys[4] : self.state.Start,
+                keys[5] : self.state.Select}
+
+    # Update Button Edges
+    def update_edges(self,
+                     presses : dict,
+                     releases : dict,
+                     previous_presses : dict = None,
+                     previous_releases : dict = None) -> None:
+        """
+        Update Button press/release counts since the previous update
+        (in place, the count dictionaries of the Class are kept)
+        :param presses: Number of presses per Generic Button name (dict)
+        :param releases: Number of releases per Generic Button name (dict)
+        :param previous_presses: Number of presses per Generic Button name at the previous update
+                                 (None: presses are counted since the previous update)
+        :param previous_releases: Number of releases per Generic Button name at the previous update
+        """
+        CtrlToolbox.update_button_edges(self.buttonNames, self._edges, presses, releases, previous_presses, previous_releases)
+
+    # Clear Button Edges
+    def clear_edges(self) -> None:
+        """
+        Reset Button press/release counts and pressed latches of the previous update
+        """
+        CtrlToolbox.clear_button_edges(self._edges)
 
     # Get Button Cross Value
     def get_button_Cross(self) -> bool:
@@ -0,0 +1,281 @@
+# Controller Callback
+# ------------------------------
+# Description:
+# Controller Callback Classes related to edge-triggered Button callbacks
+# and Axis change callbacks
+# To be used together with the main Controller Class
+
+# Version
+# ------------------------------
+# 0.4   -   Settling Axis Filters of the Axis subscriptions stepped by update()
+#           [18.10.2026] - Jan T. Olsen
+# 0.3   -   Axis subscriptions scaled and filtered like the Joystick and Trigger Classes
+#           [18.10.2026] - Jan T. Olsen
+# 0.2   -   Scaling Constants of Axis subscriptions replaced on profile reload
+#           [18.10.2026] - Jan T. Olsen
+# 0.1   -   Button edges detected on the packed Button bits
+#           [18.10.2026] - Jan T. Olsen
+# 0.0   -   Initial version
+#           [18.10.2026] - Jan T. Olsen
+
+# Import packages
+import queue
+import threading
+
+import ctrl_toolbox as CtrlToolbox
+from lib.clock import SYSTEM_CLOCK
+from lib.filter import get_axis_filters
+
+# Callback Executor Class
+# -----------------------------
+# Run callbacks on a pool of worker threads fed by a bounded queue
+class CallbackExecutor():
+    """
+    Callback Executor Class:
+    Run callbacks on a pool of worker threads fed by a bounded queue.
+    When the queue is full, callbacks are dropped according to the drop policy,
+    so a slow callback never stalls the controller-monitor-thread
+    :param workers: Number of worker threads (int)
+    :param queue_size: Maximum number of queued callbacks (int)
+    :param drop_policy: Policy for a full queue, 'drop_newest' or 'drop_oldest' (str)
+    """
+    # Drop Policies
+    DROP_NEWEST = 'drop_newest'
+    DROP_OLDEST = 'drop_oldest'
+
+    # Class Constructor
+    def __init__(self,
+                 workers : int = 1,
+                 queue_size : int = 64,
+                 drop_policy : str = DROP_OLDEST) -> None:
+
+        # Check Drop Policy
+        if drop_policy not in (self.DROP_NEWEST, self.DROP_OLDEST):
+            raise ValueError('Unknown Drop Policy: {}'.format(drop_policy))
+
+        # Class Variables
+        self.drop_policy = drop_policy
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=queue_size)
+
+        # Start Worker threads
+        self._workers = []
+        for _ in range(workers):
+            worker = threading.Thread(target=self._worker, args=())
+            worker.daemon = True
+            worker.start()
+            self._workers.append(worker)
+
+    # Submit Callback
+    def submit(self, callback, *args) -> bool:
+        """
+        Queue a callback without blocking
+        :param callback: Function to call on a worker thread
+        :param args: Arguments of the callback
+        :return queued: Callback was queued (bool)
+        """
+        try:
+            self._queue.put_nowait((callback, args))
+            return True
+
+        # Queue is full
+        except queue.Full:
+            self.dropped += 1
+
+            # Discard the new callback
+            if self.drop_policy == self.DROP_NEWEST:
+                return False
+
+            # Discard the oldest queued callback and retry
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._queue.put_nowait((callback, args))
+                return True
+            except queue.Full:
+                return False
+
+    # Worker thread
+    def _worker(self) -> None:
+        while True:
+            callback, args = self._queue.get()
+            try:
+                callback(*args)
+            except Exception as error:
+                # Print Error
+                print('ERROR: CallbackExecutor: {!r} raised {!r}'.format(callback, error))
+
+# Subscriptions Class
+# -----------------------------
+# Detect Button edges and Axis changes between published Controller Frames
+# and submit the subscribed callbacks to the Callback Executor
+class Subscriptions():
+    """
+    Subscriptions Class:
+    Called with every published Controller Frame by the controller-monitor-thread.
+    Button press/release edges and Axis changes beyond a threshold
+    are submitted as callbacks to the Callback Executor.
+    Axis values are scaled and filtered the same way as the Joystick and Trigger Classes.
+    Axis Filters are stepped with every published Frame and, while not settled,
+    with every update() of the Controller (no Frames are published while the input is unchanged,
+    so filtered Axis callbacks settle only as long as update() is called)
+    :param executor: Callback Executor (CallbackExecutor)
+    :param frame: Latest published Controller Frame (CtrlToolbox.ControllerFrame)
+    :param clock: Clock timing the Axis Filters (lib.clock)
+    """
+    # Components related to Axes
+    AXIS_COMPONENTS = (CtrlToolbox.COMPONENT_JOY_L | CtrlToolbox.COMPONENT_JOY_R |
+                       CtrlToolbox.COMPONENT_TRIG_L | CtrlToolbox.COMPONENT_TRIG_R)
+
+    # Component of each Generic Axis
+    AXIS_COMPONENT = {'JoyL_X' : CtrlToolbox.COMPONENT_JOY_L,
+                      'JoyL_Y' : CtrlToolbox.COMPONENT_JOY_L,
+                      'JoyR_X' : CtrlToolbox.COMPONENT_JOY_R,
+                      'JoyR_Y' : CtrlToolbox.COMPONENT_JOY_R,
+                      'Trig_L' : CtrlToolbox.COMPONENT_TRIG_L,
+                      'Trig_R' : CtrlToolbox.COMPONENT_TRIG_R}
+
+    # Class Constructor
+    def __init__(self,
+                 executor : CallbackExecutor,
+                 frame : CtrlToolbox.ControllerFrame,
+                 clock = SYSTEM_CLOCK) -> None:
+
+        # Class Variables
+        self.executor = executor
+        self.clock = clock
+        self._previous = frame
+        self._lock = threading.Lock()
+        self._filter_lock = threading.Lock()    # Axis Filters stepped by the controller-monitor-thread and update()
+
+        # Subscribed callbacks
+        # (tuples replaced as a whole on change, read without locking)
+        self._button_callbacks = ()     # (name, Button bit, pressed, callback)
+        self._axis_callbacks = ()       # [name, callback, threshold, component, scaling, Axis Filter, last value]
+        self._filtered = False          # Any Axis subscription with Axis Filter
+
+    # Subscribe Button Press / Release
+    def add_button(self, name : str, pressed : bool, callback) -> None:
+        """
+        Subscribe a callback to a Button edge
+        :param name: Generic Button name (CtrlToolbox.GenericButtonData member)
+        :param pressed: Call on press (True) or release (False)
+        :param callback: Function called with the Button name
+        """
+        with self._lock:
+            self._button_callbacks += ((name, CtrlToolbox.BUTTON_MASKS[name], pressed, callback),)
+
+    # Subscribe Axis Change
+    def add_axis(self,
+                 name : str,
+                 callback,
+                 threshold : float,
+                 scaling,
+                 filter_stages : tuple = ()) -> None:
+        """
+        Subscribe a callback to changes of an Axis
+        :param name: Generic Axis name (CtrlToolbox.GenericAxisData member)
+        :param callback: Function called with the Axis name and scaled value
+        :param threshold: Minimum change of the scaled value since the last call
+        :param scaling: Scaling Constants of the Axis (Deadzone and Response Curve)
+        :param filter_stages: Filter stages of the Axis (e.g. _GAMEPAD_CONST.JOYSTICK_FILTER)
+        """
+        if name not in self.AXIS_COMPONENT:
+            raise ValueError('Unknown Axis: {}'.format(name))
+
+        # Axis Filter of the subscription
+        # (own Filter State, seeded with the current value)
+        filters = get_axis_filters(filter_stages, 1)
+        axis_filter = filters[0] if filters else None
+        value = CtrlToolbox.scale_generic_axis(self._previous.GenericAxis, name, scaling)
+        if axis_filter is not None:
+            value = axis_filter(value, self.clock.time())
+
+        with self._lock:
+            self._axis_callbacks += ([name, callback, threshold, self.AXIS_COMPONENT[name], scaling, axis_filter, value],)
+            self._filtered = self._filtered or axis_filter is not None
+
+    # Set Scaling Constants
+    def set_scaling(self, JOYSTICK_SCALING, TRIGGER_SCALING) -> None:
+        """
+        Replace the Scaling Constants of all Axis subscriptions (e.g. of a reloaded Controller profile)
+        (called by the controller-monitor-thread between reports)
+        :param JOYSTICK_SCALING: Scaling Constants of the Joystick Axes
+        :param TRIGGER_SCALING: Scaling Constants of the Trigger Axes
+        """
+        for subscription in self._axis_callbacks:
+            subscription[4] = JOYSTICK_SCALING if subscription[0] in CtrlToolbox.JOYSTICK_AXIS_PAIRS else TRIGGER_SCALING
+
+    # Remove Callback
+    def remove(self, callback) -> None:
+        """
+        Remove all subscriptions of a callback
+        :param callback: Subscribed function
+        """
+        with self._lock:
+            self._button_callbacks = tuple(item for item in self._button_callbacks if item[3] is not callback)
+            self._axis_callbacks = tuple(item for item in self._axis_callbacks if item[1] is not callback)
+            self._filtered = any(item[5] is not None for item in self._axis_callbacks)
+
+    # Published Frame
+    def __call__(self, frame : CtrlToolbox.ControllerFrame) -> None:
+        """
+        Detect Button edges and Axis changes since the previous Frame
+        (called by the controller-monitor-thread)
+        :param frame: Published Controller Frame (CtrlToolbox.ControllerFrame)
+        """
+        previous = self._previous
+        self._previous = frame
+
+        # Button edges
+        # (compared on the packed Button bits, nothing to do without an edge)
+        if self._button_callbacks:
+            buttons = frame.buttons
+            previous_buttons = previous.buttons
+            if buttons != previous_buttons:
+                pressed_buttons = CtrlToolbox.buttons_pressed(buttons, previous_buttons)
+                released_buttons = CtrlToolbox.buttons_released(buttons, previous_buttons)
+                for name, mask, pressed, callback in self._button_callbacks:
+                    if mask & (pressed_buttons if pressed else released_buttons):
+                        self.executor.submit(callback, name)
+
+        # Axis changes
+        # (Axes of changed Components and Axis Filters still settling)
+        changed = frame.changed
+        if self._axis_callbacks and (changed & self.AXIS_COMPONENTS or self._filtered):
+            with self._filter_lock:
+                self._update_axes(frame.GenericAxis, changed)
+
+    # Step settling Axis Filters
+    def settle(self) -> None:
+        """
+        Step the Axis Filters not settled yet with the latest published Frame
+        (called by update() of the Controller, time-based filters move towards the input without new Frames)
+        """
+        if self._filtered:
+            with self._filter_lock:
+                self._update_axes(self._previous.GenericAxis, 0)
+
+    # Update Axis subscriptions
+    def _update_axes(self, axes : CtrlToolbox.GenericAxisData, changed : int) -> None:
+        """
+        Scale and filter the Axes of changed Components and of settling Axis Filters,
+        submit changes beyond the threshold
+        :param axes: Generic Axis Data of the Frame (CtrlToolbox.GenericAxisData)
+        :param changed: Changed Components of the Frame (int)
+        """
+        time = None
+        for subscription in self._axis_callbacks:
+            name, callback, threshold, component, scaling, axis_filter, last_value = subscription
+            if not changed & component and (axis_filter is None or axis_filter.settled):
+                continue
+            value = CtrlToolbox.scale_generic_axis(axes, name, scaling)
+            if axis_filter is not None:
+                if time is None:
+                    time = self.clock.time()
+                value = axis_filter(value, time)
+            if abs(value - last_value) >= threshold:
+                subscription[6] = value
+                self.executor.submit(callback, name, value)
@@ -0,0 +1,85 @@
+# Controller Clock
+# ------------------------------
+# Description:
+# Controller Clock Classes providing the time base of timing-dependent features
+# (replay, recording, synthetic backends)
+# A Manual Clock runs timing-dependent features faster than real time
+
+# Version
+# ------------------------------
+# 0.0   -   Initial version
+#           [18.10.2026] - Jan T. Olsen
+
+# Import packages
+import threading
+import time
+
+# Monotonic Clock Class
+# -----------------------------
+class MonotonicClock():
+    """
+    Monotonic Clock Class:
+    Clock following the monotonic system time
+    """
+
+    # Current Time
+    def time(self) -> float:
+        """
+        :return time: Current time [s] (float)
+        """
+        return time.monotonic()
+
+    # Sleep
+    def sleep(self, seconds : float) -> None:
+        """
+        Wait for a duration
+        :param seconds: Duration [s] (float)
+        """
+        if seconds > 0:
+            time.sleep(seconds)
+
+# Manual Clock Class
+# -----------------------------
+class ManualClock():
+    """
+    Manual Clock Class:
+    Virtual clock only advanced by sleep() and advance(),
+    so timed event streams run as fast as possible with their recorded timing
+    :param start: Start time [s] (float)
+    """
+
+    # Class Constructor
+    def __init__(self, start : float = 0.0) -> None:
+
+        # Class Variables
+        self._time = start
+        self._lock = threading.Lock()
+
+    # Current Time
+    def time(self) -> float:
+        """
+        :return time: Current virtual time [s] (float)
+        """
+        return self._time
+
+    # Sleep
+    def sleep(self, seconds : float) -> None:
+        """
+        Advance the virtual time instead of waiting
+        :param seconds: Duration [s] (float)
+        """
+        if seconds > 0:
+            self.advance(seconds)
+
+    # Advance Time
+    def advance(self, seconds : float) -> None:
+        """
+        Advance the virtual time
+        :param seconds: Duration [s] (float)
+        """
+        with self._lock:
+            self._time += seconds
+
+# System Clock
+# -----------------------------
+SYSTEM_CLOCK = MonotonicClock()
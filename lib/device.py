@@ -0,0 +1,153 @@
+# Controller Device
+# ------------------------------
+# Description:
+# Controller Device Cache Class storing the resolved Device Profile
+# and the event device of each known gamepad on disk
+# To be used together with the main Controller Class
+
+# Version
+# ------------------------------
+# 0.0   -   Initial version
+#           [18.10.2026] - Jan T. Olsen
+
+# Import packages
+import json
+import os
+
+import ctrl_toolbox as CtrlToolbox
+from lib.backend import EvdevBackend
+from lib.backend import get_evdev_id
+from lib.backend import get_evdev_name
+
+# Default Device Cache file
+# ------------------------------
+def get_default_cache_path() -> str:
+    """
+    Get the default path of the Device Cache file
+    (in XDG_CACHE_HOME, default ~/.cache)
+    :return path: Path of the Device Cache file (str)
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'ctrl_devices.json')
+
+# Get Device Key
+# ------------------------------
+def get_device_key(gamepad) -> str:
+    """
+    Get the key identifying a gamepad model in the Device Cache
+    :param gamepad: Backend or gamepad object of the inputs package
+    :return key: Device key 'vendor:product:name' (str)
+    """
+    vendor = getattr(gamepad, 'vendor', None)
+    product = getattr(gamepad, 'product', None)
+    return '{:04x}:{:04x}:{}'.format(vendor or 0, product or 0, format(gamepad))
+
+# Device Cache Class
+# -----------------------------
+# Resolved Device Profiles and event devices stored in a JSON file
+class DeviceCache():
+    """
+    Device Cache Class:
+    Store the resolved Device Profile and the event device of each gamepad in a JSON file,
+    so a Controller started again opens the cached event device without enumerating all input devices
+    and takes the Device Profile without matching it again
+    (errors writing the cache are printed, the cache is only an accelerator)
+    :param path: Path of the Device Cache file (None: get_default_cache_path())
+    """
+    # Class Constructor
+    def __init__(self, path : str = None) -> None:
+
+        # Class Variables
+        self.path = path if path is not None else get_default_cache_path()
+        self.devices = self._load()
+
+    # Get Backend of cached device
+    def get_backend(self):
+        """
+        Open the event device of the most recently cached gamepad that is still connected
+        (the device name and USB ID of the event device must match the cached entry)
+        :return backend: Backend (EvdevBackend) or None if no cached gamepad is connected
+        """
+        for entry in reversed(list(self.devices.values())):
+            path = entry.get('path')
+            if not path or not os.path.exists(path):
+                continue
+
+            # Event device now used by another device
+            if get_evdev_name(path) != entry.get('name') or list(get_evdev_id(path)) != [entry.get('vendor'), entry.get('product')]:
+                continue
+
+            try:
+                return EvdevBackend(path)
+            except OSError:
+                continue
+
+        return None
+
+    # Resolve Device Profile
+    def resolve(self, gamepad) -> CtrlToolbox.DeviceProfile:
+        """
+        Get the Device Profile of a gamepad from the cache,
+        or find it in the Device Profile registry and add it to the cache
+        :param gamepad: Backend or gamepad object of the inputs package
+        :return profile: Device Profile (CtrlToolbox.DeviceProfile) or None for unknown gamepads
+        """
+        key = get_device_key(gamepad)
+        entry = self.devices.get(key)
+
+        # Cached Device Profile
+        # (re-matched if the profile is no longer registered or the event device moved)
+        path = getattr(gamepad, 'path', None)
+        if entry is not None and entry.get('path') == path:
+            profile = CtrlToolbox.DEVICE_PROFILES.get(entry.get('profile'))
+            if profile is not None:
+                return profile
+
+        # Match and cache Device Profile
+        profile = CtrlToolbox.get_device_profile(gamepad)
+        if profile is not None:
+            self.devices.pop(key, None)
+            self.devices[key] = {'profile' : profile.name,
+                                 'path' : path,
+                                 'name' : format(gamepad),
+                                 'vendor' : getattr(gamepad, 'vendor', None),
+                                 'product' : getattr(gamepad, 'product', None)}
+            self.save()
+
+        return profile
+
+    # Save Device Cache
+    def save(self) -> bool:
+        """
+        Write the Device Cache file
+        (written to a temporary file and replaced, so readers never see a partial file)
+        :return saved: Device Cache written (bool)
+        """
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temporary = self.path + '.tmp'
+            with open(temporary, 'w') as file:
+                json.dump({'devices' : self.devices}, file, indent=1)
+            os.replace(temporary, self.path)
+        except OSError as error:
+            # Print Error
+            print('ERROR: DeviceCache: {}: {}'.format(self.path, error))
+            return False
+
+        return True
+
+    # Load Device Cache
+    def _load(self) -> dict:
+        """
+        Read the Device Cache file
+        :return devices: Cached devices by Device key (dict), empty if the file is missing or invalid
+        """
+        try:
+            with open(self.path, 'r') as file:
+                devices = json.load(file).get('devices')
+        except (OSError, ValueError, AttributeError):
+            return dict()
+
+        return devices if isinstance(devices, dict) else dict()
@@ -6,6 +6,14 @@
 
 # Version
 # ------------------------------
+# 0.5   -   Packed Button bits read once per update
+#           [18.10.2026] - Jan T. Olsen
+# 0.4   -   Button edges updated in place, Button bits of the Class
+#           [18.10.2026] - Jan T. Olsen
+# 0.3   -   Preallocated read structure, dictionary built on access
+#           [18.10.2026] - Jan T. Olsen
+# 0.2   -   Button press/release counts and pressed latches
+#           [18.10.2026] - Jan T. Olsen
 # 0.1   -   Moved library files to designated folder
 #           and updated Toolbox import
 #           [30.06.2022] - Jan T. Olsen
@@ -33,26 +41,94 @@ class DPad():
 
         # Class Variables
         self.name = 'DPad_'
-        self.dPad = dict()
         self.L = 0
         self.R = 0
         self.U = 0
         self.D = 0
 
+        # Preallocated read structure and precomputed dictionary keys
+        self.state = CtrlToolbox.DPadState()
+        self._keys = tuple(self.name + member for member in CtrlToolbox.DPadState.__slots__)
+
+        # Button press/release counts and pressed latches since the previous update
+        # (Button names related to Generic Button names)
+        self.buttonNames = {'L' : 'DPad_L', 'R' : 'DPad_R', 'U' : 'DPad_U', 'D' : 'DPad_D'}
+        self.presses, self.releases, self.pressed = CtrlToolbox.get_button_edges(self.buttonNames, dict(), dict())
+        self.buttonMask = CtrlToolbox.button_mask(*self.buttonNames.values())
+        self._edges = (self.presses, self.releases, self.pressed)
+
+        # Button bits of the Class members (in order of buttonNames)
+        self._masks = tuple(CtrlToolbox.BUTTON_MASKS[name] for name in self.buttonNames.values())
+
         # Call Update at Class construction
         self.update()
     
     # Update Joystick Value(s)
     def update(self) -> None:
 
-        # Call internal get-function
-        self.get_DPad()
-        
-        # Class dictionary
-        self.dPad = {self.name + 'L' : self.L,
-                    self.name + 'R' : self.R,
-                    self.name + 'U' : self.U,
-                    self.name + 'D' : self.D}
+        # Packed Button bits read once
+        # (get_DPad() would build the class dictionary)
+        buttons = self.dPadData.buttons
+        mask_L, mask_R, mask_U, mask_D = self._masks
+
+        # Assign Button values and fill read structure
+        state = self.state
+        state.L = self.L = 1 if buttons & mask_L else 0
+        state.R = self.R = 1 if buttons & mask_R else 0
+        state.U = self.U = 1 if buttons & mask_U else 0
+        state.D = self.D = 1 if buttons & mask_D else 0
+
+    # Read D-Pad Values
+    def read(self, state : CtrlToolbox.DPadState = None) -> CtrlToolbox.DPadState:
+        """
+        Fill a preallocated read structure with the D-Pad Button values
+        :param state: Read structure to fill (None: read structure of the D-Pad)
+        :return state: Filled read structure (CtrlToolbox.DPadState)
+        """
+        if state is None:
+            state = self.state
+
+        data = self.dPadData
+        state.L = data.L
+        state.R = data.R
+        state.U = data.U
+        state.D = data.D
+
+        return state
+
+    # Class dictionary
+    # (built from the read structure on access)
+    @property
+    def dPad(self) -> dict:
+        keys = self._keys
+        return {keys[0] : self.state.L,
+                keys[1] : self.state.R,
+                keys[2] : self.state.U,
+                keys[3] : self.state.D}
+
+    # Update Button Edges
+    def update_edges(self,
+                     presses : dict,
+                     releases : dict,
+                     previous_presses : dict = None,
+                     previous_releases : dict = None) -> None:
+        """
+        Update Button press/release counts since the previous update
+        (in place, the count dictionaries of the Class are kept)
+        :param presses: Number of presses per Generic Button name (dict)
+        :param releases: Number of releases per Generic Button name (dict)
+        :param previous_presses: Number of presses per Generic Button name at the previous update
+                                 (None: presses are counted since the previous update)
+        :param previous_releases: Number of releases per Generic Button name at the previous update
+        """
+        CtrlToolbox.update_button_edges(self.buttonNames, self._edges, presses, releases, previous_presses, previous_releases)
+
+    # Clear Button Edges
+    def clear_edges(self) -> None:
+        """
+        Reset Button press/release counts and pressed latches of the previous update
+        """
+        CtrlToolbox.clear_button_edges(self._edges)
 
     # Get D-Pad Left-Button Value
     def get_button_Left(self) -> bool:
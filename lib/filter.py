@@ -0,0 +1,417 @@
+# Controller Filter
+# ------------------------------
+# Description:
+# Axis Filter Classes related to smoothing, slew limiting and hysteresis
+# of scaled Joystick and Trigger values
+# To be used together with the Joystick and Trigger Classes
+
+# Version
+# ------------------------------
+# 0.0   -   Initial version
+#           [18.10.2026] - Jan T. Olsen
+
+# Import packages
+import copy
+import math
+
+# Import optional packages
+# (only required by the vectorized filter_array())
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Filter Stage Class
+# -----------------------------
+# Base of the Axis Filter stages
+class FilterStage():
+    """
+    Filter Stage Class:
+    Base of the Axis Filter stages. A stage maps a scaled Axis value and its time [s]
+    to a filtered value, the first value passes unfiltered.
+    Custom stages override filter() and optionally filter_array()
+    :param tolerance: Output within tolerance of the input counts as settled (float)
+    """
+    # Class Constructor
+    def __init__(self, tolerance : float = 0.0) -> None:
+        self.tolerance = tolerance
+        self.reset()
+
+    # Reset Filter State
+    def reset(self) -> None:
+        self.input = None   # Previous input value
+        self.value = None   # Previous output value
+        self.time = None    # Time of the previous value [s]
+
+    # New Filter Stage
+    def copy(self):
+        """
+        Copy of the stage configuration with a reset Filter State
+        :return stage: Filter Stage (FilterStage)
+        """
+        stage = copy.copy(self)
+        stage.reset()
+        return stage
+
+    # Output settled
+    @property
+    def settled(self) -> bool:
+        return self.value is None or abs(self.value - self.input) <= self.tolerance
+
+    # Filter Value
+    def __call__(self, value : float, time : float) -> float:
+        """
+        Filter the next Axis value
+        :param value: Scaled Axis value (float)
+        :param time: Time of the value [s] (float)
+        :return value: Filtered value (float)
+        """
+        if self.value is None:
+            self.value = value
+        else:
+            self.value = self.filter(value, time - self.time)
+        self.input = value
+        self.time = time
+
+        return self.value
+
+    # Filter Function
+    def filter(self, value : float, dt : float) -> float:
+        """
+        Filtered value from the previous Filter State (self.input, self.value)
+        :param value: Scaled Axis value (float)
+        :param dt: Time since the previous value [s] (float)
+        :return value: Filtered value (float)
+        """
+        return value
+
+    # Filter Array
+    def filter_array(self, values, times):
+        """
+        Filter an array of Axis values, continuing from the current Filter State
+        (reference implementation calling the stage per value)
+        :param values: Scaled Axis values (numpy.ndarray)
+        :param times: Times of the values [s] (numpy.ndarray)
+        :return values: Filtered values (numpy.ndarray of float64)
+        """
+        filtered = np.empty(len(values))
+        for index, (value, time) in enumerate(zip(values.tolist(), times.tolist())):
+            filtered[index] = self(value, time)
+
+        return filtered
+
+    # Start of a vectorized Filter Array
+    def _start_array(self, values, times) -> tuple:
+        # Time steps to the previous value, first value passes unfiltered without Filter State
+        # (returns float values, time steps and the previous output value)
+        values = np.asarray(values, dtype=np.float64)
+        times = np.asarray(times, dtype=np.float64)
+        if self.value is None:
+            self.value = self.input = values[0]
+            self.time = times[0]
+        dt = np.diff(times, prepend=self.time)
+
+        return values, dt, self.value
+
+    # End of a vectorized Filter Array
+    def _end_array(self, values, times, filtered):
+        # Store the Filter State of the last value
+        if len(filtered):
+            self.input = float(values[-1])
+            self.value = float(filtered[-1])
+            self.time = float(times[-1])
+
+        return filtered
+
+# Exponential Moving Average
+# -----------------------------
+class EMAFilter(FilterStage):
+    """
+    EMA Filter Class:
+    Exponential moving average with a time constant,
+    independent of the rate of incomming values
+    :param time_constant: Time constant [s] (float)
+    :param tolerance: Output within tolerance of the input counts as settled (float)
+    """
+    # Class Constructor
+    def __init__(self,
+                 time_constant : float,
+                 tolerance : float = 0.005) -> None:
+        self.time_constant = time_constant
+        super().__init__(tolerance)
+
+    # Filter Function
+    def filter(self, value : float, dt : float) -> float:
+        alpha = _ema_alpha(dt, self.time_constant)
+        return self.value + alpha * (value - self.value)
+
+    # Filter Array (vectorized)
+    def filter_array(self, values, times):
+        values, dt, previous = self._start_array(values, times)
+        alpha = _ema_alpha_array(dt, self.time_constant)
+        return self._end_array(values, times, _recurrence(values, alpha, previous))
+
+# One-Euro Filter
+# -----------------------------
+class OneEuroFilter(FilterStage):
+    """
+    One-Euro Filter Class:
+    Adaptive low-pass filter, smoothing slow movements (jitter)
+    while following fast movements with little lag
+    (G. Casiez, N. Roussel, D. Vogel: 1 Euro Filter, CHI 2012)
+    :param min_cutoff: Minimum cutoff frequency [Hz] (float)
+    :param beta: Increase of the cutoff frequency with speed (float)
+    :param d_cutoff: Cutoff frequency of the speed estimate [Hz] (float)
+    :param tolerance: Output within tolerance of the input counts as settled (float)
+    """
+    # Class Constructor
+    def __init__(self,
+                 min_cutoff : float = 1.0,
+                 beta : float = 0.0,
+                 d_cutoff : float = 1.0,
+                 tolerance : float = 0.005) -> None:
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        super().__init__(tolerance)
+
+    # Reset Filter State
+    def reset(self) -> None:
+        super().reset()
+        self.speed = 0.0    # Filtered speed of the input value [1/s]
+
+    # Filter Function
+    def filter(self, value : float, dt : float) -> float:
+        if dt <= 0.0:
+            return self.value
+
+        # Filtered speed and adaptive cutoff frequency
+        speed = (value - self.input) / dt
+        self.speed += _cutoff_alpha(dt, self.d_cutoff) * (speed - self.speed)
+        cutoff = self.min_cutoff + self.beta * abs(self.speed)
+
+        return self.value + _cutoff_alpha(dt, cutoff) * (value - self.value)
+
+    # Filter Array (vectorized)
+    def filter_array(self, values, times):
+        previous_input = self.input
+        values, dt, previous = self._start_array(values, times)
+        if previous_input is None:
+            previous_input = previous
+        valid = dt > 0.0
+        safe_dt = np.where(valid, dt, 1.0)
+
+        # Filtered speed and adaptive cutoff frequency
+        speed = np.where(valid, np.diff(values, prepend=previous_input) / safe_dt, 0.0)
+        speed_alpha = np.where(valid, _cutoff_alpha(safe_dt, self.d_cutoff), 0.0)
+        # (speed and value are held for steps without time, alpha = 0)
+        speed = _recurrence(speed, speed_alpha, self.speed)
+        cutoff = self.min_cutoff + self.beta * np.abs(speed)
+
+        alpha = np.where(valid, _cutoff_alpha(safe_dt, cutoff), 0.0)
+        filtered = _recurrence(values, alpha, previous)
+        if len(speed):
+            self.speed = float(speed[-1])
+
+        return self._end_array(values, times, filtered)
+
+# Slew Limit
+# -----------------------------
+class SlewLimit(FilterStage):
+    """
+    Slew Limit Class:
+    Limit the rate of change of the Axis value
+    :param rate: Maximum change per second [scaled units/s] (float)
+    """
+    # Class Constructor
+    def __init__(self, rate : float) -> None:
+        self.rate = rate
+        super().__init__()
+
+    # Filter Function
+    def filter(self, value : float, dt : float) -> float:
+        step = self.rate * dt
+        return self.value + max(-step, min(step, value - self.value))
+
+# Change Hysteresis
+# -----------------------------
+class Hysteresis(FilterStage):
+    """
+    Hysteresis Class:
+    Hold the Axis value until the input moved by at least the threshold,
+    suppressing jitter around a resting value
+    :param threshold: Minimum change of the input [scaled units] (float)
+    """
+    # Class Constructor
+    def __init__(self, threshold : float) -> None:
+        self.threshold = threshold
+        super().__init__()
+
+    # Held values do not change over time
+    @property
+    def settled(self) -> bool:
+        return True
+
+    # Filter Function
+    def filter(self, value : float, dt : float) -> float:
+        if abs(value - self.value) >= self.threshold:
+            return value
+        return self.value
+
+# Function Stage
+# -----------------------------
+class FunctionStage(FilterStage):
+    """
+    Function Stage Class:
+    Custom stage calling a function with the value, the time step
+    and the previous output
+    :param function: Function (value, dt, previous) -> filtered value
+    """
+    # Class Constructor
+    def __init__(self, function) -> None:
+        self.function = function
+        super().__init__()
+
+    # Filter Function
+    def filter(self, value : float, dt : float) -> float:
+        return self.function(value, dt, self.value)
+
+# Axis Filter Class
+# -----------------------------
+# Pipeline of Filter stages for one Axis
+class AxisFilter():
+    """
+    Axis Filter Class:
+    Pipeline of Filter stages applied to one scaled Axis value,
+    evaluated incrementally with every new value
+    :param stages: Filter stages, used as configuration for new stages (FilterStage),
+                   or functions (value, dt, previous) -> filtered value
+    """
+    # Class Constructor
+    def __init__(self, stages) -> None:
+        self.stages = tuple(stage.copy() if isinstance(stage, FilterStage) else FunctionStage(stage)
+                            for stage in stages)
+
+    # Filter Value
+    def __call__(self, value : float, time : float) -> float:
+        """
+        Filter the next Axis value through all stages
+        :param value: Scaled Axis value (float)
+        :param time: Time of the value [s] (float)
+        :return value: Filtered value (float)
+        """
+        for stage in self.stages:
+            value = stage(value, time)
+        return value
+
+    # Output settled
+    @property
+    def settled(self) -> bool:
+        """
+        All stages settled (the output no longer changes without new input)
+        :return settled: (bool)
+        """
+        for stage in self.stages:
+            if not stage.settled:
+                return False
+        return True
+
+    # Reset Filter State
+    def reset(self) -> None:
+        for stage in self.stages:
+            stage.reset()
+
+    # Filter Array
+    def filter_array(self, values, times):
+        """
+        Filter an array of recorded Axis values through all stages
+        (vectorized stages process the whole array at once, continuing from the current Filter State)
+        :param values: Scaled Axis values (numpy.ndarray or array-like)
+        :param times: Times of the values [s] (numpy.ndarray or array-like)
+        :return values: Filtered values (numpy.ndarray of float64)
+        """
+        if np is None:
+            raise ImportError('filter_array requires numpy')
+
+        values = np.asarray(values, dtype=np.float64)
+        times = np.asarray(times, dtype=np.float64)
+        if len(values) != len(times):
+            raise ValueError('values and times differ in length')
+        if not len(values):
+            return values
+
+        for stage in self.stages:
+            values = stage.filter_array(values, times)
+        return values
+
+# Build Axis Filters
+# -----------------------------
+def get_axis_filters(stages, count : int) -> tuple:
+    """
+    Axis Filters of a Controller Class from the Filter stages of a Controller Constants profile
+    :param stages: Filter stages (tuple, e.g. _GAMEPAD_CONST.JOYSTICK_FILTER)
+    :param count: Number of Axes (int)
+    :return filters: Axis Filter per Axis (tuple), empty without Filter stages
+    """
+    if not stages:
+        return ()
+    return tuple(AxisFilter(stages) for _ in range(count))
+
+# Filter Coefficients
+# -----------------------------
+def _ema_alpha(dt : float, time_constant : float) -> float:
+    # Smoothing factor of an exponential moving average for a time step
+    if time_constant <= 0.0:
+        return 1.0
+    return 1.0 - math.exp(-max(dt, 0.0) / time_constant)
+
+def _ema_alpha_array(dt, time_constant : float):
+    if time_constant <= 0.0:
+        return np.ones_like(dt)
+    return 1.0 - np.exp(-np.maximum(dt, 0.0) / time_constant)
+
+def _cutoff_alpha(dt, cutoff):
+    # Smoothing factor of a low-pass filter with a cutoff frequency [Hz]
+    # (scalar or numpy.ndarray)
+    tau = 1.0 / (2.0 * math.pi * cutoff)
+    return 1.0 / (1.0 + tau / dt)
+
+# Linear Recurrence
+# -----------------------------
+# Maximum number of values solved in closed form at once
+_RECURRENCE_CHUNK = 64
+
+def _recurrence(values, alpha, initial : float):
+    """
+    Solve y[n] = y[n-1] + alpha[n] * (values[n] - y[n-1]) with y[-1] = initial
+    in closed form per chunk: y[n] = c[n] * (initial + sum(alpha[k] * values[k] / c[k])),
+    with c[n] the product of (1 - alpha[k]) up to n.
+    Chunks with a decay factor close to zero are solved value by value
+    :param values: Input values (numpy.ndarray)
+    :param alpha: Smoothing factors (numpy.ndarray)
+    :param initial: Output before the first value (float)
+    :return values: Output values (numpy.ndarray of float64)
+    """
+    filtered = np.empty(len(values))
+    previous = float(initial)
+    for start in range(0, len(values), _RECURRENCE_CHUNK):
+        x = values[start:start + _RECURRENCE_CHUNK]
+        a = alpha[start:start + _RECURRENCE_CHUNK]
+        decay = 1.0 - a
+
+        # Closed form (product of decay factors stays far from underflow)
+        if decay.min() > 1e-3:
+            c = np.cumprod(decay)
+            y = c * (previous + np.cumsum(a * x / c))
+
+        # Value by value
+        else:
+            y = np.empty(len(x))
+            for index, (value, factor) in enumerate(zip(x.tolist(), a.tolist())):
+                previous = previous + factor * (value - previous)
+                y[index] = previous
+
+        filtered[start:start + len(x)] = y
+        previous = float(y[-1])
+
+    return filtered
@@ -6,6 +6,18 @@
 
 # Version
 # ------------------------------
+# 0.7   -   Joystick Data read once per update
+#           [18.10.2026] - Jan T. Olsen
+# 0.6   -   Button edges updated in place, Button bits of the Class
+#           [18.10.2026] - Jan T. Olsen
+# 0.5   -   Radial Deadzone and Response Curves from the Scaling Constants
+#           [18.10.2026] - Jan T. Olsen
+# 0.4   -   Axis Filter pipelines from the Controller Constants profile
+#           [18.10.2026] - Jan T. Olsen
+# 0.3   -   Preallocated read structure, dictionary built on access
+#           [18.10.2026] - Jan T. Olsen
+# 0.2   -   Button press/release counts and pressed latches
+#           [18.10.2026] - Jan T. Olsen
 # 0.1   -   Moved library files to designated folder
 #           and updated Toolbox import
 #           [30.06.2022] - Jan T. Olsen
@@ -14,6 +26,8 @@
 
 # Import packages
 import ctrl_toolbox as CtrlToolbox
+from lib.clock import SYSTEM_CLOCK
+from lib.filter import get_axis_filters
 
 # Joystick Class
 # -----------------------------
@@ -26,36 +40,152 @@ class Joystick():
     Joystick values are calculated with correct scaling with data from Gamepad-Constants
     :param GAMEPAD_CONST: Controller Constants (CtrlToolbox._GAMEPAD_CONST)
     :param JoystickData: Joystick Data (CtrlToolbox.JoystickData)
+    :param clock: Clock timing the Axis Filters (lib.clock)
     """
     # Class Constructor
     def __init__(self, 
                 name : str, 
-                GAMEPAD_CONST : CtrlToolbox._GAMEPAD_CONST):
+                GAMEPAD_CONST : CtrlToolbox._GAMEPAD_CONST,
+                clock = SYSTEM_CLOCK):
 
         # Joystick Data
         self.joystickData = CtrlToolbox.JoystickData()
 
         # Class Variables
         self.name = name
-        self.joy = dict()
         self.X = 0.0
         self.Y = 0.0
         self.PB = 0
         self.ScalingData = GAMEPAD_CONST.JOYSTICK_SCALING
 
+        # Axis Filters of X and Y (empty without Filter stages in the Controller Constants)
+        self.filters = get_axis_filters(GAMEPAD_CONST.JOYSTICK_FILTER, 2)
+        self.clock = clock
+
+        # Preallocated read structure and precomputed dictionary keys
+        self.state = CtrlToolbox.JoystickState()
+        self._keys = (name + 'X', name + 'Y', name + 'PB')
+
+        # Button press/release counts and pressed latches since the previous update
+        # (Button names related to Generic Button names)
+        self.buttonNames = {'PB' : 'PB_' + name[-1]}
+        self.presses, self.releases, self.pressed = CtrlToolbox.get_button_edges(self.buttonNames, dict(), dict())
+        self.buttonMask = CtrlToolbox.button_mask(*self.buttonNames.values())
+        self._edges = (self.presses, self.releases, self.pressed)
+
+        # Button bit of the Pushbutton
+        self._mask_PB = CtrlToolbox.BUTTON_MASKS[self.buttonNames['PB']]
+
         # Call Update at Class construction
         self.update()
     
     # Update Joystick Value(s)
     def update(self) -> None:
         
-        # Call internal get-function
-        self.get_joystick()
-
-        # Class dictionary
-        self.joy = {self.name + 'X' : float("{:.2f}".format(self.X)),
-                    self.name + 'Y' : float("{:.2f}".format(self.Y)),
-                    self.name + 'PB' : self.PB}
+        # Raw Axis values and packed Button bits read once
+        # (get_joystick() would build the class dictionary)
+        data = self.joystickData
+        raw_x = data.X
+        raw_y = data.Y
+        scaling = self.ScalingData
+        state = self.state
+        state.PB = self.PB = 1 if data.buttons & self._mask_PB else 0
+
+        # Radial Deadzone: X and Y scaled together
+        # (round() equals round_value() here)
+        if scaling.DEADZONE == 'radial':
+            x, y = CtrlToolbox.scale_input_radial(raw_x, raw_y, scaling)
+            state.X = round(x, 2)
+            state.Y = round(y, 2)
+
+        # Axial Deadzone
+        # (rounded values taken from the rounded Lookup-Table)
+        else:
+            x = CtrlToolbox.scale_input_joystick(raw_x, scaling)
+            y = CtrlToolbox.scale_input_joystick(raw_y, scaling)
+            state.X = CtrlToolbox.scale_input_rounded(raw_x, scaling)
+            state.Y = CtrlToolbox.scale_input_rounded(raw_y, scaling)
+
+        # Filter Axis values
+        if self.filters:
+            time = self.clock.time()
+            x = self.filters[0](x, time)
+            y = self.filters[1](y, time)
+            state.X = CtrlToolbox.round_value(x)
+            state.Y = CtrlToolbox.round_value(y)
+
+        self.X = x
+        self.Y = y
+
+    # Read Joystick Values
+    def read(self, state : CtrlToolbox.JoystickState = None) -> CtrlToolbox.JoystickState:
+        """
+        Fill a preallocated read structure with the Joystick values rounded to two decimals
+        (allocation free for raw values within the scaling range)
+        :param state: Read structure to fill (None: read structure of the Joystick)
+        :return state: Filled read structure (CtrlToolbox.JoystickState)
+        """
+        if state is None:
+            state = self.state
+
+        data = self.joystickData
+        # (filtered values of the latest update)
+        if self.filters:
+            state.X = CtrlToolbox.round_value(self.X)
+            state.Y = CtrlToolbox.round_value(self.Y)
+        # (radial Deadzone scales X and Y together, round() equals round_value() here)
+        elif self.ScalingData.DEADZONE == 'radial':
+            x, y = CtrlToolbox.scale_input_radial(data.X, data.Y, self.ScalingData)
+            state.X = round(x, 2)
+            state.Y = round(y, 2)
+        else:
+            state.X = CtrlToolbox.scale_input_rounded(data.X, self.ScalingData)
+            state.Y = CtrlToolbox.scale_input_rounded(data.Y, self.ScalingData)
+        state.PB = data.PB
+
+        return state
+
+    # Class dictionary
+    # (built from the read structure on access)
+    @property
+    def joy(self) -> dict:
+        keys = self._keys
+        return {keys[0] : self.state.X,
+                keys[1] : self.state.Y,
+                keys[2] : self.state.PB}
+
+    # Axis Filters settled
+    # (the filtered values no longer change without new input)
+    @property
+    def settled(self) -> bool:
+        for axis_filter in self.filters:
+            if not axis_filter.settled:
+                return False
+        return True
+
+    # Update Button Edges
+    def update_edges(self,
+                     presses : dict,
+                     releases : dict,
+                     previous_presses : dict = None,
+                     previous_releases : dict = None) -> None:
+        """
+        Update Button press/release counts since the previous update
+        (in place, the count dictionaries of the Class are kept)
+        :param presses: Number of presses per Generic Button name (dict)
+        :param releases: Number of releases per Generic Button name (dict)
+        :param previous_presses: Number of presses per Generic Button name at the previous update
+                                 (None: presses are counted since the previous update)
+        :param previous_releases: Number of releases per Generic Button name at the previous update
+        """
+        CtrlToolbox.update_button_edges(self.buttonNames, self._edges, presses, releases, previous_presses, previous_releases)
+
+    # Clear Button Edges
+    def clear_edges(self) -> None:
+        """
+        Reset Button press/release counts and pressed latches of the previous update
+        """
+        CtrlToolbox.clear_button_edges(self._edges)
 
     # Get Joystick Pushbutton Value
     def get_button_PB(self) -> bool:
@@ -68,7 +198,11 @@ class Joystick():
     # Get Joystick Axis-X Value
     def get_axis_X(self) -> float:
         # Get and Scale Axis Value
-        self.X = CtrlToolbox.scale_input_joystick(self.joystickData.X, self.ScalingData)
+        # (radial Deadzone depends on both Axis values)
+        if self.ScalingData.DEADZONE == 'radial':
+            self.X = CtrlToolbox.scale_input_radial(self.joystickData.X, self.joystickData.Y, self.ScalingData)[0]
+        else:
+            self.X = CtrlToolbox.scale_input_joystick(self.joystickData.X, self.ScalingData)
 
         # Function Return
         return self.X    
@@ -76,7 +210,11 @@ class Joystick():
     # Get Joystick Axis-Y Value
     def get_axis_Y(self) -> float:
         # Get and Scale Axis Value
-        self.Y = CtrlToolbox.scale_input_joystick(self.joystickData.Y, self.ScalingData)
+        # (radial Deadzone depends on both Axis values)
+        if self.ScalingData.DEADZONE == 'radial':
+            self.Y = CtrlToolbox.scale_input_radial(self.joystickData.X, self.joystickData.Y, self.ScalingData)[1]
+        else:
+            self.Y = CtrlToolbox.scale_input_joystick(self.joystickData.Y, self.ScalingData)
 
         # Function Return
         return self.Y   
@@ -84,8 +222,18 @@ class Joystick():
     # Get Joystick Axis Values
     def get_axes(self) -> tuple:
         # Call internal get axis value
-        self.X = self.get_axis_X()
-        self.Y = self.get_axis_Y()
+        # (radial Deadzone: both Axis values scaled together)
+        if self.ScalingData.DEADZONE == 'radial':
+            self.X, self.Y = CtrlToolbox.scale_input_radial(self.joystickData.X, self.joystickData.Y, self.ScalingData)
+        else:
+            self.X = self.get_axis_X()
+            self.Y = self.get_axis_Y()
+
+        # Filter Axis values
+        if self.filters:
+            time = self.clock.time()
+            self.X = self.filters[0](self.X, time)
+            self.Y = self.filters[1](self.Y, time)
 
         # Function Return
         return (self.X, self.Y)
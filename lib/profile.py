@@ -0,0 +1,105 @@
+# Controller Profile
+# ------------------------------
+# Description:
+# Controller Profile Watcher reloading a Controller profile file on change
+# To be used together with the main Controller Class
+
+# Version
+# ------------------------------
+# 0.1   -   Any reload error keeps the Watcher running
+#           [18.10.2026] - Jan T. Olsen
+# 0.0   -   Initial version
+#           [18.10.2026] - Jan T. Olsen
+
+# Import packages
+import os
+import threading
+
+# Profile Watcher Class
+# -----------------------------
+# Poll the modification of a profile file on a designated thread
+class ProfileWatcher():
+    """
+    Profile Watcher Class:
+    Poll the modification time and size of a profile file on a designated thread
+    and call the reload function when the file has changed
+    (reload errors are printed, the previous profile stays in use)
+    :param path: Path of the profile file (str)
+    :param reload: Function called with the path of the changed profile file
+    :param interval: Polling interval in seconds (float)
+    """
+    # Class Constructor
+    def __init__(self,
+                 path : str,
+                 reload,
+                 interval : float = 1.0) -> None:
+
+        # Class Variables
+        self.path = path
+        self.reload = reload
+        self.interval = interval
+        self.reloads = 0
+        self._signature = self._get_signature()
+        self._stop = threading.Event()
+
+        # Start Watcher thread
+        self._thread = threading.Thread(target=self._watch, args=())
+        self._thread.daemon = True
+        self._thread.start()
+
+    # Stop Watcher
+    def stop(self) -> None:
+        """
+        Stop polling the profile file
+        """
+        self._stop.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+
+    # Check profile file
+    def check(self) -> bool:
+        """
+        Reload the profile file if it has changed since the previous check
+        :return reloaded: Profile file reloaded (bool)
+        """
+        signature = self._get_signature()
+        if signature == self._signature:
+            return False
+        self._signature = signature
+
+        # Profile file removed
+        # (keep the previous profile until a file appears again)
+        if signature is None:
+            return False
+
+        # Reload profile
+        # (any error of the reload function, the Watcher thread keeps polling)
+        try:
+            self.reload(self.path)
+        except Exception as error:
+            # Print Error
+            print('ERROR: ProfileWatcher: {}: {}'.format(self.path, error))
+            return False
+
+        self.reloads += 1
+        return True
+
+    # Get profile file signature
+    def _get_signature(self) -> tuple:
+        """
+        Get the modification time and size of the profile file
+        :return signature: (mtime_ns, size) or None if the file does not exist
+        """
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+
+        return (stat.st_mtime_ns, stat.st_size)
+
+    # Profile Watcher
+    def _watch(self) -> None:
+
+        # Poll profile file until stopped
+        while not self._stop.wait(self.interval):
+            self.check()
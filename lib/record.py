@@ -0,0 +1,283 @@
+# Controller Record
+# ------------------------------
+# Description:
+# Controller Record Classes for recording the incomming event stream of a Controller
+# and replaying a recording as Backend of a Controller
+# To be used together with the main Controller Class
+#
+# Recording file layout (little-endian, append-only):
+# Header:   magic (8 bytes), USB vendor ID (uint16), USB product ID (uint16), name length (uint16),
+#           gamepad name (utf-8) (USB IDs 0 if unknown)
+# Records:  time since start of recording [s] (float64), type (uint16), code (uint16), value (int32)
+# (recordings of version 1 have no USB IDs in the header: magic, name length, gamepad name)
+
+# Version
+# ------------------------------
+# 0.2   -   USB vendor/product ID of the gamepad in the header (recording version 2)
+#           [18.10.2026] - Jan T. Olsen
+# 0.1   -   Injectable clock
+#           [18.10.2026] - Jan T. Olsen
+# 0.0   -   Initial version
+#           [18.10.2026] - Jan T. Olsen
+
+# Import packages
+import struct
+import threading
+
+import ctrl_toolbox as CtrlToolbox
+from lib.clock import SYSTEM_CLOCK
+
+# Recording File Constants
+RECORD_MAGIC = b'CTRLREC2'
+RECORD_HEADER = struct.Struct('<8sHHH')
+RECORD_EVENT = struct.Struct('<dHHi')
+
+# Recording File Constants - Version 1 (read only)
+RECORD_MAGIC_V1 = b'CTRLREC1'
+RECORD_HEADER_V1 = struct.Struct('<8sH')
+
+# Event Recorder Class
+# -----------------------------
+# Tap the incomming event stream of a Controller and write it to a recording file
+class EventRecorder():
+    """
+    Event Recorder Class:
+    Write every incomming event of a Controller with its timestamp to a recording file.
+    Events are appended by the controller-monitor-thread through an event listener.
+    An existing recording of the same gamepad is continued.
+    :param controller: Controller to record (Controller)
+    :param path: Path of the recording file (str)
+    :param clock: Clock for the event timestamps (lib.clock.MonotonicClock / ManualClock)
+    """
+
+    # Class Constructor
+    def __init__(self,
+                 controller,
+                 path : str,
+                 clock = SYSTEM_CLOCK) -> None:
+
+        # Class Variables
+        self.controller = controller
+        self.path = path
+        self.clock = clock
+        self.count = 0
+        self._keys = dict()     # Event-Key names -> integer Event-Keys
+        self._int_keys = controller.gamepad.int_keys
+        self._lock = threading.Lock()
+
+        # Open recording file for appending
+        self._file = open(path, 'ab')
+
+        # New recording: write header
+        # (USB IDs 0 if unknown)
+        name = str(controller.gamepad)
+        if self._file.tell() == 0:
+            vendor = getattr(controller.gamepad, 'vendor', None) or 0
+            product = getattr(controller.gamepad, 'product', None) or 0
+            self._file.write(RECORD_HEADER.pack(RECORD_MAGIC, vendor, product, len(name.encode('utf-8'))) + name.encode('utf-8'))
+            self._offset = 0.0
+
+        # Continued recording: continue after the last complete record
+        else:
+            (record_name, _, _, offset), events = _read_recording(path)
+            if record_name != name:
+                self._file.close()
+                raise ValueError('Recording of another gamepad: {}'.format(record_name))
+            self._file.truncate(offset + len(events) * RECORD_EVENT.size)
+            self._offset = events[-1][0] if events else 0.0
+
+        self._start = clock.time()
+
+        # Tap event stream
+        controller._add_listener('_event_listeners', self)
+
+    # Incomming event
+    def __call__(self, event) -> None:
+        """
+        Append an incomming event to the recording file
+        (called by the controller-monitor-thread)
+        :param event: Input event (ev_type, code, state)
+        """
+        timestamp = self.clock.time() - self._start + self._offset
+        ev_type, code, state = event
+
+        # Convert Event-Key names to integer Event-Keys
+        # (events with unknown names are not used by the Dispatch-Table and are skipped)
+        if not self._int_keys:
+            key = self._keys.get((ev_type, code), False)
+            if key is False:
+                key = self._keys[(ev_type, code)] = CtrlToolbox.get_event_key(ev_type, code)
+            if key is None:
+                return
+            ev_type, code = key
+
+        with self._lock:
+            if self._file is not None:
+                self._file.write(RECORD_EVENT.pack(timestamp, ev_type, code, state))
+                self.count += 1
+
+    # Close Recorder
+    def close(self) -> None:
+        """
+        Stop recording and close the recording file
+        """
+        self.controller._remove_listener('_event_listeners', self)
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+# Replay Backend Class
+# -----------------------------
+# Feed a recording through the Dispatch-Table of a Controller
+class ReplayBackend():
+    """
+    Replay Backend Class:
+    Backend reading the events of a recording file, one report at a time.
+    Replays in real time or as fast as possible, and optionally in a loop (load generator).
+    After the last report, read() blocks and the finished event is set.
+    The gamepad name and USB IDs of the recording identify the Backend (Device Profile).
+    :param path: Path of the recording file (str)
+    :param realtime: Replay with the recorded timing (bool)
+    :param loop: Restart at the end of the recording (bool)
+    :param clock: Clock for the replay timing (lib.clock.MonotonicClock / ManualClock)
+    """
+    # Integer Event-Keys
+    int_keys = True
+
+    # Class Constructor
+    def __init__(self,
+                 path : str,
+                 realtime : bool = True,
+                 loop : bool = False,
+                 clock = SYSTEM_CLOCK) -> None:
+
+        # Read recording
+        # (USB vendor/product ID None if unknown or not recorded)
+        (self.name, self.vendor, self.product, _), events = _read_recording(path)
+
+        # Class Variables
+        self.path = path
+        self.realtime = realtime
+        self.loop = loop
+        self.clock = clock
+        self.finished = threading.Event()
+        self._reports = _split_reports(events)
+        self._index = 0
+        self._start = None
+
+    # Backend name
+    def __str__(self) -> str:
+        return self.name
+
+    # Read Events
+    def read(self) -> list:
+        """
+        Read the events of the next report
+        :return events: Input events (type, code, value) (list)
+        """
+
+        # End of recording
+        if self._index >= len(self._reports):
+            if not self.loop or not self._reports:
+                self.finished.set()
+                threading.Event().wait()
+            self._index = 0
+            self._start = None
+
+        timestamp, events = self._reports[self._index]
+        self._index += 1
+
+        # Wait for the recorded time of the report
+        if self.realtime:
+            if self._start is None:
+                self._start = self.clock.time() - timestamp
+            self.clock.sleep(self._start + timestamp - self.clock.time())
+
+        return events
+
+    # Close Backend
+    def close(self) -> None:
+        pass
+
+# Read Recording
+# -----------------------------
+def read_recording(path : str) -> tuple:
+    """
+    Read a recording file
+    :param path: Path of the recording file (str)
+    :return name: Recorded gamepad name (str)
+    :return events: Recorded events (timestamp, type, code, value) (list)
+    """
+    (name, _, _, _), events = _read_recording(path)
+
+    return name, events
+
+# Read Recording Header
+# -----------------------------
+def read_recording_header(path : str) -> tuple:
+    """
+    Read the header of a recording file
+    :param path: Path of the recording file (str)
+    :return name, vendor, product: Recorded gamepad name (str) and USB IDs (int, None if unknown)
+    """
+    (name, vendor, product, _), _ = _read_recording(path)
+
+    return name, vendor, product
+
+# Read Recording File
+# -----------------------------
+def _read_recording(path : str) -> tuple:
+    """
+    Read the header and the events of a recording file (version 1 or 2)
+    :param path: Path of the recording file (str)
+    :return header: Gamepad name, USB vendor ID, USB product ID (None if unknown), size of the header (tuple)
+    :return events: Recorded events (timestamp, type, code, value) (list)
+    """
+    with open(path, 'rb') as record_file:
+        data = record_file.read()
+
+    # Check header
+    magic = data[:len(RECORD_MAGIC)]
+    if magic == RECORD_MAGIC:
+        _, vendor, product, name_size = RECORD_HEADER.unpack_from(data)
+        start = RECORD_HEADER.size
+    elif magic == RECORD_MAGIC_V1:
+        _, name_size = RECORD_HEADER_V1.unpack_from(data)
+        vendor, product = 0, 0
+        start = RECORD_HEADER_V1.size
+    else:
+        raise ValueError('Not a controller recording: {}'.format(path))
+    offset = start + name_size
+    name = data[start:offset].decode('utf-8')
+
+    # Whole records only
+    # (a recording interrupted while writing may end with a partial record)
+    size = (len(data) - offset) // RECORD_EVENT.size * RECORD_EVENT.size
+    events = list(RECORD_EVENT.iter_unpack(memoryview(data)[offset:offset + size]))
+
+    return (name, vendor or None, product or None, offset), events
+
+# Split Recording into Reports
+# -----------------------------
+def _split_reports(events : list) -> list:
+    """
+    Split recorded events into reports ending with a Sync Report event
+    :param events: Recorded events (timestamp, type, code, value) (list)
+    :return reports: Reports (timestamp of the last event, events (type, code, value)) (list)
+    """
+    sync = (CtrlToolbox.EVENT_TYPES['Sync'], CtrlToolbox.EVENT_CODES['SYN_REPORT'])
+
+    reports = []
+    report = []
+    for timestamp, ev_type, code, value in events:
+        report.append((ev_type, code, value))
+        if (ev_type, code) == sync:
+            reports.append((timestamp, report))
+            report = []
+
+    # Unterminated last report
+    if report:
+        reports.append((events[-1][0], report))
+
+    return reports
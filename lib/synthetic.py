@@ -0,0 +1,203 @@
+# Controller Synthetic
+# ------------------------------
+# Description:
+# Controller Synthetic Backend Class generating scripted or random event streams
+# without a connected gamepad
+# To be used together with the main Controller Class
+
+# Version
+# ------------------------------
+# 0.1   -   USB vendor/product ID per profile
+#           [18.10.2026] - Jan T. Olsen
+# 0.0   -   Initial version
+#           [18.10.2026] - Jan T. Olsen
+
+# Import packages
+import random
+import threading
+
+import ctrl_toolbox as CtrlToolbox
+from lib.clock import SYSTEM_CLOCK
+
+# Synthetic Backend Class
+# -----------------------------
+# Fake gamepad device reporting as XBOX or PS3 Controller
+class SyntheticBackend():
+    """
+    Synthetic Backend Class:
+    Backend generating reports of input events for a XBOX or PS3 Controller profile.
+    Reports are scripted or random, generated at a given rate or as fast as possible.
+    After the last report, read() blocks and the finished event is set.
+    :param profile: Controller profile, 'XBOX' or 'PS3' (str)
+    :param reports: Scripted reports, each a list of events (type, code, value)
+                    with integer or named Event-Keys (None: random reports)
+    :param rate: Reports per second (None: as fast as possible)
+    :param count: Number of reports (None: all scripted reports, endless random reports)
+    :param loop: Repeat the scripted reports (bool)
+    :param seed: Seed of the random reports
+    :param clock: Clock for the report timing (lib.clock.MonotonicClock / ManualClock)
+    """
+    # Integer Event-Keys
+    int_keys = True
+
+    # Gamepad names per profile
+    # (recognized by CtrlToolbox.get_controller_type)
+    NAMES = {'XBOX' : 'Microsoft X-Box One S pad (synthetic)',
+             'PS3'  : 'Sony PLAYSTATION(R)3 Controller (synthetic)'}
+
+    # USB vendor/product IDs per profile
+    # (recognized by CtrlToolbox.get_device_profile)
+    IDS = {'XBOX' : (0x045e, 0x02ea),
+           'PS3'  : (0x054c, 0x0268)}
+
+    # Class Constructor
+    def __init__(self,
+                 profile : str = 'XBOX',
+                 reports : list = None,
+                 rate : float = None,
+                 count : int = None,
+                 loop : bool = False,
+                 seed = None,
+                 clock = SYSTEM_CLOCK) -> None:
+
+        # Check profile
+        if profile not in self.NAMES:
+            raise ValueError('Unknown Controller profile: {}'.format(profile))
+
+        # Class Variables
+        self.profile = profile
+        self.name = self.NAMES[profile]
+        self.vendor, self.product = self.IDS[profile]
+        self.rate = rate
+        self.loop = loop
+        self.clock = clock
+        self.sent = 0
+        self.finished = threading.Event()
+        self._random = random.Random(seed)
+        self._start = None
+
+        # Scripted reports
+        if reports is not None:
+            self._reports = [_script_report(report) for report in reports]
+            self.count = count if count is not None else (None if loop else len(self._reports))
+
+        # Random reports
+        else:
+            self._reports = None
+            self._inputs = _profile_inputs(profile)
+            self.count = count
+
+    # Backend name
+    def __str__(self) -> str:
+        return self.name
+
+    # Read Events
+    def read(self) -> list:
+        """
+        Generate the events of the next report
+        :return events: Input events (type, code, value) (list)
+        """
+
+        # Last report sent
+        if self.count is not None and self.sent >= self.count or self._reports == []:
+            self.finished.set()
+            threading.Event().wait()
+
+        # Wait for the time of the report
+        if self.rate:
+            if self._start is None:
+                self._start = self.clock.time()
+            self.clock.sleep(self._start + self.sent / self.rate - self.clock.time())
+
+        # Next report
+        if self._reports is not None:
+            events = self._reports[self.sent % len(self._reports)]
+        else:
+            events = self._random_report()
+        self.sent += 1
+
+        return events
+
+    # Random Report
+    def _random_report(self) -> list:
+        """
+        Generate a report of random inputs
+        :return events: Input events (type, code, value) (list)
+        """
+        inputs = self._random.sample(self._inputs, self._random.randint(1, 3))
+        events = [(ev_type, code, self._random.randint(minimum, maximum)) for ev_type, code, minimum, maximum in inputs]
+        events.append(_SYNC_REPORT)
+
+        return events
+
+    # Close Backend
+    def close(self) -> None:
+        pass
+
+# Sync Report event
+_SYNC_REPORT = (CtrlToolbox.EVENT_TYPES['Sync'], CtrlToolbox.EVENT_CODES['SYN_REPORT'], 0)
+
+# Scripted Report
+# -----------------------------
+def _script_report(report : list) -> list:
+    """
+    Convert a scripted report to integer Event-Keys, terminated by a Sync Report event
+    :param report: Events (type, code, value) with integer or named Event-Keys (list)
+    :return events: Input events (type, code, value) (list)
+    """
+    events = []
+    for ev_type, code, value in report:
+        if isinstance(ev_type, str):
+            key = CtrlToolbox.get_event_key(ev_type, code)
+            if key is None:
+                raise ValueError('Unknown Event-Key: ({}, {})'.format(ev_type, code))
+            ev_type, code = key
+        events.append((ev_type, code, value))
+
+    if not events or events[-1][:2] != _SYNC_REPORT[:2]:
+        events.append(_SYNC_REPORT)
+
+    return events
+
+# Profile Inputs
+# -----------------------------
+def _profile_inputs(profile : str) -> list:
+    """
+    Get the Axis and Button inputs of a Controller profile with their raw-input range
+    :param profile: Controller profile, 'XBOX' or 'PS3' (str)
+    :return inputs: Inputs (type, code, minimum, maximum) (list)
+    """
+    GAMEPAD_CONST = CtrlToolbox.XBOXONE_CONST() if profile == 'XBOX' else CtrlToolbox.PS3_CONST()
+    EVENTKEY = GAMEPAD_CONST.EVENTKEY
+    JOYSTICK = GAMEPAD_CONST.JOYSTICK_SCALING
+    TRIGGER = GAMEPAD_CONST.TRIGGER_SCALING
+
+    # Axis inputs with raw-input range
+    axes = [(EVENTKEY.AXIS_EVENT, EVENTKEY.JOYL_X, JOYSTICK.RAW_MIN, JOYSTICK.RAW_MAX),
+            (EVENTKEY.AXIS_EVENT, EVENTKEY.JOYL_Y, JOYSTICK.RAW_MIN, JOYSTICK.RAW_MAX),
+            (EVENTKEY.AXIS_EVENT, EVENTKEY.JOYR_X, JOYSTICK.RAW_MIN, JOYSTICK.RAW_MAX),
+            (EVENTKEY.AXIS_EVENT, EVENTKEY.JOYR_Y, JOYSTICK.RAW_MIN, JOYSTICK.RAW_MAX),
+            (EVENTKEY.AXIS_EVENT, EVENTKEY.TRIG_L, TRIGGER.RAW_MIN, TRIGGER.RAW_MAX),
+            (EVENTKEY.AXIS_EVENT, EVENTKEY.TRIG_R, TRIGGER.RAW_MIN, TRIGGER.RAW_MAX),
+            (EVENTKEY.AXIS_EVENT, EVENTKEY.DPAD_X, -1, 1),
+            (EVENTKEY.AXIS_EVENT, EVENTKEY.DPAD_Y, -1, 1)]
+
+    # Button inputs
+    buttons = [(EVENTKEY.BTN_EVENT, code, 0, 1) for code in (EVENTKEY.DPAD_L, EVENTKEY.DPAD_R,
+                                                             EVENTKEY.DPAD_U, EVENTKEY.DPAD_D,
+                                                             EVENTKEY.BTN_S, EVENTKEY.BTN_E,
+                                                             EVENTKEY.BTN_W, EVENTKEY.BTN_N,
+                                                             EVENTKEY.BTN_LB1, EVENTKEY.BTN_RB1,
+                                                             EVENTKEY.BTN_LB2, EVENTKEY.BTN_RB2,
+                                                             EVENTKEY.BTN_PBL, EVENTKEY.BTN_PBR,
+                                                             EVENTKEY.BTN_START, EVENTKEY.BTN_SELECT)]
+
+    # Integer Event-Keys
+    # (inputs with Event-Key names unknown to the profile are skipped)
+    inputs = []
+    for ev_type, code, minimum, maximum in axes + buttons:
+        key = CtrlToolbox.get_event_key(ev_type, code)
+        if key is not None:
+            inputs.append(key + (minimum, maximum))
+
+    return inputs
@@ -6,6 +6,16 @@
 
 # Version
 # ------------------------------
+# 0.6   -   Trigger Data read once per update
+#           [18.10.2026] - Jan T. Olsen
+# 0.5   -   Button edges updated in place, Button bits of the Class
+#           [18.10.2026] - Jan T. Olsen
+# 0.4   -   Axis Filter pipeline from the Controller Constants profile
+#           [18.10.2026] - Jan T. Olsen
+# 0.3   -   Preallocated read structure, dictionary built on access
+#           [18.10.2026] - Jan T. Olsen
+# 0.2   -   Button press/release counts and pressed latches
+#           [18.10.2026] - Jan T. Olsen
 # 0.1   -   Moved library files to designated folder
 #           and updated Toolbox import
 #           [30.06.2022] - Jan T. Olsen
@@ -14,6 +24,8 @@
 
 # Import packages
 import ctrl_toolbox as CtrlToolbox
+from lib.clock import SYSTEM_CLOCK
+from lib.filter import get_axis_filters
 
 # Trigger Class
 # -----------------------------
@@ -26,37 +38,128 @@ class Trigger():
     Trigger values are calculated with correct scaling with data from Gamepad-Constants
     :param GAMEPAD_CONST: Controller Constants (CtrlToolbox._GAMEPAD_CONST)
     :param TriggerData: Trigger Data (CtrlToolbox.JoystickData)
+    :param clock: Clock timing the Axis Filter (lib.clock)
     """
     # Class Constructor
     def __init__(self,
                 name : str, 
-                GAMEPAD_CONST : CtrlToolbox._GAMEPAD_CONST) -> None:
+                GAMEPAD_CONST : CtrlToolbox._GAMEPAD_CONST,
+                clock = SYSTEM_CLOCK) -> None:
 
         # Trigger Data
         self.triggerData = CtrlToolbox.TriggerData()
 
         # Class Variables
         self.name = name
-        self.trigger = dict()
         self.Val = 0
         self.B1 = 0
         self.B2 = 0
         self.ScalingDataConstants = GAMEPAD_CONST.TRIGGER_SCALING
 
+        # Axis Filter (empty without Filter stages in the Controller Constants)
+        self.filters = get_axis_filters(GAMEPAD_CONST.TRIGGER_FILTER, 1)
+        self.clock = clock
+
+        # Preallocated read structure and precomputed dictionary keys
+        self.state = CtrlToolbox.TriggerState()
+        self._keys = (name + 'T', name + 'B1', name + 'B2')
+
+        # Button press/release counts and pressed latches since the previous update
+        # (Button names related to Generic Button names)
+        self.buttonNames = {'B1' : name + 'B1', 'B2' : name + 'B2'}
+        self.presses, self.releases, self.pressed = CtrlToolbox.get_button_edges(self.buttonNames, dict(), dict())
+        self.buttonMask = CtrlToolbox.button_mask(*self.buttonNames.values())
+        self._edges = (self.presses, self.releases, self.pressed)
+
+        # Button bits of the Class members (in order of buttonNames)
+        self._masks = tuple(CtrlToolbox.BUTTON_MASKS[name] for name in self.buttonNames.values())
+
         # Call Update at Class construction
         self.update()
     
     # Update Joystick Value(s)
     def update(self) -> None:
 
-        # Call internal get-function
-        self.get_trigger()
-
-        # Class dictionary
-        self.trigger = {self.name + 'T'  : float("{:.2f}".format(self.Val)),
-                        self.name + 'B1' : self.B1,
-                        self.name + 'B2' : self.B2}
-
+        # Raw Axis value and packed Button bits read once
+        # (get_trigger() would build the class dictionary)
+        data = self.triggerData
+        raw_value = data.VAL
+        buttons = data.buttons
+        mask_B1, mask_B2 = self._masks
+        scaling = self.ScalingDataConstants
+
+        # Assign values and fill read structure
+        # (filtered value rounded, otherwise taken from the rounded Lookup-Table)
+        state = self.state
+        self.Val = CtrlToolbox.scale_input_trigger(raw_value, scaling)
+        if self.filters:
+            self.Val = self.filters[0](self.Val, self.clock.time())
+            state.T = CtrlToolbox.round_value(self.Val)
+        else:
+            state.T = CtrlToolbox.scale_input_rounded(raw_value, scaling)
+        state.B1 = self.B1 = 1 if buttons & mask_B1 else 0
+        state.B2 = self.B2 = 1 if buttons & mask_B2 else 0
+
+    # Read Trigger Values
+    def read(self, state : CtrlToolbox.TriggerState = None) -> CtrlToolbox.TriggerState:
+        """
+        Fill a preallocated read structure with the Trigger values rounded to two decimals
+        (allocation free for raw values within the scaling range)
+        :param state: Read structure to fill (None: read structure of the Trigger)
+        :return state: Filled read structure (CtrlToolbox.TriggerState)
+        """
+        if state is None:
+            state = self.state
+
+        data = self.triggerData
+        # (filtered value of the latest update)
+        if self.filters:
+            state.T = CtrlToolbox.round_value(self.Val)
+        else:
+            state.T = CtrlToolbox.scale_input_rounded(data.VAL, self.ScalingDataConstants)
+        state.B1 = data.B1
+        state.B2 = data.B2
+
+        return state
+
+    # Class dictionary
+    # (built from the read structure on access)
+    @property
+    def trigger(self) -> dict:
+        keys = self._keys
+        return {keys[0] : self.state.T,
+                keys[1] : self.state.B1,
+                keys[2] : self.state.B2}
+
+    # Axis Filter settled
+    # (the filtered value no longer changes without new input)
+    @property
+    def settled(self) -> bool:
+        return not self.filters or self.filters[0].settled
+
+    # Update Button Edges
+    def update_edges(self,
+                     presses : dict,
+                     releases : dict,
+                     previous_presses : dict = None,
+                     previous_releases : dict = None) -> None:
+        """
+        Update Button press/release counts since the previous update
+        (in place, the count dictionaries of the Class are kept)
+        :param presses: Number of presses per Generic Button name (dict)
+        :param releases: Number of releases per Generic Button name (dict)
+        :param previous_presses: Number of presses per Generic Button name at the previous update
+                                 (None: presses are counted since the previous update)
+        :param previous_releases: Number of releases per Generic Button name at the previous update
+        """
+        CtrlToolbox.update_button_edges(self.buttonNames, self._edges, presses, releases, previous_presses, previous_releases)
+
+    # Clear Button Edges
+    def clear_edges(self) -> None:
+        """
+        Reset Button press/release counts and pressed latches of the previous update
+        """
+        CtrlToolbox.clear_button_edges(self._edges)
 
     # Get Trigger Back-Bumper No. 1 Value
     def get_button_B1(self) -> bool:
@@ -79,6 +182,10 @@ class Trigger():
         # Scale Axis Value
         self.Val = CtrlToolbox.scale_input_trigger(self.triggerData.VAL, self.ScalingDataConstants)
 
+        # Filter Axis value
+        if self.filters:
+            self.Val = self.filters[0](self.Val, self.clock.time())
+
         # Function Return
         return self.Val    
 
@@ -0,0 +1,201 @@
+# Controller Allocation
+# ------------------------------
+# Description:
+# Allocation accounting of the event and update hot paths using tracemalloc
+# Reports allocated bytes, allocated memory blocks and retained memory
+# per processed event and per update() call
+#
+# Usage:
+# python test/allocation.py             Report allocations of all operations
+# (budgets are checked by test/allocation_test.py)
+
+# Version
+# ------------------------------
+# 0.1   -   Memory blocks allocated per event
+#           [18.10.2026] - Jan T. Olsen
+# 0.0   -   Initial version
+#           [18.10.2026] - Jan T. Olsen
+
+# Import packages
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import ctrl_toolbox as CtrlToolbox
+from ctrl_main import Controller
+from lib.joystick import Joystick
+from lib.trigger import Trigger
+from lib.dpad import DPad
+from lib.button import XboxButton
+from lib.synthetic import SyntheticBackend
+
+# Measure Allocations
+# ------------------------------
+def measure(operation,
+            iterations : int = 2000,
+            events : int = 1,
+            prepare = None) -> dict:
+    """
+    Measure the allocations of an operation with tracemalloc
+    Tracing starts before the warm-up, so memory allocated earlier and freed
+    during the measurement does not distort the result.
+    Memory allocated by the measurement itself is subtracted
+    :param operation: Function without arguments
+    :param iterations: Number of measured calls (int)
+    :param events: Number of input events handled per call (int)
+    :param prepare: Function without arguments called before each call, not measured
+    :return result: Allocations per event (dict):
+                    bytes: High-water mark of memory allocated during a call
+                    blocks: Memory blocks allocated during a call and still allocated at its end
+                            (None if tracemalloc was already tracing)
+                    retained_bytes: Memory still allocated after the calls
+                    retained_blocks: Memory blocks still allocated after the calls
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    gc_enabled = gc.isenabled()
+    gc.disable()
+
+    try:
+        # Warm up (Lookup-Tables, caches and free-lists)
+        for _ in range(iterations):
+            if prepare is not None:
+                prepare()
+            operation()
+
+        blocks_before = _traced_blocks()
+        memory_before, _ = tracemalloc.get_traced_memory()
+
+        # Memory allocated during each call
+        allocated = _allocated(operation, iterations, prepare)
+
+        # Memory allocated by the measurement itself
+        overhead = _allocated(_no_operation, iterations, prepare and _no_operation)
+
+        memory_after, _ = tracemalloc.get_traced_memory()
+        blocks_after = _traced_blocks()
+
+        # Memory blocks allocated during each call
+        # (tracing restarted per call, so only blocks of the call are traced)
+        blocks = None
+        if not was_tracing:
+            tracemalloc.stop()
+            block_calls = min(iterations, _BLOCK_ITERATIONS)
+            blocks = _allocated_blocks(operation, block_calls, prepare) / (block_calls * events)
+
+    finally:
+        if gc_enabled:
+            gc.enable()
+        if not was_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    calls = iterations * events
+    return {'bytes' : max(0.0, allocated - overhead) / calls,
+            'blocks' : blocks,
+            'retained_bytes' : (memory_after - memory_before) / calls,
+            'retained_blocks' : (blocks_after - blocks_before) / calls}
+
+# Allocated Memory
+# ------------------------------
+def _allocated(operation, iterations : int, prepare) -> int:
+    # Sum of the high-water marks of traced memory above the start of each call
+    allocated = 0
+    for _ in range(iterations):
+        if prepare is not None:
+            prepare()
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        operation()
+        _, peak = tracemalloc.get_traced_memory()
+        allocated += peak - current
+    return allocated
+
+def _no_operation() -> None:
+    pass
+
+# Allocated Memory Blocks
+# ------------------------------
+# Number of calls traced for the allocated memory blocks
+# (a snapshot per call)
+_BLOCK_ITERATIONS = 200
+
+def _allocated_blocks(operation, iterations : int, prepare) -> int:
+    # Sum of the memory blocks allocated during each call and still allocated at its end
+    # (temporaries freed within the call are covered by the high-water mark of the bytes)
+    blocks = 0
+    for _ in range(iterations):
+        if prepare is not None:
+            prepare()
+        tracemalloc.start()
+        operation()
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        blocks += len(snapshot.traces)
+        del snapshot
+    return blocks
+
+# Traced Memory Blocks
+# ------------------------------
+def _traced_blocks() -> int:
+    snapshot = tracemalloc.take_snapshot()
+    blocks = sum(statistic.count for statistic in snapshot.statistics('filename'))
+    del snapshot
+    return blocks
+
+# Operations
+# ------------------------------
+# Alternating reports of 3 input events and Sync Report
+REPORTS = ([(3, 0x00, 20000), (3, 0x05, 200), (1, 0x130, 1), (0, 0x00, 0)],
+           [(3, 0x00, -20000), (3, 0x05, 100), (1, 0x130, 0), (0, 0x00, 0)])
+
+# Alternating reports of Axis events only
+AXIS_REPORTS = ([(3, 0x00, 20000), (3, 0x05, 200), (0, 0x00, 0)],
+                [(3, 0x00, -20000), (3, 0x05, 100), (0, 0x00, 0)])
+
+def _alternating_reports(controller, reports = REPORTS):
+    index = [0]
+    def process():
+        index[0] ^= 1
+        controller._process_events(reports[index[0]])
+    return process
+
+def operations() -> dict:
+    """
+    Measured operations
+    :return operations: Name -> (function, number of input events per call, preparation) (dict)
+    """
+    joystick = Joystick('JOY_L', CtrlToolbox.XBOXONE_CONST())
+    joystick.joystickData.X = 20000
+    trigger = Trigger('L', CtrlToolbox.XBOXONE_CONST())
+    trigger.triggerData.VAL = 200
+
+    events_controller = Controller(SyntheticBackend('XBOX'), monitor=False)
+    process = _alternating_reports(events_controller)
+
+    update_controller = Controller(SyntheticBackend('XBOX'), monitor=False)
+    update_process = _alternating_reports(update_controller)
+
+    axis_controller = Controller(SyntheticBackend('XBOX'), monitor=False)
+    axis_process = _alternating_reports(axis_controller, AXIS_REPORTS)
+
+    idle_controller = Controller(SyntheticBackend('XBOX'), monitor=False)
+
+    return {'Joystick.update' : (joystick.update, 1, None),
+            'Trigger.update' : (trigger.update, 1, None),
+            'XboxButton.update' : (XboxButton().update, 1, None),
+            'DPad.update' : (DPad().update, 1, None),
+            'Controller._process_events (per event)' : (process, len(REPORTS[0]), None),
+            'Controller.update (buttons, per call)' : (update_controller.update, 1, update_process),
+            'Controller.update (axes, per call)' : (axis_controller.update, 1, axis_process),
+            'Controller.update (unchanged, per call)' : (idle_controller.update, 1, None)}
+
+# Main Function
+# ------------------------------
+if __name__ == '__main__':
+    print('{:<42} {:>10} {:>8} {:>16} {:>17}'.format('Operation', 'bytes', 'blocks', 'retained bytes', 'retained blocks'))
+    for name, (operation, events, prepare) in operations().items():
+        result = measure(operation, events=events, prepare=prepare)
+        print('{:<42} {:>10.1f} {:>8.2f} {:>16.2f} {:>17.3f}'.format(name, result['bytes'], result['blocks'], result['retained_bytes'], result['retained_blocks']))
@@ -0,0 +1,89 @@
+# Allocation Budget Test
+# ------------------------------
+# Description:
+# Allocation budgets of the event and update hot paths
+# (allocations measured with tracemalloc, see test/allocation.py)
+
+# Version
+# ------------------------------
+# 0.3   -   Budgets of the allocated memory blocks
+#           [18.10.2026] - Jan T. Olsen
+# 0.2   -   Budget of the in-place Button edges
+#           [18.10.2026] - Jan T. Olsen
+# 0.1   -   Budgets of the array-backed Controller State
+#           [18.10.2026] - Jan T. Olsen
+# 0.0   -   Initial version
+#           [18.10.2026] - Jan T. Olsen
+
+# Import packages
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import allocation
+
+# Allocation Budgets
+# ------------------------------
+# High-water mark of allocated bytes per call or per event
+# (measured on CPython 3.11 with about 50 % headroom,
+#  the Controller Classes and an unchanged update() allocate nothing,
+#  except the int objects of raw Axis values read from the Controller State)
+BUDGETS = {'Joystick.update' : 48,
+           'Trigger.update' : 8,
+           'XboxButton.update' : 8,
+           'DPad.update' : 8,
+           'Controller._process_events (per event)' : 410,
+           'Controller.update (buttons, per call)' : 350,
+           'Controller.update (axes, per call)' : 280,
+           'Controller.update (unchanged, per call)' : 8}
+
+# Memory blocks allocated per call or per event and still allocated at its end
+# (the published Frame of a report, nothing for the Controller Classes and update())
+BLOCK_BUDGETS = {'Controller._process_events (per event)' : 3.5}
+BLOCKS = 0.5
+
+# Memory retained per call or per event
+# (no memory may accumulate in the hot paths)
+RETAINED_BYTES = 1.0
+RETAINED_BLOCKS = 0.1
+
+# Check Budgets
+def _check(name):
+    operation, events, prepare = allocation.operations()[name]
+    result = allocation.measure(operation, events=events, prepare=prepare)
+    assert result['bytes'] <= BUDGETS[name], '{}: {:.1f} bytes exceeds budget of {} bytes'.format(name, result['bytes'], BUDGETS[name])
+    blocks = BLOCK_BUDGETS.get(name, BLOCKS)
+    assert result['blocks'] <= blocks, '{}: {:.2f} blocks exceeds budget of {} blocks'.format(name, result['blocks'], blocks)
+    assert result['retained_bytes'] <= RETAINED_BYTES, '{}: retains {:.2f} bytes'.format(name, result['retained_bytes'])
+    assert result['retained_blocks'] <= RETAINED_BLOCKS, '{}: retains {:.3f} blocks'.format(name, result['retained_blocks'])
+
+def test_joystick_update():
+    _check('Joystick.update')
+
+def test_trigger_update():
+    _check('Trigger.update')
+
+def test_button_update():
+    _check('XboxButton.update')
+
+def test_dpad_update():
+    _check('DPad.update')
+
+def test_process_events():
+    _check('Controller._process_events (per event)')
+
+def test_controller_update_buttons():
+    _check('Controller.update (buttons, per call)')
+
+def test_controller_update_axes():
+    _check('Controller.update (axes, per call)')
+
+def test_controller_update_unchanged():
+    _check('Controller.update (unchanged, per call)')
+
+# Main Function
+# ------------------------------
+if __name__ == '__main__':
+    for name in BUDGETS:
+        _check(name)
+    print('Allocation Budgets: OK')
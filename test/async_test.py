@@ -0,0 +1,159 @@
+# Asynchronous Controller Test
+# ------------------------------
+# Description:
+# Test of the asyncio interface of the Controller:
+# Controller.frames() and Controller.next_event()
+
+# Version
+# ------------------------------
+# 0.3   -   Test gamepad of the shared test helpers
+#           [18.10.2026] - Jan T. Olsen
+# 0.2   -   Failing Event listeners and closed event-loops of next_event()
+#           [18.10.2026] - Jan T. Olsen
+# 0.1   -   Failing Frame listeners and closed event-loops
+#           [18.10.2026] - Jan T. Olsen
+# 0.0   -   Initial version
+#           [18.10.2026] - Jan T. Olsen
+
+# Import packages
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import ctrl_toolbox as CtrlToolbox
+from ctrl_main import Controller
+from lib.synthetic import SyntheticBackend
+from helpers import get_controller
+
+# Latest Frame first, then every Frame with changes to the given Components
+def test_frames():
+    controller, gamepad = get_controller()
+
+    async def consume():
+        frames = controller.frames(CtrlToolbox.COMPONENT_BUTTON)
+        frame = await asyncio.wait_for(frames.__anext__(), timeout=5.0)
+        assert frame.version == 0
+        assert len(controller._frame_listeners) == 1
+
+        # Button pressed
+        gamepad.send(('Key', 'BTN_SOUTH', 1))
+        frame = await asyncio.wait_for(frames.__anext__(), timeout=5.0)
+        assert frame.Button.A == 1
+
+        # Joystick change skipped, Button release yielded
+        gamepad.send(('Absolute', 'ABS_X', 12000))
+        gamepad.send(('Key', 'BTN_SOUTH', 0))
+        frame = await asyncio.wait_for(frames.__anext__(), timeout=5.0)
+        assert frame.Button.A == 0 and frame.JoyL.X == 12000
+
+        # Listener removed when the iterator is closed
+        await frames.aclose()
+        assert controller._frame_listeners == ()
+
+    asyncio.run(consume())
+
+# Slow consumer receives the latest Frame and skips older ones
+def test_frames_latest():
+    controller, gamepad = get_controller()
+
+    async def consume():
+        frames = controller.frames()
+        await frames.__anext__()
+        gamepad.send(('Key', 'BTN_SOUTH', 1))
+        gamepad.send(('Absolute', 'ABS_X', 12000))
+        gamepad.send(('Absolute', 'ABS_Z', 200))
+        while controller.version < 3:
+            await asyncio.sleep(0.001)
+        frame = await asyncio.wait_for(frames.__anext__(), timeout=5.0)
+        assert frame is controller.get_frame()
+        assert frame.TrigL.VAL == 200
+        await frames.aclose()
+
+    asyncio.run(consume())
+
+# Iterator of a closed event-loop is removed with the next Frame
+def test_frames_closed_loop():
+    controller = Controller(SyntheticBackend('XBOX'), monitor=False)
+    loop = asyncio.new_event_loop()
+    frames = controller.frames()
+    assert loop.run_until_complete(frames.__anext__()).version == 0
+    loop.close()
+    assert len(controller._frame_listeners) == 1
+
+    controller._process_events([(1, 0x130, 1), (0, 0x00, 0)])
+    assert controller._frame_listeners == ()
+    assert controller.get_frame().Button.A == 1
+
+# Failing Frame listener does not stop the other listeners
+def test_frame_listener_error():
+    controller = Controller(SyntheticBackend('XBOX'), monitor=False)
+    frames = []
+    controller._add_listener('_frame_listeners', lambda frame: 1 / 0)
+    controller._add_listener('_frame_listeners', frames.append)
+
+    controller._process_events([(1, 0x130, 1), (0, 0x00, 0)])
+    controller._process_events([(1, 0x130, 0), (0, 0x00, 0)])
+    assert [frame.version for frame in frames] == [1, 2]
+    assert len(controller._frame_listeners) == 2
+
+# Next incomming event of the gamepad
+def test_next_event():
+    controller, gamepad = get_controller()
+
+    async def consume():
+        task = asyncio.ensure_future(controller.next_event())
+        while not controller._event_listeners:
+            await asyncio.sleep(0.001)
+        gamepad.send(('Absolute', 'ABS_X', 12000))
+        event = await asyncio.wait_for(task, timeout=5.0)
+        assert event == ('Absolute', 'ABS_X', 12000)
+        assert controller._event_listeners == ()
+
+        # Cancelled wait removes the listener
+        task = asyncio.ensure_future(controller.next_event())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        assert controller._event_listeners == ()
+
+    asyncio.run(consume())
+
+# Wait of a closed event-loop is removed with the next event
+def test_next_event_closed_loop():
+    controller = Controller(SyntheticBackend('XBOX'), monitor=False)
+    loop = asyncio.new_event_loop()
+    loop.create_task(controller.next_event())
+    loop.run_until_complete(asyncio.sleep(0.01))
+    loop.close()
+    assert len(controller._event_listeners) == 1
+
+    controller._process_events([(1, 0x130, 1), (0, 0x00, 0)])
+    assert controller._event_listeners == ()
+    assert controller.get_frame().Button.A == 1
+
+# Failing Event listener does not stop the other listeners
+def test_event_listener_error():
+    controller = Controller(SyntheticBackend('XBOX'), monitor=False)
+    events = []
+    controller._add_listener('_event_listeners', lambda event: 1 / 0)
+    controller._add_listener('_event_listeners', events.append)
+
+    controller._process_events([(1, 0x130, 1), (0, 0x00, 0)])
+    assert events == [(1, 0x130, 1), (0, 0x00, 0)]
+    assert controller.get_frame().Button.A == 1
+
+# Main Function
+# ------------------------------
+if __name__ == '__main__':
+    test_frames()
+    test_frames_latest()
+    test_frames_closed_loop()
+    test_frame_listener_error()
+    test_next_event()
+    test_next_event_closed_loop()
+    test_event_listener_error()
+    print('Asynchronous Controller: OK')
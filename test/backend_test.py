@@ -0,0 +1,167 @@
+# Controller Backend Test
+# ------------------------------
+# Description:
+# Test of the read paths of the evdev and inputs Backends,
+# with files of input event records in place of event devices
+
+# Version
+# ------------------------------
+# 0.1   -   Device state read after dropped events
+#           [18.10.2026] - Jan T. Olsen
+# 0.0   -   Initial version
+#           [18.10.2026] - Jan T. Olsen
+
+# Import packages
+import os
+import struct
+import sys
+import tempfile
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import ctrl_toolbox as CtrlToolbox
+from ctrl_main import Controller
+from lib import backend as Backend
+from lib.backend import EvdevBackend
+from lib.backend import InputsBackend
+from lib.backend import as_backend
+from lib.backend import get_evdev_name
+
+# Report of the XBOX profile: Joystick Left, Button A, Trigger Left
+EVENTS = [(3, 0x00, 1200), (1, 0x130, 1), (3, 0x02, 200), (0, 0x00, 0)]
+
+# Write input event records to a file
+def _write_events(directory, events):
+    path = os.path.join(directory, 'event0')
+    with open(path, 'wb') as file:
+        file.write(b''.join(struct.pack(CtrlToolbox.EVENT_FORMAT, 1, 2, *event) for event in events))
+    return path
+
+# Gamepad of the inputs package reading a file
+# (device name given, no sysfs entry of the file)
+def _inputs_gamepad(path):
+    inputs = pytest.importorskip('inputs')
+
+    class GamePad(inputs.GamePad):
+        def _set_name(self):
+            self.name = 'Microsoft X-Box 360 pad'
+
+    return GamePad(inputs.devices, '/dev/input/by-id/usb-Test-event-joystick', char_path_override=path)
+
+# evdev Backend: all pending records read at once
+def test_evdev_backend():
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write_events(directory, EVENTS)
+        backend = EvdevBackend(path)
+        assert backend.int_keys
+        assert str(backend) == path
+        assert backend.fileno() >= 0
+
+        assert backend.read() == EVENTS
+        assert backend.read_available() == []
+        backend.close()
+        backend.close()
+        assert backend._fd is None
+
+# evdev Backend: more records than a single read
+def test_evdev_backend_bulk():
+    with tempfile.TemporaryDirectory() as directory:
+        events = [(3, 0x00, value) for value in range(600)]
+        backend = EvdevBackend(_write_events(directory, events))
+        read = []
+        while True:
+            block = backend.read()
+            if not block:
+                break
+            assert len(block) <= Backend._READ_EVENTS
+            read += block
+        backend.close()
+        assert read == events
+
+# evdev Backend read by the Controller
+def test_evdev_controller():
+    with tempfile.TemporaryDirectory() as directory:
+        backend = EvdevBackend(_write_events(directory, EVENTS))
+        backend.name = 'Microsoft X-Box 360 pad'
+        controller = Controller(backend, monitor=False)
+        controller._process_events(backend.read())
+        backend.close()
+
+    frame = controller.get_frame()
+    assert (frame.JoyL.X, frame.TrigL.VAL, frame.Button.A) == (1200, 200, 1)
+
+# evdev Backend: device state read through the evdev ioctls
+def test_evdev_resync():
+    if Backend.fcntl is None:
+        pytest.skip('fcntl not available')
+
+    # Device state: BTN_SOUTH pressed, ABS_X at 1200, ABS_Z at 200
+    def ioctl(fd, request, buffer):
+        if request == Backend._EVIOCGKEY:
+            buffer[0x130 >> 3] |= 1 << (0x130 & 7)
+        else:
+            value = {Backend._EVIOCGABS + 0x00 : 1200, Backend._EVIOCGABS + 0x02 : 200}[request]
+            struct.pack_into(Backend._ABSINFO_FORMAT, buffer, 0, value, -32768, 32767, 16, 128, 0)
+        return 0
+
+    with tempfile.TemporaryDirectory() as directory:
+        backend = EvdevBackend(_write_events(directory, EVENTS))
+
+        # File of input event records: no device state
+        assert backend.resync([(3, 0x00)]) is None
+
+        ioctl_saved = Backend.fcntl.ioctl
+        Backend.fcntl.ioctl = ioctl
+        try:
+            events = backend.resync([(3, 0x00), (1, 0x130), (1, 0x131), (3, 0x02), (0, 0x00)])
+        finally:
+            Backend.fcntl.ioctl = ioctl_saved
+        backend.close()
+
+    assert events == [(3, 0x00, 1200), (1, 0x130, 1), (1, 0x131, 0), (3, 0x02, 200)]
+
+# Event device without sysfs entry
+def test_evdev_info():
+    assert get_evdev_name('/dev/input/no_event') == '/dev/input/no_event'
+
+# inputs Backend: blocking and non-blocking read paths
+def test_inputs_backend():
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write_events(directory, EVENTS)
+        gamepad = _inputs_gamepad(path)
+        backend = as_backend(gamepad)
+        assert isinstance(backend, InputsBackend) and as_backend(backend) is backend
+        assert not backend.int_keys
+        assert str(backend) == 'Microsoft X-Box 360 pad'
+        assert backend.resync([('Absolute', 'ABS_X')]) is None
+
+        # Events with Event-Key names, all pending records read at once
+        events = backend.read_available()
+        assert events == [('Absolute', 'ABS_X', 1200), ('Key', 'BTN_SOUTH', 1),
+                          ('Absolute', 'ABS_Z', 200), ('Sync', 'SYN_REPORT', 0)]
+        assert backend.read_available() == []
+        backend.close()
+        assert backend._fd is None
+
+        # Blocking read of the inputs package (one record per read)
+        assert backend.read() == events[:1]
+
+        # Read by the Controller
+        controller = Controller(backend, monitor=False)
+        controller._process_events(events)
+        backend.close()
+
+    frame = controller.get_frame()
+    assert (frame.JoyL.X, frame.TrigL.VAL, frame.Button.A) == (1200, 200, 1)
+
+# Main Function
+# ------------------------------
+if __name__ == '__main__':
+    test_evdev_backend()
+    test_evdev_backend_bulk()
+    test_evdev_controller()
+    test_evdev_resync()
+    test_evdev_info()
+    test_inputs_backend()
+    print('Controller Backend: OK')
@@ -0,0 +1,301 @@
+# Controller Benchmark
+# ------------------------------
+# Description:
+# Microbenchmark suite for the dispatch and update hot paths
+# Reports ns/op and events/s, saves the results as JSON
+# and compares them against a stored baseline
+#
+# Usage:
+# python test/benchmark.py                              Run all benchmarks
+# python test/benchmark.py --json results.json          Save results
+# python test/benchmark.py --baseline baseline.json     Compare against baseline
+#                                                       (exit code 1 on regression)
+#
+# Baseline of the reference machine: test/benchmark_baseline.json
+
+# Version
+# ------------------------------
+# 0.2   -   Alternating reports for all changed paths, separate unchanged benchmarks, stored baseline
+#           [18.10.2026] - Jan T. Olsen
+# 0.1   -   Alternating reports for changed updates, stick sweep report
+#           [18.10.2026] - Jan T. Olsen
+# 0.0   -   Initial version
+#           [18.10.2026] - Jan T. Olsen
+
+# Import packages
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import ctrl_toolbox as CtrlToolbox
+from ctrl_main import Controller
+from lib.joystick import Joystick
+from lib.trigger import Trigger
+from lib.dpad import DPad
+from lib.button import XboxButton
+from lib.button import PSButton
+from lib.synthetic import SyntheticBackend
+
+# Registered Benchmarks
+# (name, number of events per operation, setup function returning the operation)
+BENCHMARKS = []
+
+def benchmark(name : str, events : int = 1):
+    """
+    Register a benchmark
+    :param name: Benchmark name (str)
+    :param events: Number of input events handled per operation (int)
+    """
+    def register(setup):
+        BENCHMARKS.append((name, events, setup))
+        return setup
+    return register
+
+# Input Event
+# (as delivered by the gamepad object of the inputs package)
+class _Event():
+    def __init__(self, ev_type, code, state):
+        self.ev_type = ev_type
+        self.code = code
+        self.state = state
+
+# Scaling
+# ------------------------------
+@benchmark('calc_minmax_scaling_deadband')
+def _bench_scaling():
+    SCALING = CtrlToolbox.XBOXONE_CONST().JOYSTICK_SCALING
+    return lambda: CtrlToolbox.calc_minmax_scaling_deadband(20000,
+                                                            SCALING.RAW_MIN,
+                                                            SCALING.RAW_MAX,
+                                                            SCALING.RAW_DB,
+                                                            SCALING.MIN,
+                                                            SCALING.MAX)
+
+@benchmark('scale_input_joystick')
+def _bench_scale_joystick():
+    SCALING = CtrlToolbox.XBOXONE_CONST().JOYSTICK_SCALING
+    return lambda: CtrlToolbox.scale_input_joystick(20000, SCALING)
+
+# Event functions
+# ------------------------------
+@benchmark('XBOX_event_Axis')
+def _bench_xbox_axis():
+    CONST = CtrlToolbox.XBOXONE_CONST()
+    event = _Event('Absolute', 'ABS_X', 20000)
+    args = (CONST, CtrlToolbox.JoystickData(), CtrlToolbox.JoystickData(),
+            CtrlToolbox.TriggerData(), CtrlToolbox.TriggerData(), CtrlToolbox.GenericAxisData())
+    return lambda: CtrlToolbox.XBOX_event_Axis(event, *args)
+
+@benchmark('XBOX_event_Button')
+def _bench_xbox_button():
+    CONST = CtrlToolbox.XBOXONE_CONST()
+    event = _Event('Key', 'BTN_START', 1)
+    args = (CONST, CtrlToolbox.JoystickData(), CtrlToolbox.JoystickData(),
+            CtrlToolbox.TriggerData(), CtrlToolbox.TriggerData(), CtrlToolbox.DPadData(),
+            CtrlToolbox.XBOX_ButtonData(), CtrlToolbox.GenericButtonData())
+    return lambda: CtrlToolbox.XBOX_event_Button(event, *args)
+
+@benchmark('PS3_event_Axis')
+def _bench_ps3_axis():
+    CONST = CtrlToolbox.PS3_CONST()
+    event = _Event('Absolute', 'ABS_X', 200)
+    args = (CONST, CtrlToolbox.JoystickData(), CtrlToolbox.JoystickData(),
+            CtrlToolbox.TriggerData(), CtrlToolbox.TriggerData(), CtrlToolbox.GenericAxisData())
+    return lambda: CtrlToolbox.PS3_event_Axis(event, *args)
+
+@benchmark('PS3_event_Button')
+def _bench_ps3_button():
+    CONST = CtrlToolbox.PS3_CONST()
+    event = _Event('Key', 'BTN_START', 1)
+    args = (CONST, CtrlToolbox.JoystickData(), CtrlToolbox.JoystickData(),
+            CtrlToolbox.TriggerData(), CtrlToolbox.TriggerData(), CtrlToolbox.DPadData(),
+            CtrlToolbox.PS_ButtonData(), CtrlToolbox.GenericButtonData())
+    return lambda: CtrlToolbox.PS3_event_Button(event, *args)
+
+@benchmark('dispatch_event')
+def _bench_dispatch_event():
+    table = CtrlToolbox.XBOX_dispatch_table(CtrlToolbox.XBOXONE_CONST(), CtrlToolbox.new_state())
+    event = _Event('Absolute', 'ABS_X', 20000)
+    return lambda: CtrlToolbox.dispatch_event(table, event)
+
+# Controller Components
+# ------------------------------
+@benchmark('Joystick.update')
+def _bench_joystick():
+    joystick = Joystick('JOY_L', CtrlToolbox.XBOXONE_CONST())
+    joystick.joystickData.X = 20000
+    return joystick.update
+
+@benchmark('Trigger.update')
+def _bench_trigger():
+    trigger = Trigger('L', CtrlToolbox.XBOXONE_CONST())
+    trigger.triggerData.VAL = 200
+    return trigger.update
+
+@benchmark('XboxButton.update')
+def _bench_xbox_button_update():
+    return XboxButton().update
+
+@benchmark('PSButton.update')
+def _bench_ps_button_update():
+    return PSButton().update
+
+@benchmark('DPad.update')
+def _bench_dpad():
+    return DPad().update
+
+# Controller
+# ------------------------------
+# Alternating reports of 3 input events and Sync Report
+# (a repeated report is unchanged and publishes no Frame)
+REPORTS = ([(3, 0x00, 20000), (3, 0x05, 200), (1, 0x130, 1), (0, 0x00, 0)],
+           [(3, 0x00, -20000), (3, 0x05, 100), (1, 0x130, 0), (0, 0x00, 0)])
+
+# Alternating reports of Axis events only
+AXIS_REPORTS = ([(3, 0x00, 20000), (3, 0x05, 200), (0, 0x00, 0)],
+                [(3, 0x00, -20000), (3, 0x05, 100), (0, 0x00, 0)])
+
+# Alternating reports of a stick sweep with 16 intermediate values per axis
+_SWEEP = [(3, code, value) for value in range(-16000, 16000, 2000) for code in (0x00, 0x01)]
+SWEEP_REPORTS = (_SWEEP + [(0, 0x00, 0)], _SWEEP[::-1] + [(0, 0x00, 0)])
+
+def _alternating_reports(controller, reports = REPORTS):
+    index = [0]
+    def process():
+        index[0] ^= 1
+        controller._process_events(reports[index[0]])
+    return process
+
+@benchmark('Controller._process_events', events=len(REPORTS[0]))
+def _bench_process_events():
+    controller = Controller(SyntheticBackend('XBOX'), monitor=False)
+    return _alternating_reports(controller)
+
+@benchmark('Controller._process_events (unchanged)', events=len(REPORTS[0]))
+def _bench_process_events_unchanged():
+    controller = Controller(SyntheticBackend('XBOX'), monitor=False)
+    return lambda: controller._process_events(REPORTS[0])
+
+@benchmark('Controller._process_events (sweep)', events=len(SWEEP_REPORTS[0]))
+def _bench_process_sweep():
+    controller = Controller(SyntheticBackend('XBOX'), monitor=False)
+    return _alternating_reports(controller, SWEEP_REPORTS)
+
+@benchmark('Controller.update (unchanged)')
+def _bench_controller_update():
+    controller = Controller(SyntheticBackend('XBOX'), monitor=False)
+    return controller.update
+
+# Changed updates
+# (timed together with the report publishing the changed Frame)
+@benchmark('Controller.update (changed)', events=len(REPORTS[0]))
+def _bench_controller_update_changed():
+    controller = Controller(SyntheticBackend('XBOX'), monitor=False)
+    process = _alternating_reports(controller)
+    def operation():
+        process()
+        controller.update()
+    return operation
+
+@benchmark('Controller.update (axes changed)', events=len(AXIS_REPORTS[0]))
+def _bench_controller_update_axes():
+    controller = Controller(SyntheticBackend('XBOX'), monitor=False)
+    process = _alternating_reports(controller, AXIS_REPORTS)
+    def operation():
+        process()
+        controller.update()
+    return operation
+
+# Run Benchmarks
+# ------------------------------
+def run(selection : str = None, repeat : int = 5) -> dict:
+    """
+    Run the registered benchmarks
+    (each operation is timed in loops of at least 0.2 s, the best of the repeats is kept)
+    :param selection: Run only benchmarks containing this text (str)
+    :param repeat: Number of timed repeats (int)
+    :return results: ns/op and events/s per benchmark name (dict)
+    """
+    results = dict()
+    for name, events, setup in BENCHMARKS:
+        if selection and selection not in name:
+            continue
+
+        timer = timeit.Timer(setup())
+        number, _ = timer.autorange()
+        seconds = min(timer.repeat(repeat, number)) / number
+
+        results[name] = {'ns_per_op' : seconds * 1e9,
+                         'events_per_s' : events / seconds}
+
+    return results
+
+# Compare with Baseline
+# ------------------------------
+def compare(results : dict, baseline : dict, tolerance : float) -> list:
+    """
+    Compare benchmark results with a baseline
+    :param results: Benchmark results (dict)
+    :param baseline: Baseline benchmark results (dict)
+    :param tolerance: Allowed relative slowdown (float, e.g. 0.2 for 20 %)
+    :return regressions: Names of the benchmarks slower than the baseline (list)
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        change = result['ns_per_op'] / baseline[name]['ns_per_op'] - 1.0
+        result['change'] = change
+        if change > tolerance:
+            regressions.append(name)
+
+    return regressions
+
+# Print Results
+# ------------------------------
+def report(results : dict, regressions : list) -> None:
+    print('{:<40} {:>12} {:>14} {:>9}'.format('Benchmark', 'ns/op', 'events/s', 'change'))
+    for name, result in results.items():
+        change = '{:+.1%}'.format(result['change']) if 'change' in result else ''
+        flag = '  REGRESSION' if name in regressions else ''
+        print('{:<40} {:>12.1f} {:>14,.0f} {:>9}{}'.format(name, result['ns_per_op'], result['events_per_s'], change, flag))
+
+# Main Function
+# ------------------------------
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Controller hot-path benchmarks')
+    parser.add_argument('--json', help='save results to JSON file')
+    parser.add_argument('--baseline', help='compare against baseline JSON file')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed slowdown against baseline (default 0.2)')
+    parser.add_argument('--filter', help='run only benchmarks containing this text')
+    parser.add_argument('--repeat', type=int, default=5, help='number of timed repeats (default 5)')
+    args = parser.parse_args()
+
+    results = run(args.filter, args.repeat)
+
+    # Compare with Baseline
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            regressions = compare(results, json.load(baseline_file)['results'], args.tolerance)
+
+    report(results, regressions)
+
+    # Save results
+    if args.json:
+        with open(args.json, 'w') as json_file:
+            json.dump({'machine' : {'python' : platform.python_version(),
+                                    'implementation' : platform.python_implementation(),
+                                    'platform' : platform.platform(),
+                                    'processor' : platform.machine()},
+                       'time' : time.strftime('%Y-%m-%dT%H:%M:%S'),
+                       'results' : results}, json_file, indent=2)
+
+    # Regression against Baseline
+    if regressions:
+        sys.exit(1)
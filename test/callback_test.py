@@ -0,0 +1,144 @@
+# Controller Callback Test
+# ------------------------------
+# Description:
+# Test of the Callback Executor drop policies
+# and the Button / Axis Subscriptions of the Controller
+
+# Version
+# ------------------------------
+# 0.1   -   Test gamepad and Callback Executor of the shared test helpers
+#           [18.10.2026] - Jan T. Olsen
+# 0.0   -   Initial version
+#           [18.10.2026] - Jan T. Olsen
+
+# Import packages
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from lib.callback import CallbackExecutor
+from helpers import Executor
+from helpers import get_controller
+
+# Callback Executor with its single worker blocked
+def _blocked_executor(drop_policy):
+    executor = CallbackExecutor(workers=1, queue_size=2, drop_policy=drop_policy)
+    started, release = threading.Event(), threading.Event()
+    def block():
+        started.set()
+        release.wait()
+    executor.submit(block)
+    assert started.wait(timeout=5.0)
+    return executor, release
+
+# Release the worker and wait until the queued callbacks have run
+def _drain(executor, release, calls, count):
+    release.set()
+    deadline = time.monotonic() + 5.0
+    while len(calls) < count and time.monotonic() < deadline:
+        time.sleep(0.001)
+    assert executor._queue.empty()
+
+# Full queue: the new callback is dropped
+def test_drop_newest():
+    executor, release = _blocked_executor(CallbackExecutor.DROP_NEWEST)
+    calls = []
+    assert executor.submit(calls.append, 1) and executor.submit(calls.append, 2)
+    assert not executor.submit(calls.append, 3)
+    assert not executor.submit(calls.append, 4)
+    assert executor.dropped == 2
+    _drain(executor, release, calls, 2)
+    assert calls == [1, 2]
+
+# Full queue: the oldest queued callback is dropped
+def test_drop_oldest():
+    executor, release = _blocked_executor(CallbackExecutor.DROP_OLDEST)
+    calls = []
+    for value in range(1, 5):
+        assert executor.submit(calls.append, value)
+    assert executor.dropped == 2
+    _drain(executor, release, calls, 2)
+    assert calls == [3, 4]
+
+# Unknown drop policy
+def test_drop_policy():
+    try:
+        CallbackExecutor(drop_policy='drop_all')
+    except ValueError:
+        return
+    assert False
+
+# Failing callback does not stop the worker
+def test_callback_error():
+    executor = CallbackExecutor()
+    done = threading.Event()
+    executor.submit(lambda: 1 / 0)
+    executor.submit(done.set)
+    assert done.wait(timeout=5.0)
+
+# Button press/release edges submitted per published Frame
+def test_button_subscriptions():
+    controller, gamepad = get_controller()
+    executor = controller._callback_executor = Executor()
+    pressed, released = [], []
+    on_press = controller.on_press('A', pressed.append)
+    controller.on_press('B', on_press)
+    controller.on_release('A', released.append)
+
+    gamepad.process(('Key', 'BTN_SOUTH', 1))
+    gamepad.process(('Absolute', 'ABS_X', 12000))
+    gamepad.process(('Key', 'BTN_SOUTH', 0), ('Key', 'BTN_EAST', 1))
+    assert (pressed, released) == (['S', 'E'], ['S'])
+    assert len(executor.calls) == 3
+
+    # Removed callback
+    controller.remove_callback(on_press)
+    gamepad.process(('Key', 'BTN_EAST', 0), ('Key', 'BTN_SOUTH', 1))
+    assert pressed == ['S', 'E']
+
+    # Unknown Button
+    try:
+        controller.on_press('Z', pressed.append)
+    except ValueError:
+        return
+    assert False
+
+# Axis changes beyond the threshold
+def test_axis_subscriptions():
+    controller, gamepad = get_controller()
+    controller._callback_executor = Executor()
+    values = []
+    controller.on_axis_change('JoyL_X', lambda name, value: values.append((name, value)), threshold=10.0)
+
+    # Button and small Axis changes are not submitted
+    gamepad.process(('Key', 'BTN_SOUTH', 1))
+    gamepad.process(('Absolute', 'ABS_X', 1200))
+    assert values == []
+
+    # Full deflection
+    gamepad.process(('Absolute', 'ABS_X', 32767))
+    assert values == [('JoyL_X', 100.0)]
+
+    # Change below the threshold of the last submitted value
+    gamepad.process(('Absolute', 'ABS_X', 31000))
+    assert len(values) == 1
+
+    # Unknown Axis
+    try:
+        controller.on_axis_change('Hat_X', values.append)
+    except ValueError:
+        return
+    assert False
+
+# Main Function
+# ------------------------------
+if __name__ == '__main__':
+    test_drop_newest()
+    test_drop_oldest()
+    test_drop_policy()
+    test_callback_error()
+    test_button_subscriptions()
+    test_axis_subscriptions()
+    print('Controller Callback: OK')
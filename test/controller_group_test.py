@@ -0,0 +1,127 @@
+# Controller Group Test
+# ------------------------------
+# Description:
+# Test of the Controller Group reading several gamepads from a single thread,
+# with named pipes in place of the character devices of the gamepads
+
+# Version
+# ------------------------------
+# 0.1   -   Failing Frame listener of a Controller
+#           [18.10.2026] - Jan T. Olsen
+# 0.0   -   Initial version
+#           [18.10.2026] - Jan T. Olsen
+
+# Import packages
+import os
+import struct
+import sys
+import tempfile
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import ctrl_toolbox as CtrlToolbox
+from ctrl_main import ControllerGroup
+from lib.backend import EvdevBackend
+
+# Gamepad of the inputs package with a given device name
+def _inputs_gamepad(name, path):
+    inputs = pytest.importorskip('inputs')
+
+    class GamePad(inputs.GamePad):
+        def _set_name(self):
+            self.name = name
+
+    return GamePad(inputs.devices, '/dev/input/by-id/usb-Test-event-joystick', char_path_override=path)
+
+# Gamepad device emulated by a named pipe
+# (read through the inputs package or the evdev Backend)
+class _PipeGamepad():
+    def __init__(self, directory, index, name, evdev = False):
+        path = os.path.join(directory, 'event{}'.format(index))
+        os.mkfifo(path)
+        # (writer opened first, so the blocking open of the reader returns)
+        self.writer = os.open(path, os.O_RDWR)
+        if evdev:
+            self.gamepad = EvdevBackend(path)
+            self.gamepad.name = name
+        else:
+            self.gamepad = _inputs_gamepad(name, path)
+
+    # Write input event records of a report
+    def write(self, events):
+        os.write(self.writer, b''.join(struct.pack(CtrlToolbox.EVENT_FORMAT, 0, 0, *event) for event in events + [(0, 0, 0)]))
+
+    def close(self):
+        os.close(self.writer)
+
+# Wait for a condition set by the group-monitor-thread
+def _wait(condition, timeout = 5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.001)
+    return True
+
+# Reports of every gamepad are processed by its own Controller
+def test_controller_group():
+    with tempfile.TemporaryDirectory() as directory:
+        xbox = _PipeGamepad(directory, 0, 'Microsoft X-Box 360 pad')
+        ps3 = _PipeGamepad(directory, 1, 'Sony PLAYSTATION(R)3 Controller', evdev=True)
+        try:
+            group = ControllerGroup([xbox.gamepad, ps3.gamepad])
+            assert group.init
+            assert [controller.gamepad_type for controller in group.controllers] == ['XBOX', 'PS3']
+            group.update()
+            assert not group.update()
+
+            # Failing Frame listener does not stop the group-monitor-thread
+            group.controllers[0]._add_listener('_frame_listeners', lambda frame: 1 / 0)
+
+            # Report of the first gamepad only
+            xbox.write([(3, 0x00, 32767), (1, 0x130, 1)])
+            assert _wait(lambda: group.get_frames()[0].version == 1)
+            frames = group.get_frames()
+            assert (frames[0].JoyL.X, frames[0].Button.A) == (32767, 1)
+            assert frames[1].version == 0
+
+            # Reports of both gamepads
+            xbox.write([(3, 0x02, 255)])
+            ps3.write([(1, 0x130, 1)])
+            assert _wait(lambda: [frame.version for frame in group.get_frames()] == [2, 1])
+            assert group.update()
+            assert group.controllers[0].JoyLeft.X == 100.0
+            assert group.controllers[1].get_frame().GenericButton.S == 1
+            assert not group.update()
+        finally:
+            xbox.close()
+            ps3.close()
+
+# Unknown gamepads are skipped, disconnected gamepads unregistered
+def test_controller_group_disconnect():
+    with tempfile.TemporaryDirectory() as directory:
+        xbox = _PipeGamepad(directory, 0, 'Microsoft X-Box 360 pad', evdev=True)
+        unknown = _PipeGamepad(directory, 1, 'Generic USB Joystick', evdev=True)
+        group = ControllerGroup([unknown.gamepad, xbox.gamepad])
+        assert [controller.gamepad for controller in group.controllers] == [xbox.gamepad]
+
+        # Device removed (evdev read fails with ENODEV)
+        def read_available():
+            raise OSError(19, 'No such device')
+        xbox.gamepad.read_available = read_available
+        xbox.write([])
+        assert _wait(lambda: xbox.gamepad._fd is None)
+        group._monitor_thread.join(timeout=5.0)
+        assert not group._monitor_thread.is_alive()
+        xbox.close()
+        unknown.gamepad.close()
+        unknown.close()
+
+# Main Function
+# ------------------------------
+if __name__ == '__main__':
+    test_controller_group()
+    test_controller_group_disconnect()
+    print('Controller Group: OK')
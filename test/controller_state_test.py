@@ -0,0 +1,195 @@
+# Controller State Test
+# ------------------------------
+# Description:
+# Test of the array-backed Controller State, its Data views
+# and the Controller Frames copied from it
+
+# Version
+# ------------------------------
+# 0.5   -   Button callbacks called by the shared test Callback Executor
+#           [18.10.2026] - Jan T. Olsen
+# 0.4   -   Reports with dropped events resynchronized or applied as received
+#           [18.10.2026] - Jan T. Olsen
+# 0.3   -   Controller Classes reading the packed Button bits once
+#           [18.10.2026] - Jan T. Olsen
+# 0.2   -   Coalesced reports and dropped events
+#           [18.10.2026] - Jan T. Olsen
+# 0.1   -   Packed Button bitmask
+#           [18.10.2026] - Jan T. Olsen
+# 0.0   -   Initial version
+#           [18.10.2026] - Jan T. Olsen
+
+# Import packages
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import ctrl_toolbox as CtrlToolbox
+from ctrl_main import Controller
+from lib.callback import Subscriptions
+from lib.synthetic import SyntheticBackend
+from helpers import Executor
+
+# Typed and Generic views share one Controller State
+def test_views_share_state():
+    state = CtrlToolbox.new_state()
+    JoyR = CtrlToolbox.JoystickData(state, 'R')
+    TrigL = CtrlToolbox.TriggerData(state, 'L')
+    Button = CtrlToolbox.PS_ButtonData(state)
+    JoyR.X = -1200
+    JoyR.PB = True
+    TrigL.VAL = 255
+    Button.Triangle = 1
+
+    AxisData = CtrlToolbox.GenericAxisData(state)
+    ButtonData = CtrlToolbox.GenericButtonData(state)
+    assert (AxisData.JoyR_X, AxisData.Trig_L) == (-1200, 255)
+    assert (ButtonData.PB_R, ButtonData.N, ButtonData.S) == (1, 1, 0)
+    assert state[CtrlToolbox.STATE_BUTTONS] == CtrlToolbox.BUTTON_MASKS['PB_R'] | CtrlToolbox.BUTTON_MASKS['N']
+
+    Button.Triangle = 0
+    assert ButtonData.N == 0 and ButtonData.PB_R == 1
+
+# Dispatch-Table writes each event once to the Controller State
+def test_dispatch_table_state():
+    state = CtrlToolbox.new_state()
+    table = CtrlToolbox.translate_dispatch_table(CtrlToolbox.XBOX_dispatch_table(CtrlToolbox.XBOXONE_CONST(), state))
+    for ev_type, code, value in [(3, 0x00, 20000), (3, 0x05, 200), (3, 0x10, -1), (1, 0x130, 1)]:
+        table[(ev_type, code)][0](value)
+
+    frame = CtrlToolbox.ControllerFrame(state)
+    assert (frame.JoyL.X, frame.TrigR.VAL, frame.TrigR.B2) == (20000, 200, 1)
+    assert (frame.DPad.L, frame.DPad.R, frame.Button.A) == (1, 0, 1)
+
+    # D-Pad hat moves from Left to Right
+    table[(3, 0x10)][0](1)
+    assert (frame.DPad.L, frame.DPad.R) == (0, 1)
+
+# Published Frames hold a copy of the Controller State
+def test_frame_copy():
+    controller = Controller(SyntheticBackend('XBOX'), monitor=False)
+    controller._process_events([(3, 0x00, 1000), (1, 0x130, 1), (0, 0x00, 0)])
+    frame = controller.get_frame()
+    controller._process_events([(3, 0x00, -1000), (1, 0x130, 0), (0, 0x00, 0)])
+
+    assert (frame.JoyL.X, frame.Button.A, frame.presses['S']) == (1000, 1, 1)
+    latest = controller.get_frame()
+    assert (latest.JoyL.X, latest.Button.A, latest.releases['S']) == (-1000, 0, 1)
+    assert latest.state is not frame.state
+
+    # Controller Classes and Generic Data read the consumed Frame
+    assert controller.update()
+    assert controller.JoyLeft.joystickData == latest.JoyL
+    assert controller.GenericAxis.JoyL_X == -1000
+    assert (controller.Button.presses['A'], controller.Button.releases['A']) == (1, 1)
+
+# Packed Button bitmask helpers
+def test_button_bitmask():
+    chord = CtrlToolbox.button_mask('LB1', 'RB1')
+    assert chord == CtrlToolbox.BUTTON_LB1 | CtrlToolbox.BUTTON_RB1
+    old = CtrlToolbox.BUTTON_S | CtrlToolbox.BUTTON_LB1
+    new = CtrlToolbox.BUTTON_LB1 | CtrlToolbox.BUTTON_RB1
+    assert CtrlToolbox.buttons_pressed(new, old) == CtrlToolbox.BUTTON_RB1
+    assert CtrlToolbox.buttons_released(new, old) == CtrlToolbox.BUTTON_S
+    assert CtrlToolbox.is_chord(new, chord) and not CtrlToolbox.is_chord(old, chord)
+    assert CtrlToolbox.button_names(new) == ('LB1', 'RB1')
+    assert CtrlToolbox.get_button(new, 'RB1') and not CtrlToolbox.get_button(new, 'S')
+
+# Button edges of published Frames and Button callbacks
+def test_frame_button_edges():
+    controller = Controller(SyntheticBackend('XBOX'), monitor=False)
+    executor = Executor()
+    pressed, released = [], []
+    subscriptions = Subscriptions(executor, controller.get_frame())
+    subscriptions.add_button('S', True, pressed.append)
+    subscriptions.add_button('E', False, released.append)
+    controller._add_listener('_frame_listeners', subscriptions)
+
+    controller._process_events([(1, 0x130, 1), (1, 0x131, 1), (0, 0x00, 0)])
+    frame = controller.get_frame()
+    assert (frame.pressed, frame.released) == (CtrlToolbox.BUTTON_S | CtrlToolbox.BUTTON_E, 0)
+    controller._process_events([(1, 0x131, 0), (3, 0x00, 5), (0, 0x00, 0)])
+    frame = controller.get_frame()
+    assert (frame.pressed, frame.released) == (0, CtrlToolbox.BUTTON_E)
+    assert frame.buttons == CtrlToolbox.BUTTON_S
+    assert (pressed, released) == (['S'], ['E'])
+    assert executor.calls == [('S',), ('E',)]
+
+    controller.update()
+    assert controller.buttons == CtrlToolbox.BUTTON_S
+
+# Events of a report are coalesced and committed at the end of the report
+def test_report_coalescing():
+    controller = Controller(SyntheticBackend('XBOX'), monitor=False)
+    controller._process_events([(3, 0x00, value) for value in range(0, 5000, 500)])
+    assert controller.get_frame().version == 0
+
+    controller._process_events([(3, 0x00, 1000), (1, 0x130, 1), (1, 0x130, 0), (0, 0x00, 0)])
+    frame = controller.get_frame()
+    assert (frame.version, frame.JoyL.X, frame.Button.A) == (1, 1000, 0)
+    assert frame.changed == CtrlToolbox.COMPONENT_JOY_L
+
+    # Report without change publishes no Frame
+    controller._process_events([(3, 0x00, 1000), (1, 0x130, 0), (0, 0x00, 0)])
+    assert controller.get_frame() is frame
+
+# Report with dropped events applied as received by Backends without device state
+def test_report_dropped():
+    controller = Controller(SyntheticBackend('XBOX'), monitor=False)
+    controller._process_events([(3, 0x00, 1000), (0, 0x03, 0), (3, 0x01, 2000), (0, 0x00, 0)])
+    frame = controller.get_frame()
+    assert (frame.version, frame.JoyL.X, frame.JoyL.Y) == (1, 1000, 2000)
+
+# Report with dropped events replaced by the device state of the Backend
+def test_report_resync():
+    class _Backend(SyntheticBackend):
+        def resync(self, keys):
+            self.keys = keys
+            return [(3, 0x00, 1500), (3, 0x01, 0), (1, 0x130, 1), (1, 0x2ff, 1)]
+
+    backend = _Backend('XBOX')
+    controller = Controller(backend, monitor=False)
+    controller._process_events([(3, 0x00, 1000), (3, 0x01, 2000), (0, 0x03, 0), (3, 0x00, 1200), (0, 0x00, 0)])
+    frame = controller.get_frame()
+    assert (frame.version, frame.JoyL.X, frame.JoyL.Y, frame.Button.A) == (1, 1500, 0, 1)
+    assert (3, 0x00) in backend.keys and (1, 0x130) in backend.keys
+    assert (0, 0x00) not in backend.keys
+
+    # Following reports are not resynchronized
+    backend.resync = None
+    controller._process_events([(3, 0x00, 1000), (0, 0x00, 0)])
+    assert controller.get_frame().JoyL.X == 1000
+
+# Controller Classes updated from the packed Button bits equal the view members
+def test_component_update():
+    rng = random.Random(0)
+    for gamepad_type in ('XBOX', 'PS3'):
+        controller = Controller(SyntheticBackend(gamepad_type), monitor=False)
+        for _ in range(200):
+            state = controller._update_state
+            state[CtrlToolbox.STATE_BUTTONS] = rng.getrandbits(16)
+            for index in range(CtrlToolbox.STATE_BUTTONS):
+                state[index] = rng.randint(0, 255) if index >= 4 else rng.randint(-32768, 32767)
+            for component in controller._components:
+                component.update()
+                assert component.state == component.read(type(component.state)())
+
+        # Members of the Controller Classes
+        assert (controller.Button.Start, controller.DPad.U, controller.TrigRight.B2, controller.JoyLeft.PB) == \
+               (controller.GenericButton.Start, controller.GenericButton.DPad_U, controller.GenericButton.RB2, controller.GenericButton.PB_L)
+        assert controller.JoyLeft.X == CtrlToolbox.scale_input_joystick(controller.GenericAxis.JoyL_X, controller.JoyLeft.ScalingData)
+
+# Main Function
+# ------------------------------
+if __name__ == '__main__':
+    test_views_share_state()
+    test_dispatch_table_state()
+    test_frame_copy()
+    test_button_bitmask()
+    test_frame_button_edges()
+    test_report_coalescing()
+    test_report_dropped()
+    test_report_resync()
+    test_component_update()
+    print('Controller State: OK')
@@ -0,0 +1,143 @@
+# Device Profile Test
+# ------------------------------
+# Description:
+# Test of the Device Profile registry keyed by USB vendor/product ID
+# and the Device Cache of the resolved Device Profiles
+
+# Version
+# ------------------------------
+# 0.2   -   8BitDo X-input product IDs only
+#           [18.10.2026] - Jan T. Olsen
+# 0.1   -   Axial Deadband of unsigned Joystick ranges
+#           [18.10.2026] - Jan T. Olsen
+# 0.0   -   Initial version
+#           [18.10.2026] - Jan T. Olsen
+
+# Import packages
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import ctrl_toolbox as CtrlToolbox
+from ctrl_main import Controller
+from lib.device import DeviceCache
+from lib.synthetic import SyntheticBackend
+
+# Synthetic gamepad with a given USB ID and name
+def _backend(vendor, product, name = None, profile = 'XBOX'):
+    backend = SyntheticBackend(profile)
+    backend.vendor, backend.product = vendor, product
+    if name is not None:
+        backend.name = name
+    return backend
+
+# Device Profile by USB ID, vendor ID and device name
+def test_device_profile_registry():
+    find = CtrlToolbox.find_device_profile
+    assert find(0x054c, 0x09cc, 'Wireless Controller').name == 'DUALSHOCK4'
+    assert find(0x045e, 0x0b12, 'Microsoft Xbox Series S|X Controller').name == 'XBOX_SERIES'
+    assert find(0x2dc8, 0x3106, 'Some pad').name == '8BITDO'
+    assert find(0x2dc8, 0x6012, '8BitDo SN30 Pro') is None
+    assert find(0x2dc8, 0x6012, 'Microsoft X-Box 360 pad').name == 'XBOX'
+    assert find(None, None, 'Sony PLAYSTATION(R)3 Controller').name == 'PS3'
+    assert find(0x1234, 0x5678, 'Microsoft X-Box 360 pad').name == 'XBOX'
+    assert find(0x1234, 0x5678, 'Generic USB Joystick') is None
+    assert CtrlToolbox.get_controller_type('Generic USB Joystick') == 'UNKNOWN'
+
+    # Registered profiles take precedence and can be replaced
+    custom = CtrlToolbox.DeviceProfile('CUSTOM', 'PS3', ids = ((0x1234, 0x5678), (0x4321, None)), names = ('Generic',))
+    CtrlToolbox.register_device_profile(custom)
+    try:
+        assert find(0x1234, 0x5678, '') is custom
+        assert find(0x4321, 0x0001, '') is custom
+        assert find(None, None, 'Generic Microsoft pad') is custom
+        CtrlToolbox.register_device_profile(CtrlToolbox.DeviceProfile('CUSTOM', 'PS3'))
+        assert find(0x1234, 0x5678, '') is None
+    finally:
+        del CtrlToolbox.DEVICE_PROFILES['CUSTOM']
+
+    # Invalid Device Profiles
+    for profile in (CtrlToolbox.DeviceProfile('INVALID', 'N64'),
+                    CtrlToolbox.DeviceProfile('INVALID', 'XBOX', profile = {'JOYSTICK_SCALING' : {'RANGE' : 1}})):
+        try:
+            CtrlToolbox.register_device_profile(profile)
+        except ValueError:
+            continue
+        assert False, profile
+    assert 'INVALID' not in CtrlToolbox.DEVICE_PROFILES
+
+# Controller Constants of the Device Profile
+def test_controller_device_profile():
+    controller = Controller(_backend(0x054c, 0x05c4, 'Wireless Controller'), monitor=False)
+    assert (controller.device_profile.name, controller.gamepad_type) == ('DUALSHOCK4', 'XBOX')
+    assert controller.JoyLeft.ScalingData.RAW_MAX == 255
+
+    # Joystick Axes in range [0, 255] with radial Deadzone around the center
+    controller._process_events([(3, 0x00, 131), (3, 0x01, 124), (0, 0x00, 0)])
+    controller.update()
+    assert (controller.JoyLeft.state.X, controller.JoyLeft.state.Y) == (0.0, 0.0)
+    controller._process_events([(3, 0x00, 255), (3, 0x01, 127), (0, 0x00, 0)])
+    controller.update()
+    assert controller.JoyLeft.state.X == 100.0 and abs(controller.JoyLeft.state.Y) < 0.5
+
+    # Unknown gamepad
+    try:
+        Controller(_backend(0x1234, 0x5678, 'Generic USB Joystick'), monitor=False)
+    except TypeError:
+        pass
+    else:
+        assert False
+
+# Axial Deadband centered on the middle of the unsigned range [0, 255]
+def test_device_profile_deadband():
+    for name in ('DUALSHOCK4', 'DUALSENSE'):
+        CONST = CtrlToolbox.apply_profile(CtrlToolbox.XBOXONE_CONST(), CtrlToolbox.DEVICE_PROFILES[name].profile)
+        SCALING = CONST.JOYSTICK_SCALING
+        SCALING.DEADZONE = 'axial'
+        assert SCALING.get_raw_center() == 127.5
+        assert [CtrlToolbox.scale_input_joystick(raw, SCALING) for raw in (0, 120, 128, 135, 255)] == [-100.0, 0.0, 0.0, 0.0, 100.0]
+        assert CtrlToolbox.scale_input_joystick(119, SCALING) == -CtrlToolbox.scale_input_joystick(136, SCALING) < 0.0
+        assert CtrlToolbox.scale_input_array([0, 128, 255], SCALING).tolist() == [-100.0, 0.0, 100.0]
+        assert CtrlToolbox.scale_input_array([0.0, 128.0, 255.0], SCALING).tolist() == [-100.0, 0.0, 100.0]
+
+    # Deadband of signed ranges and Triggers stays at raw value 0
+    CONST = CtrlToolbox.XBOXONE_CONST()
+    assert CONST.JOYSTICK_SCALING.get_raw_center() == CONST.TRIGGER_SCALING.get_raw_center() == 0
+
+# Device Profile resolved once and taken from the Device Cache
+def test_device_cache():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'cache', 'devices.json')
+        controller = Controller(SyntheticBackend('PS3'), monitor=False, device_cache=path)
+        assert controller.gamepad_type == 'PS3'
+        with open(path) as file:
+            devices = json.load(file)['devices']
+        assert [entry['profile'] for entry in devices.values()] == ['PS3']
+
+        # Cached Device Profile without matching
+        get_device_profile = CtrlToolbox.get_device_profile
+        CtrlToolbox.get_device_profile = None
+        try:
+            cache = DeviceCache(path)
+            assert cache.resolve(SyntheticBackend('PS3')).name == 'PS3'
+        finally:
+            CtrlToolbox.get_device_profile = get_device_profile
+
+        # No cached event device connected
+        assert cache.get_backend() is None
+
+        # Invalid cache file
+        with open(path, 'w') as file:
+            file.write('[')
+        assert DeviceCache(path).devices == dict()
+
+# Main Function
+# ------------------------------
+if __name__ == '__main__':
+    test_device_profile_registry()
+    test_controller_device_profile()
+    test_device_profile_deadband()
+    test_device_cache()
+    print('Device Profile: OK')
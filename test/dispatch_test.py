@@ -0,0 +1,144 @@
+# Dispatch-Table Test
+# ------------------------------
+# Description:
+# Parity test of the compiled Dispatch-Tables against
+# the event functions (XBOX_event_Axis / XBOX_event_Button, PS3_event_Axis / PS3_event_Button)
+# over all event codes of the Controller Constants
+
+# Version
+# ------------------------------
+# 0.0   -   Initial version
+#           [18.10.2026] - Jan T. Olsen
+
+# Import packages
+import dataclasses
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import ctrl_toolbox as CtrlToolbox
+
+# Event of the inputs package
+class _Event():
+    def __init__(self, ev_type, code, state):
+        self.ev_type = ev_type
+        self.code = code
+        self.state = state
+
+# Event states of Axis, Button and hat events
+STATES = (-32768, -1000, -1, 0, 1, 2, 255, 32767)
+
+# All event types and codes of the Controller Constants
+# (every code with every type, and codes not used by the controller)
+def _event_keys(CONST):
+    KEY = CONST.EVENTKEY
+    codes = [getattr(KEY, field.name) for field in dataclasses.fields(KEY)]
+    codes = sorted(set(code for code in codes if code.strip())) + ['ABS_UNUSED', 'BTN_UNUSED']
+    return [(ev_type, code) for ev_type in (KEY.AXIS_EVENT, KEY.BTN_EVENT) for code in codes]
+
+# Event functions writing to the views of a Controller State
+def _event_functions(gamepad_type, CONST, state):
+    JoyL = CtrlToolbox.JoystickData(state, 'L')
+    JoyR = CtrlToolbox.JoystickData(state, 'R')
+    TrigL = CtrlToolbox.TriggerData(state, 'L')
+    TrigR = CtrlToolbox.TriggerData(state, 'R')
+    DPad = CtrlToolbox.DPadData(state)
+    AxisData = CtrlToolbox.GenericAxisData(state)
+    ButtonData = CtrlToolbox.GenericButtonData(state)
+    if gamepad_type == 'PS3':
+        event_axis, event_button, Button = CtrlToolbox.PS3_event_Axis, CtrlToolbox.PS3_event_Button, CtrlToolbox.PS_ButtonData(state)
+    else:
+        event_axis, event_button, Button = CtrlToolbox.XBOX_event_Axis, CtrlToolbox.XBOX_event_Button, CtrlToolbox.XBOX_ButtonData(state)
+
+    def handle(event):
+        event_axis(event, CONST, JoyL, JoyR, TrigL, TrigR, AxisData)
+        event_button(event, CONST, JoyL, JoyR, TrigL, TrigR, DPad, Button, ButtonData)
+
+    return handle, DPad
+
+# Hat event clears the opposite direction
+# (intended difference of the Dispatch-Table, see CtrlToolbox._hat_setter)
+def _hat_rule(event, KEY, DPad):
+    if event.ev_type != KEY.AXIS_EVENT or not event.state:
+        return
+    if event.code == KEY.DPAD_X:
+        if event.state < 0:
+            DPad.R = 0
+        else:
+            DPad.L = 0
+    elif event.code == KEY.DPAD_Y:
+        if event.state < 0:
+            DPad.D = 0
+        else:
+            DPad.U = 0
+
+# Random event sequence over all event codes
+def _check_parity(gamepad_type, CONST, dispatch_table, seed, hat_rule = True):
+    rng = random.Random(seed)
+    keys = _event_keys(CONST)
+    KEY = CONST.EVENTKEY
+
+    state = CtrlToolbox.new_state()
+    table = dispatch_table(CONST, state)
+    legacy_state = CtrlToolbox.new_state()
+    handle, DPad = _event_functions(gamepad_type, CONST, legacy_state)
+
+    for _ in range(20000):
+        ev_type, code = rng.choice(keys)
+        value = rng.choice(STATES)
+        # (without the hat rule: hat axis returns to 0 before changing direction)
+        if not hat_rule and code in (KEY.DPAD_X, KEY.DPAD_Y) and ev_type == KEY.AXIS_EVENT:
+            hat = DPad.L or DPad.R if code == KEY.DPAD_X else DPad.U or DPad.D
+            value = 0 if hat else value
+        event = _Event(ev_type, code, value)
+
+        previous = list(state)
+        components = CtrlToolbox.dispatch_event(table, event)
+        handle(event)
+        if hat_rule:
+            _hat_rule(event, KEY, DPad)
+
+        assert list(state) == list(legacy_state), (event.ev_type, event.code, event.state)
+        assert bool(components) == (list(state) != previous), (event.ev_type, event.code, event.state)
+
+# XBOX Dispatch-Table equals the XBOX event functions (with the hat rule)
+def test_xbox_dispatch_table():
+    for seed in range(3):
+        _check_parity('XBOX', CtrlToolbox.XBOXONE_CONST(), CtrlToolbox.XBOX_dispatch_table, seed)
+
+# XBOX Dispatch-Table equals the XBOX event functions when the hat returns to the center
+def test_xbox_dispatch_table_centered_hat():
+    _check_parity('XBOX', CtrlToolbox.XBOXONE_CONST(), CtrlToolbox.XBOX_dispatch_table, 3, hat_rule=False)
+
+# Hat changing direction without center event
+def test_xbox_hat_direction():
+    CONST = CtrlToolbox.XBOXONE_CONST()
+    KEY = CONST.EVENTKEY
+    state = CtrlToolbox.new_state()
+    table = CtrlToolbox.XBOX_dispatch_table(CONST, state)
+    legacy_state = CtrlToolbox.new_state()
+    handle, DPad = _event_functions('XBOX', CONST, legacy_state)
+
+    for value in (-1, 1):
+        event = _Event(KEY.AXIS_EVENT, KEY.DPAD_X, value)
+        CtrlToolbox.dispatch_event(table, event)
+        handle(event)
+
+    # Dispatch-Table: Right only, event functions: Left and Right
+    assert CtrlToolbox.button_names(state[CtrlToolbox.STATE_BUTTONS]) == ('DPad_R',)
+    assert (DPad.L, DPad.R) == (1, 1)
+
+# PS3 Dispatch-Table equals the PS3 event functions
+def test_ps3_dispatch_table():
+    for seed in range(3):
+        _check_parity('PS3', CtrlToolbox.PS3_CONST(), CtrlToolbox.PS3_dispatch_table, seed, hat_rule=False)
+
+# Main Function
+# ------------------------------
+if __name__ == '__main__':
+    test_xbox_dispatch_table()
+    test_xbox_dispatch_table_centered_hat()
+    test_xbox_hat_direction()
+    test_ps3_dispatch_table()
+    print('Dispatch-Table: OK')
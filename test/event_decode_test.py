@@ -0,0 +1,77 @@
+# Input Event Decoding Test
+# ------------------------------
+# Description:
+# Test of the bulk decoding of input event records
+# and of their dispatch to the Controller, using byte fixtures
+
+# Version
+# ------------------------------
+# 0.1   -   NumPy decoding test skipped without NumPy
+#           [18.10.2026] - Jan T. Olsen
+# 0.0   -   Initial version
+#           [18.10.2026] - Jan T. Olsen
+
+# Import packages
+import os
+import struct
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import ctrl_toolbox as CtrlToolbox
+from ctrl_main import Controller
+
+# Byte Fixture
+# ------------------------------
+# Left Joystick X, Button A pressed, Right Trigger, Sync Report
+EVENTS = [(3, 0x00, 20000),
+          (1, 0x130, 1),
+          (3, 0x05, 512),
+          (0, 0x00, 0)]
+DATA = b''.join(struct.pack(CtrlToolbox.EVENT_FORMAT, 1700000000, index, *event)
+                for index, event in enumerate(EVENTS))
+
+# Fixture Backend
+class FixtureBackend():
+    int_keys = True
+    name = 'Microsoft X-Box One S pad'
+
+    def __str__(self):
+        return self.name
+
+# Decoding of whole records
+def test_decode_events():
+    assert CtrlToolbox.decode_events(DATA) == EVENTS
+    assert CtrlToolbox.decode_events(memoryview(bytearray(DATA))) == EVENTS
+    assert CtrlToolbox.decode_events(b'') == []
+
+# Trailing partial record is ignored
+def test_decode_partial_record():
+    assert CtrlToolbox.decode_events(DATA + DATA[:10]) == EVENTS
+
+# NumPy decoding
+def test_decode_events_array():
+    pytest.importorskip('numpy')
+    events = CtrlToolbox.decode_events_array(DATA)
+    assert list(zip(events['type'].tolist(), events['code'].tolist(), events['value'].tolist())) == EVENTS
+    assert events['tv_usec'].tolist() == list(range(len(EVENTS)))
+
+# Dispatch of decoded events to the Controller
+def test_dispatch_decoded_events():
+    controller = Controller(FixtureBackend(), monitor=False)
+    controller._process_events(CtrlToolbox.decode_events(DATA))
+    frame = controller.get_frame()
+    assert frame.JoyL.X == 20000
+    assert frame.Button.A == 1
+    assert frame.TrigR.VAL == 512
+    assert frame.changed == (CtrlToolbox.COMPONENT_JOY_L | CtrlToolbox.COMPONENT_TRIG_R | CtrlToolbox.COMPONENT_BUTTON)
+
+# Main Function
+# ------------------------------
+if __name__ == '__main__':
+    test_decode_events()
+    test_decode_partial_record()
+    test_decode_events_array()
+    test_dispatch_decoded_events()
+    print('Input Event Decoding: OK')
@@ -0,0 +1,99 @@
+# Axis Filter Test
+# ------------------------------
+# Description:
+# Test of the Axis Filter stages, the vectorized filter path
+# and the Axis Filters of the Controller Classes
+
+# Version
+# ------------------------------
+# 0.1   -   Vectorized filter path skipped without NumPy
+#           [18.10.2026] - Jan T. Olsen
+# 0.0   -   Initial version
+#           [18.10.2026] - Jan T. Olsen
+
+# Import packages
+import math
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import ctrl_toolbox as CtrlToolbox
+from ctrl_main import Controller
+from lib.clock import ManualClock
+from lib.filter import AxisFilter, EMAFilter, OneEuroFilter, SlewLimit, Hysteresis
+from lib.synthetic import SyntheticBackend
+
+# Recorded values with irregular times
+def _recording(np, count = 3000):
+    rng = np.random.default_rng(0)
+    times = np.cumsum(rng.uniform(0.001, 0.02, count))
+    times[10] = times[9]
+    values = np.clip(np.cumsum(rng.normal(0.0, 2.0, count)), -100.0, 100.0)
+    return values, times
+
+# Vectorized path equals the incremental path
+def test_filter_array_parity():
+    np = pytest.importorskip('numpy')
+    values, times = _recording(np)
+    for stages in ((EMAFilter(0.05),),
+                   (OneEuroFilter(1.0, 0.05),),
+                   (SlewLimit(200.0), Hysteresis(1.0)),
+                   (lambda value, dt, previous: 0.5 * (value + previous),)):
+        incremental = AxisFilter(stages)
+        expected = [incremental(value, time) for value, time in zip(values.tolist(), times.tolist())]
+
+        # (in two parts, continuing from the Filter State)
+        vectorized = AxisFilter(stages)
+        filtered = np.concatenate([vectorized.filter_array(values[:1000], times[:1000]),
+                                   vectorized.filter_array(values[1000:], times[1000:])])
+        assert np.allclose(filtered, expected, rtol=0.0, atol=1e-9)
+
+# Stages
+def test_stages():
+    # Slew Limit: 10 units per second
+    slew = AxisFilter((SlewLimit(10.0),))
+    assert [slew(value, time) for value, time in ((0.0, 0.0), (100.0, 1.0), (100.0, 2.0))] == [0.0, 10.0, 20.0]
+    assert not slew.settled
+
+    # Hysteresis: changes below 2 units are held
+    hysteresis = AxisFilter((Hysteresis(2.0),))
+    assert [hysteresis(value, 0.0) for value in (0.0, 1.0, -1.5, 2.5, 1.0)] == [0.0, 0.0, 0.0, 2.5, 2.5]
+
+    # EMA: one time constant
+    ema = AxisFilter((EMAFilter(1.0),))
+    ema(0.0, 0.0)
+    assert abs(ema(100.0, 1.0) - 100.0 * (1.0 - math.exp(-1.0))) < 1e-9
+
+# Controller Classes settle with update() after the last event
+def test_controller_filter_settling():
+    clock = ManualClock()
+    XBOX_CONST = CtrlToolbox.XBOXONE_CONST()
+    XBOX_CONST.JOYSTICK_FILTER = (EMAFilter(0.05),)
+    controller = Controller(SyntheticBackend('XBOX'), monitor=False, XBOX_CONST=XBOX_CONST, clock=clock)
+    controller.update()
+
+    controller._process_events([(3, 0x00, 32767), (0, 0x00, 0)])
+    assert controller.update()
+    assert abs(controller.JoyLeft.X) < 0.01
+    clock.advance(0.05)
+    assert controller.update()
+    assert 60.0 < controller.JoyLeft.X < 65.0
+    for _ in range(50):
+        clock.advance(0.05)
+        controller.update()
+    assert controller.JoyLeft.settled
+    assert abs(controller.JoyLeft.X - 100.0) <= 0.005
+    assert not controller.update()
+
+    # Trigger without Filter stages
+    assert controller.TrigLeft.filters == ()
+
+# Main Function
+# ------------------------------
+if __name__ == '__main__':
+    test_filter_array_parity()
+    test_stages()
+    test_controller_filter_settling()
+    print('Axis Filter: OK')
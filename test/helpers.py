@@ -0,0 +1,71 @@
+# Controller Test Helpers
+# ------------------------------
+# Description:
+# Test gamepad of the inputs package fed by the test
+# and synchronous Callback Executor shared by the Controller tests
+
+# Version
+# ------------------------------
+# 0.0   -   Initial version
+#           [18.10.2026] - Jan T. Olsen
+
+# Import packages
+import os
+import queue
+import sys
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from ctrl_main import Controller
+
+# Event of the inputs package
+class Event():
+    def __init__(self, ev_type, code, state):
+        self.ev_type = ev_type
+        self.code = code
+        self.state = state
+
+# Gamepad of the inputs package fed by the test
+class Gamepad():
+    def __init__(self):
+        self.reports = queue.Queue()
+        self.reads = 0
+        self._condition = threading.Condition()
+
+    def __str__(self):
+        return 'Microsoft X-Box 360 pad'
+
+    # Blocking read of the next report
+    # (the controller-monitor-thread reads again after processing the previous report)
+    def read(self):
+        with self._condition:
+            self.reads += 1
+            self._condition.notify_all()
+        return self.reports.get()
+
+    # Queue a report (with Synchronization event)
+    def send(self, *events):
+        self.reports.put([Event(*event) for event in events + (('Sync', 'SYN_REPORT', 0),)])
+
+    # Queue a report and wait until it is processed
+    def process(self, *events):
+        with self._condition:
+            assert self._condition.wait_for(lambda: self.reads and self.reports.empty(), timeout=5.0)
+            reads = self.reads
+            self.send(*events)
+            assert self._condition.wait_for(lambda: self.reads > reads, timeout=5.0)
+
+# Controller reading the test gamepad
+def get_controller():
+    gamepad = Gamepad()
+    return Controller(gamepad), gamepad
+
+# Synchronous Callback Executor recording the submitted callbacks
+class Executor():
+    def __init__(self):
+        self.calls = []
+
+    def submit(self, callback, *args):
+        self.calls.append(args)
+        callback(*args)
+        return True
@@ -0,0 +1,214 @@
+# Controller Latency
+# ------------------------------
+# Description:
+# End-to-end input latency harness
+# Measures the time from an event entering the controller-monitor-thread
+# until its value is visible through Controller.update() and the Controller Classes,
+# under configurable background load, and reports latency percentiles
+#
+# Usage:
+# python test/latency.py                                    Polling consumer, no load
+# python test/latency.py --consumer wait --load-threads 2   Waiting consumer, 2 busy threads
+# python test/latency.py --budget-p99 500                   Exit code 1 if p99 > 500 us
+#
+# Probes overwritten by the next probe before update() saw them are counted as superseded
+
+# Version
+# ------------------------------
+# 0.0   -   Initial version
+#           [18.10.2026] - Jan T. Olsen
+
+# Import packages
+import argparse
+import json
+import os
+import queue
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import ctrl_toolbox as CtrlToolbox
+from ctrl_main import Controller
+
+# Number of distinct probe values
+# (a probe value is reused only after this many probes)
+_PROBE_VALUES = 32000
+
+# Injection Backend
+# ------------------------------
+class InjectionBackend():
+    """
+    Injection Backend Class:
+    Backend delivering injected reports to the controller-monitor-thread,
+    stamping each probe report with the time it enters the monitor-thread
+    """
+    int_keys = True
+    name = 'Microsoft X-Box One S pad (latency)'
+
+    def __init__(self) -> None:
+        self.queue = queue.Queue()
+        self.entered = dict()   # probe value -> time entering the monitor-thread [ns]
+
+    def __str__(self) -> str:
+        return self.name
+
+    def read(self) -> list:
+        probe, events = self.queue.get()
+        if probe is not None:
+            self.entered[probe] = time.perf_counter_ns()
+        return events
+
+# Background Load
+# ------------------------------
+def _busy(stop : threading.Event) -> None:
+    # Pure Python work competing for the interpreter
+    value = 0
+    while not stop.is_set():
+        for index in range(1000):
+            value += index * index
+
+# Percentile
+# ------------------------------
+def percentile(values : list, percent : float) -> float:
+    """
+    Nearest-rank percentile
+    :param values: Sorted values (list)
+    :param percent: Percentile in range [0, 100] (float)
+    :return value: Percentile value
+    """
+    if not values:
+        return float('nan')
+    rank = max(1, -(-len(values) * percent // 100))
+    return values[int(rank) - 1]
+
+# Measure Latency
+# ------------------------------
+def measure(count : int = 5000,
+            rate : float = 1000.0,
+            consumer : str = 'poll',
+            load_threads : int = 0,
+            noise_rate : float = 0.0,
+            seed : int = 0) -> dict:
+    """
+    Inject probe reports into a running Controller and measure their visibility latency
+    :param count: Number of probe reports (int)
+    :param rate: Probe reports per second (float)
+    :param consumer: Consumer loop, 'poll' (update() in a loop) or 'wait' (wait_for_change() and update())
+    :param load_threads: Number of busy background threads (int)
+    :param noise_rate: Additional reports of other inputs per second (float)
+    :param seed: Seed of the noise reports (int)
+    :return result: Latencies [us] and number of probes superseded before being seen (dict)
+    """
+    backend = InjectionBackend()
+    controller = Controller(backend)
+    latencies = []
+    seen = [0]
+    stop = threading.Event()
+
+    # Consumer thread: observe probe values through update() and the Joystick Class
+    def consume() -> None:
+        last = None
+        while not stop.is_set():
+            if consumer == 'wait':
+                controller.wait_for_change(timeout=0.1, components=CtrlToolbox.COMPONENT_JOY_L)
+            if controller.update():
+                value = controller.JoyLeft.joystickData.X
+                if value != last:
+                    now = time.perf_counter_ns()
+                    entered = backend.entered.pop(value, None)
+                    if entered is not None:
+                        latencies.append((now - entered) / 1000.0)
+                        seen[0] += 1
+                    last = value
+            elif consumer == 'poll':
+                time.sleep(0)
+
+    # Noise thread: reports of other inputs
+    def noise() -> None:
+        rng = random.Random(seed)
+        keys = [(3, 0x03), (3, 0x04), (3, 0x02), (1, 0x130), (1, 0x131)]
+        while not stop.is_set():
+            key = rng.choice(keys)
+            backend.queue.put((None, [key + (rng.randint(0, 255),), (0, 0, 0)]))
+            time.sleep(1.0 / noise_rate)
+
+    threads = [threading.Thread(target=consume, daemon=True)]
+    threads += [threading.Thread(target=_busy, args=(stop,), daemon=True) for _ in range(load_threads)]
+    if noise_rate > 0:
+        threads.append(threading.Thread(target=noise, daemon=True))
+    for thread in threads:
+        thread.start()
+
+    # Inject probe reports
+    # (Left Joystick X carries the probe value)
+    start = time.perf_counter()
+    for index in range(count):
+        delay = start + index / rate - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        probe = index % _PROBE_VALUES + 1
+        backend.queue.put((probe, [(3, 0x00, probe), (0, 0, 0)]))
+
+    # Let the last probe become visible
+    time.sleep(0.2)
+    stop.set()
+    for thread in threads:
+        thread.join(timeout=1.0)
+
+    return {'latencies' : sorted(latencies),
+            'superseded' : count - seen[0]}
+
+# Summary
+# ------------------------------
+def summary(result : dict) -> dict:
+    """
+    Latency percentiles
+    :param result: Result of measure() (dict)
+    :return summary: p50, p99, p99.9 and max latency [us], number of samples and superseded probes (dict)
+    """
+    latencies = result['latencies']
+    return {'samples' : len(latencies),
+            'superseded' : result['superseded'],
+            'p50_us' : percentile(latencies, 50),
+            'p99_us' : percentile(latencies, 99),
+            'p999_us' : percentile(latencies, 99.9),
+            'max_us' : latencies[-1] if latencies else float('nan')}
+
+# Main Function
+# ------------------------------
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Controller end-to-end input latency')
+    parser.add_argument('--count', type=int, default=5000, help='number of probe reports (default 5000)')
+    parser.add_argument('--rate', type=float, default=1000.0, help='probe reports per second (default 1000)')
+    parser.add_argument('--consumer', choices=('poll', 'wait'), default='poll', help='consumer loop (default poll)')
+    parser.add_argument('--load-threads', type=int, default=0, help='busy background threads (default 0)')
+    parser.add_argument('--noise-rate', type=float, default=0.0, help='reports of other inputs per second (default 0)')
+    parser.add_argument('--switch-interval', type=float, help='interpreter thread switch interval in s (default: unchanged)')
+    parser.add_argument('--budget-p99', type=float, help='p99 latency budget in us (exit code 1 if exceeded)')
+    parser.add_argument('--json', help='save summary to JSON file')
+    args = parser.parse_args()
+
+    # Interpreter thread switch interval
+    if args.switch_interval is not None:
+        sys.setswitchinterval(args.switch_interval)
+
+    result = summary(measure(args.count, args.rate, args.consumer, args.load_threads, args.noise_rate))
+
+    print('Consumer: {}, load threads: {}, noise: {:g} reports/s, switch interval: {:g} s'.format(args.consumer, args.load_threads,
+                                                                                               args.noise_rate, sys.getswitchinterval()))
+    print('Samples: {samples}, superseded: {superseded}'.format(**result))
+    print('p50: {p50_us:.1f} us, p99: {p99_us:.1f} us, p99.9: {p999_us:.1f} us, max: {max_us:.1f} us'.format(**result))
+
+    # Save summary
+    if args.json:
+        with open(args.json, 'w') as json_file:
+            json.dump(dict(result, consumer=args.consumer, load_threads=args.load_threads,
+                           noise_rate=args.noise_rate, rate=args.rate,
+                           switch_interval=sys.getswitchinterval()), json_file, indent=2)
+
+    # Latency budget
+    if args.budget_p99 is not None and result['p99_us'] > args.budget_p99:
+        print('p99 latency exceeds budget of {:g} us'.format(args.budget_p99))
+        sys.exit(1)
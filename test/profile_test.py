@@ -0,0 +1,134 @@
+# Controller Profile Test
+# ------------------------------
+# Description:
+# Test of Controller profiles loaded from file
+# and the swap of reloaded profiles while events are processed
+
+# Version
+# ------------------------------
+# 0.1   -   Invalid scaling values and reload errors
+#           [18.10.2026] - Jan T. Olsen
+# 0.0   -   Initial version
+#           [18.10.2026] - Jan T. Olsen
+
+# Import packages
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import ctrl_toolbox as CtrlToolbox
+from ctrl_main import Controller
+from lib.profile import ProfileWatcher
+from lib.synthetic import SyntheticBackend
+
+# Write profile file
+def _write_profile(path, profile):
+    with open(path, 'w') as file:
+        file.write(profile if isinstance(profile, str) else json.dumps(profile))
+
+# Profile applied on top of the base Controller Constants
+def test_apply_profile():
+    base = CtrlToolbox.XBOXONE_CONST()
+    const = CtrlToolbox.apply_profile(base, {'type' : 'XBOX',
+                                             'EVENTKEY' : {'BTN_S' : 'BTN_EAST'},
+                                             'JOYSTICK_SCALING' : {'RAW_DB' : 4000, 'DEADZONE' : 'radial'}})
+    assert (const.EVENTKEY.BTN_S, const.EVENTKEY.BTN_E) == ('BTN_EAST', base.EVENTKEY.BTN_E)
+    assert (const.JOYSTICK_SCALING.RAW_DB, const.JOYSTICK_SCALING.DEADZONE) == (4000, 'radial')
+    assert (base.EVENTKEY.BTN_S, base.JOYSTICK_SCALING.RAW_DB) == ('BTN_SOUTH', 1000)
+    assert const.TRIGGER_SCALING == base.TRIGGER_SCALING
+
+    # Invalid profiles
+    for profile in ({'type' : 'PS3'},
+                    {'JOYSTICK_SCALING' : {'RAW_DEADBAND' : 10}},
+                    {'BUTTONS' : {}},
+                    {'JOYSTICK_SCALING' : {'CURVE' : 'cubic'}},
+                    {'TRIGGER_SCALING' : {'RAW_MAX' : 0}},
+                    {'TRIGGER_SCALING' : {'RAW_DB' : 128}},
+                    {'JOYSTICK_SCALING' : {'RAW_DB' : -1}},
+                    {'JOYSTICK_SCALING' : {'RAW_DB' : '1000'}},
+                    {'JOYSTICK_SCALING' : {'RAW_MIN' : -32768.5}},
+                    {'TRIGGER_SCALING' : {'MAX' : True}}):
+        try:
+            CtrlToolbox.apply_profile(base, profile)
+        except ValueError:
+            continue
+        assert False, profile
+
+# Controller constructed with a profile file
+def test_controller_profile():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'profile.json')
+        _write_profile(path, {'TRIGGER_SCALING' : {'MAX' : 1.0}})
+        controller = Controller(SyntheticBackend('XBOX'), monitor=False, profile=path)
+
+    assert controller.TrigLeft.ScalingDataConstants.MAX == 1.0
+    controller._process_events([(3, 0x02, 255), (0, 0x00, 0)])
+    controller.update()
+    assert controller.TrigLeft.state.T == 1.0
+
+# Reloaded profile is swapped at the end of the report and on update()
+def test_profile_swap():
+    controller = Controller(SyntheticBackend('XBOX'), monitor=False)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'profile.json')
+        _write_profile(path, {'EVENTKEY' : {'BTN_S' : 'BTN_EAST', 'BTN_E' : 'BTN_SOUTH'},
+                              'JOYSTICK_SCALING' : {'RAW_DB' : 0, 'CURVE' : 'expo', 'EXPO' : 1.0}})
+
+        # Profile loaded during a report: the report completes with the previous Dispatch-Table
+        controller._process_events([(1, 0x130, 1), (3, 0x00, 16384)])
+        controller.load_profile(path)
+    controller._process_events([(0, 0x00, 0)])
+    assert controller.get_frame().buttons == CtrlToolbox.BUTTON_S
+
+    # Next report uses the swapped Button mapping
+    controller._process_events([(1, 0x131, 0), (1, 0x130, 1), (0, 0x00, 0)])
+    assert controller.get_frame().buttons == CtrlToolbox.BUTTON_E
+
+    # Scaling Constants swapped by update()
+    assert controller.JoyLeft.ScalingData.RAW_DB == 1000
+    assert controller.update()
+    assert controller.XBOX_CONST.JOYSTICK_SCALING.RAW_DB == 0
+    assert controller.JoyLeft.ScalingData is controller.XBOX_CONST.JOYSTICK_SCALING
+    assert abs(controller.JoyLeft.X - 100.0 * 0.5 ** 3) < 0.01
+    assert not controller.update()
+
+# Profile Watcher reloads changed profile files only
+def test_profile_watcher():
+    loaded = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'profile.json')
+        _write_profile(path, {})
+
+        def reload(path):
+            loaded.append(CtrlToolbox.read_profile(path))
+        watcher = ProfileWatcher(path, reload, interval=3600.0)
+        assert not watcher.check()
+
+        _write_profile(path, {'JOYSTICK_SCALING' : {'RAW_DB' : 2000}})
+        assert watcher.check() and not watcher.check()
+
+        # Invalid profile is reported and skipped
+        _write_profile(path, '{"JOYSTICK_SCALING" :')
+        assert not watcher.check()
+
+        # Any error of the reload function is reported and skipped
+        def reload_error(path):
+            raise ZeroDivisionError('division by zero')
+        watcher.reload = reload_error
+        _write_profile(path, {'TRIGGER_SCALING' : {'RAW_MAX' : 0}})
+        assert not watcher.check()
+        assert watcher._thread.is_alive()
+        watcher.stop()
+
+    assert loaded == [{'JOYSTICK_SCALING' : {'RAW_DB' : 2000}}]
+
+# Main Function
+# ------------------------------
+if __name__ == '__main__':
+    test_apply_profile()
+    test_controller_profile()
+    test_profile_swap()
+    test_profile_watcher()
+    print('Controller Profile: OK')
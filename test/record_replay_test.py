@@ -0,0 +1,136 @@
+# Record and Replay Test
+# ------------------------------
+# Description:
+# Test of recording the event stream of a Controller
+# and replaying the recording with identical Controller state
+
+# Version
+# ------------------------------
+# 0.1   -   USB vendor/product ID in the recording header
+#           [18.10.2026] - Jan T. Olsen
+# 0.0   -   Initial version
+#           [18.10.2026] - Jan T. Olsen
+
+# Import packages
+import os
+import random
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import ctrl_toolbox as CtrlToolbox
+from ctrl_main import Controller
+from lib.record import ReplayBackend, read_recording, read_recording_header, RECORD_EVENT, RECORD_HEADER_V1, RECORD_MAGIC_V1
+
+# Fixture Backend
+class FixtureBackend():
+    int_keys = True
+    name = 'Microsoft X-Box One S pad'
+
+    def __str__(self):
+        return self.name
+
+# Fixture Backend with USB vendor/product ID
+class FixtureIdBackend(FixtureBackend):
+    vendor = 0x045e
+    product = 0x02ea
+
+# Random reports of the Event-Keys used by the Dispatch-Table
+def _random_reports(controller, count, seed=0):
+    rng = random.Random(seed)
+    keys = [key for key in controller._dispatch_table if key != (0, 0)]
+    return [[key + (rng.randint(-32768, 32767),) for key in rng.sample(keys, rng.randint(1, 4))] + [(0, 0, 0)]
+            for _ in range(count)]
+
+# Controller Component state of a Frame
+def _state(frame):
+    return (frame.JoyL, frame.JoyR, frame.TrigL, frame.TrigR, frame.DPad, frame.Button)
+
+# Live run and recording
+def _record(path, count=2000):
+    controller = Controller(FixtureBackend(), monitor=False)
+    controller.start_recording(path)
+    for report in _random_reports(controller, count):
+        controller._process_events(report)
+    controller.stop_recording()
+    return controller
+
+# Replay produces identical Controller state
+def test_replay_identical_state():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'record.bin')
+        live = _record(path)
+
+        replay = ReplayBackend(path, realtime=False)
+        controller = Controller(replay)
+        assert replay.finished.wait(timeout=10.0)
+        assert _state(controller.get_frame()) == _state(live.get_frame())
+
+# Interrupted recording is continued after the last complete record
+def test_continue_interrupted_recording():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'record.bin')
+        _record(path, count=10)
+        _, events = read_recording(path)
+        with open(path, 'ab') as record_file:
+            record_file.write(RECORD_EVENT.pack(0.0, 3, 0, 1)[:7])
+
+        controller = Controller(FixtureBackend(), monitor=False)
+        controller.start_recording(path)
+        controller._process_events([(3, 0, 100), (0, 0, 0)])
+        controller.stop_recording()
+
+        name, continued = read_recording(path)
+        assert name == FixtureBackend.name
+        assert continued[:len(events)] == events
+        assert [event[1:] for event in continued[len(events):]] == [(3, 0, 100), (0, 0, 0)]
+        assert continued[-1][0] >= events[-1][0]
+
+# USB vendor/product ID recorded in the header
+def test_recording_header():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'record.bin')
+        controller = Controller(FixtureIdBackend(), monitor=False)
+        controller.start_recording(path)
+        controller._process_events([(3, 0, 100), (0, 0, 0)])
+        controller.stop_recording()
+        assert read_recording_header(path) == (FixtureBackend.name, 0x045e, 0x02ea)
+
+        # Replay Backend identified by the recorded USB IDs
+        replay = ReplayBackend(path, realtime=False)
+        assert (str(replay), replay.vendor, replay.product) == (FixtureBackend.name, 0x045e, 0x02ea)
+        assert CtrlToolbox.get_device_profile(replay).name == 'XBOX'
+
+        # Gamepad without USB IDs
+        path = os.path.join(directory, 'record_no_id.bin')
+        _record(path, count=1)
+        assert read_recording_header(path) == (FixtureBackend.name, None, None)
+
+# Recording of version 1 without USB IDs
+def test_recording_version_1():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'record_v1.bin')
+        name = FixtureBackend.name.encode('utf-8')
+        with open(path, 'wb') as record_file:
+            record_file.write(RECORD_HEADER_V1.pack(RECORD_MAGIC_V1, len(name)) + name)
+            record_file.write(RECORD_EVENT.pack(0.5, 3, 0, 100) + RECORD_EVENT.pack(0.5, 0, 0, 0))
+
+        replay = ReplayBackend(path, realtime=False)
+        assert (str(replay), replay.vendor, replay.product) == (FixtureBackend.name, None, None)
+        assert read_recording(path)[1] == [(0.5, 3, 0, 100), (0.5, 0, 0, 0)]
+
+        # Continued version 1 recording
+        controller = Controller(FixtureBackend(), monitor=False)
+        controller.start_recording(path)
+        controller._process_events([(3, 0, 200), (0, 0, 0)])
+        controller.stop_recording()
+        assert [event[1:] for event in read_recording(path)[1]] == [(3, 0, 100), (0, 0, 0), (3, 0, 200), (0, 0, 0)]
+
+# Main Function
+# ------------------------------
+if __name__ == '__main__':
+    test_replay_identical_state()
+    test_continue_interrupted_recording()
+    test_recording_header()
+    test_recording_version_1()
+    print('Record and Replay: OK')
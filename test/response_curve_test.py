@@ -0,0 +1,217 @@
+# Response Curve Test
+# ------------------------------
+# Description:
+# Test of the Joystick Response Curves, compiled into the scaling Lookup-Tables,
+# and the radial Deadzone fast path
+
+# Version
+# ------------------------------
+# 0.4   -   NumPy paths skipped without NumPy
+#           [18.10.2026] - Jan T. Olsen
+# 0.3   -   Callback Executor of the shared test helpers
+#           [18.10.2026] - Jan T. Olsen
+# 0.2   -   Axis callbacks settling after the last report
+#           [18.10.2026] - Jan T. Olsen
+# 0.1   -   Axis callbacks and batch scaling with radial Deadzone, Response Curve and Axis Filters
+#           [18.10.2026] - Jan T. Olsen
+# 0.0   -   Initial version
+#           [18.10.2026] - Jan T. Olsen
+
+# Import packages
+import math
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import ctrl_toolbox as CtrlToolbox
+from ctrl_main import Controller
+from lib.clock import ManualClock
+from lib.filter import EMAFilter
+from lib.joystick import Joystick
+from lib.synthetic import SyntheticBackend
+from helpers import Executor
+
+# Exact radial scaling of a raw stick vector
+def _radial_reference(raw_x, raw_y, CONST):
+    x = CtrlToolbox.calc_minmax_scaling(raw_x, CONST.RAW_MIN, CONST.RAW_MAX, -1.0, 1.0)
+    y = CtrlToolbox.calc_minmax_scaling(raw_y, CONST.RAW_MIN, CONST.RAW_MAX, -1.0, 1.0)
+    radius = math.hypot(x, y)
+    if radius == 0.0:
+        return 0.0, 0.0
+    gain = CtrlToolbox.calc_radial_magnitude(radius, CONST.get_radial_deadzone(), CONST.get_curve()) / radius
+    return x * gain * 100.0, y * gain * 100.0
+
+# Expo Response Curve compiled into the Lookup-Table
+def test_expo_curve():
+    CONST = CtrlToolbox.XBOXONE_CONST().JOYSTICK_SCALING
+    linear = [CtrlToolbox.scale_input_joystick(raw, CONST) for raw in (-32768, -20000, 5000, 32767)]
+
+    # Curve change rebuilds the Lookup-Table
+    CONST.CURVE = 'expo'
+    CONST.EXPO = 0.5
+    for raw, value in zip((-32768, -20000, 5000, 32767), linear):
+        n = abs(value) / 100.0
+        expected = math.copysign((0.5 * n + 0.5 * n ** 3) * 100.0, value)
+        assert abs(CtrlToolbox.scale_input_joystick(raw, CONST) - expected) < 1e-9
+    assert CtrlToolbox.scale_input_joystick(32767, CONST) == 100.0
+    assert CtrlToolbox.scale_input_joystick(-32768, CONST) == -100.0
+
+    # Raw value outside the Lookup-Table
+    assert CtrlToolbox.scale_input_joystick(40000, CONST) == CONST.shape(CtrlToolbox.calc_minmax_scaling_deadband(40000, -32768, 32767, 1000, -100.0, 100.0))
+
+# Expo Response Curve of the NumPy paths
+def test_expo_curve_array():
+    np = pytest.importorskip('numpy')
+    CONST = CtrlToolbox.XBOXONE_CONST().JOYSTICK_SCALING
+    CONST.CURVE = 'expo'
+    CONST.EXPO = 0.5
+    raw_values = np.arange(-32768, 32768, 97)
+    expected = [CtrlToolbox.scale_input_joystick(raw, CONST) for raw in raw_values.tolist()]
+    assert np.allclose(CtrlToolbox.scale_input_array(raw_values, CONST), expected, rtol=0.0, atol=1e-9)
+    assert np.allclose(CtrlToolbox.scale_input_array(raw_values.astype(np.float64), CONST), expected, rtol=0.0, atol=1e-9)
+
+# Custom Response Curve
+def test_custom_curve():
+    CONST = CtrlToolbox.XBOXONE_CONST().JOYSTICK_SCALING
+    CONST.RAW_DB = 0
+    CONST.CURVE = lambda n: n * n
+    value = CtrlToolbox.scale_input_joystick(-16384, CONST)
+    assert abs(value + 25.0) < 0.01
+    assert CtrlToolbox.scale_input_rounded(-16384, CONST) == CtrlToolbox.round_value(value)
+
+    # Trigger Scaling Constants have a linear response
+    TRIGGER = CtrlToolbox.XBOXONE_CONST().TRIGGER_SCALING
+    assert TRIGGER.get_curve() is None
+
+# Radial Deadzone
+def test_radial_deadzone():
+    CONST = CtrlToolbox.XBOXONE_CONST().JOYSTICK_SCALING
+    CONST.DEADZONE = 'radial'
+
+    # Diagonal within the square Deadzone, but outside the circular Deadzone
+    assert CtrlToolbox.scale_input_radial(700, 700, CONST) == (0.0, 0.0)
+    x, y = CtrlToolbox.scale_input_radial(800, 800, CONST)
+    assert 0.0 < x == y < 1.0
+
+    # Full deflection on the diagonal keeps the direction
+    x, y = CtrlToolbox.scale_input_radial(32767, -32768, CONST)
+    assert abs(math.hypot(x, y) - 100.0) < 0.01 and abs(x + y) < 0.01
+
+    # Fast path equals the exact scaling, also with a Response Curve
+    rng = random.Random(0)
+    for curve in ('linear', 'expo'):
+        CONST.CURVE = curve
+        CONST.EXPO = 0.3
+        for _ in range(20000):
+            raw_x = rng.randint(-32768, 32767)
+            raw_y = rng.randint(-32768, 32767)
+            x, y = CtrlToolbox.scale_input_radial(raw_x, raw_y, CONST)
+            expected_x, expected_y = _radial_reference(raw_x, raw_y, CONST)
+            assert abs(x - expected_x) < 1e-3 and abs(y - expected_y) < 1e-3
+
+# Joystick Class with radial Deadzone
+def test_joystick_radial():
+    GAMEPAD_CONST = CtrlToolbox.XBOXONE_CONST()
+    GAMEPAD_CONST.JOYSTICK_SCALING.DEADZONE = 'radial'
+    joystick = Joystick('JoyL', GAMEPAD_CONST)
+    joystick.joystickData.X = 20000
+    joystick.joystickData.Y = -12000
+    joystick.update()
+
+    x, y = CtrlToolbox.scale_input_radial(20000, -12000, GAMEPAD_CONST.JOYSTICK_SCALING)
+    assert (joystick.X, joystick.Y) == (x, y)
+    assert (joystick.get_axis_X(), joystick.get_axis_Y()) == (x, y)
+    assert (joystick.state.X, joystick.state.Y) == (CtrlToolbox.round_value(x), CtrlToolbox.round_value(y))
+
+# Batch scaling with radial Deadzone
+def test_radial_array():
+    np = pytest.importorskip('numpy')
+    CONST = CtrlToolbox.XBOXONE_CONST().JOYSTICK_SCALING
+    CONST.DEADZONE = 'radial'
+    CONST.CURVE = 'expo'
+    CONST.EXPO = 0.3
+    rng = random.Random(1)
+    raw_x = [rng.randint(-32768, 32767) for _ in range(5000)] + [700, 32767, 0]
+    raw_y = [rng.randint(-32768, 32767) for _ in range(5000)] + [700, -32768, 0]
+    x, y = CtrlToolbox.scale_input_radial_array(raw_x, raw_y, CONST)
+    expected = [CtrlToolbox.scale_input_radial(values[0], values[1], CONST) for values in zip(raw_x, raw_y)]
+    assert np.allclose(x, [value[0] for value in expected], rtol=0.0, atol=1e-9)
+    assert np.allclose(y, [value[1] for value in expected], rtol=0.0, atol=1e-9)
+
+    # Axial batch scaling of a single Axis is refused
+    try:
+        CtrlToolbox.scale_input_array(raw_x, CONST)
+    except ValueError:
+        pass
+    else:
+        assert False
+
+# Axis callbacks equal the values of the Controller Classes
+def test_axis_callback_parity():
+    clock = ManualClock()
+    XBOX_CONST = CtrlToolbox.XBOXONE_CONST()
+    XBOX_CONST.JOYSTICK_SCALING.DEADZONE = 'radial'
+    XBOX_CONST.JOYSTICK_SCALING.CURVE = 'expo'
+    XBOX_CONST.JOYSTICK_SCALING.EXPO = 0.5
+    XBOX_CONST.JOYSTICK_FILTER = (EMAFilter(0.05),)
+    controller = Controller(SyntheticBackend('XBOX'), monitor=False, XBOX_CONST=XBOX_CONST, clock=clock)
+    controller.update()
+
+    # Callbacks submitted synchronously
+    values = dict()
+    controller._callback_executor = Executor()
+    for axis in ('JoyL_X', 'JoyL_Y', 'JoyR_X', 'Trig_L'):
+        controller.on_axis_change(axis, values.__setitem__, threshold=0.0)
+
+    # One update per published Frame
+    # (every report changes an Axis)
+    rng = random.Random(2)
+    for _ in range(200):
+        clock.advance(0.01)
+        code = rng.choice((0x00, 0x01, 0x03, 0x02))
+        controller._process_events([(3, code, rng.randrange(0, 256) if code == 0x02 else rng.randrange(-32768, 32768, 128)),
+                                    (0, 0x00, 0)])
+        controller.update()
+        assert (values.get('JoyL_X', 0.0), values.get('JoyL_Y', 0.0)) == (controller.JoyLeft.X, controller.JoyLeft.Y)
+        assert values.get('JoyR_X', 0.0) == controller.JoyRight.X
+        assert values.get('Trig_L', 0.0) == controller.TrigLeft.Val
+
+# Filtered Axis callbacks keep settling after the stick stopped
+# (no Frames published, the Axis Filters are stepped by update())
+def test_axis_callback_settle():
+    clock = ManualClock()
+    XBOX_CONST = CtrlToolbox.XBOXONE_CONST()
+    XBOX_CONST.JOYSTICK_FILTER = (EMAFilter(0.05),)
+    controller = Controller(SyntheticBackend('XBOX'), monitor=False, XBOX_CONST=XBOX_CONST, clock=clock)
+    controller.update()
+
+    # Callbacks submitted synchronously
+    values = dict()
+    controller._callback_executor = Executor()
+    controller.on_axis_change('JoyL_X', values.__setitem__, threshold=0.0)
+
+    # Single report, then updates without new Frames
+    controller._process_events([(3, 0x00, 32767), (0, 0x00, 0)])
+    for _ in range(50):
+        clock.advance(0.01)
+        controller.update()
+        assert values['JoyL_X'] == controller.JoyLeft.X
+
+    assert controller.JoyLeft.X > 99.9
+    assert controller.get_frame().version == 1
+
+# Main Function
+# ------------------------------
+if __name__ == '__main__':
+    test_expo_curve()
+    test_expo_curve_array()
+    test_custom_curve()
+    test_radial_deadzone()
+    test_joystick_radial()
+    test_radial_array()
+    test_axis_callback_parity()
+    test_axis_callback_settle()
+    print('Response Curve: OK')
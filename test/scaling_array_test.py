@@ -0,0 +1,59 @@
+# Batch Scaling Test
+# ------------------------------
+# Description:
+# Parity test of the NumPy batch scaling against
+# the scalar scaling functions
+
+# Version
+# ------------------------------
+# 0.1   -   Skipped without NumPy
+#           [18.10.2026] - Jan T. Olsen
+# 0.0   -   Initial version
+#           [18.10.2026] - Jan T. Olsen
+
+# Import packages
+import os
+import sys
+
+import pytest
+
+# NumPy batch scaling only
+np = pytest.importorskip('numpy')
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import ctrl_toolbox as CtrlToolbox
+
+# Scaling with Deadband: all raw values, integer and float arrays
+def test_deadband_array_parity():
+    for SCALING in (CtrlToolbox.XBOXONE_CONST().JOYSTICK_SCALING, CtrlToolbox.XBOXONE_CONST().TRIGGER_SCALING):
+        raw_values = np.arange(SCALING.RAW_MIN - 10, SCALING.RAW_MAX + 11)
+        expected = [CtrlToolbox.calc_minmax_scaling_deadband(int(raw_value),
+                                                             SCALING.RAW_MIN,
+                                                             SCALING.RAW_MAX,
+                                                             SCALING.RAW_DB,
+                                                             SCALING.MIN,
+                                                             SCALING.MAX) for raw_value in raw_values]
+
+        for dtype in (np.int32, np.int64, np.float64):
+            assert np.array_equal(CtrlToolbox.scale_input_array(raw_values.astype(dtype), SCALING), expected)
+
+# Scaling with Deadband: Lookup-Table path for narrow integer types
+def test_deadband_array_int16_parity():
+    SCALING = CtrlToolbox.PS3_CONST().JOYSTICK_SCALING
+    raw_values = np.arange(-32768, 32768).astype(np.int16)
+    expected = [CtrlToolbox.scale_input_joystick(int(raw_value), SCALING) for raw_value in raw_values]
+    assert np.array_equal(CtrlToolbox.scale_input_array(raw_values, SCALING), expected)
+
+# Scaling without Deadband
+def test_minmax_array_parity():
+    raw_values = np.arange(0, 256, dtype=np.uint8)
+    expected = [CtrlToolbox.calc_minmax_scaling(int(raw_value), 0, 255, 0.0, 100.0) for raw_value in raw_values]
+    assert np.array_equal(CtrlToolbox.calc_minmax_scaling_array(raw_values, 0, 255, 0.0, 100.0), expected)
+
+# Main Function
+# ------------------------------
+if __name__ == '__main__':
+    test_deadband_array_parity()
+    test_deadband_array_int16_parity()
+    test_minmax_array_parity()
+    print('Batch Scaling: OK')
@@ -0,0 +1,85 @@
+# Scaling Lookup-Table Test
+# ------------------------------
+# Description:
+# Parity test of the Lookup-Table scaling against
+# the direct scaling calculation (calc_minmax_scaling_deadband)
+
+# Version
+# ------------------------------
+# 0.1   -   Raw ranges far from raw value 0
+#           [18.10.2026] - Jan T. Olsen
+# 0.0   -   Initial version
+#           [18.10.2026] - Jan T. Olsen
+
+# Import packages
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import ctrl_toolbox as CtrlToolbox
+
+# Direct scaling calculation
+def _calc(raw_value, SCALING_CONST):
+    return CtrlToolbox.calc_minmax_scaling_deadband(raw_value,
+                                                    SCALING_CONST.RAW_MIN,
+                                                    SCALING_CONST.RAW_MAX,
+                                                    SCALING_CONST.RAW_DB,
+                                                    SCALING_CONST.MIN,
+                                                    SCALING_CONST.MAX)
+
+# Joystick: every raw value of all profiles
+def test_joystick_lut_parity():
+    for GAMEPAD_CONST in (CtrlToolbox.XBOXONE_CONST(), CtrlToolbox.PS3_CONST()):
+        SCALING = GAMEPAD_CONST.JOYSTICK_SCALING
+        for raw_value in range(SCALING.RAW_MIN, SCALING.RAW_MAX + 1):
+            assert CtrlToolbox.scale_input_joystick(raw_value, SCALING) == _calc(raw_value, SCALING)
+
+# Trigger: every raw value of all profiles
+def test_trigger_lut_parity():
+    for GAMEPAD_CONST in (CtrlToolbox.XBOXONE_CONST(), CtrlToolbox.PS3_CONST()):
+        SCALING = GAMEPAD_CONST.TRIGGER_SCALING
+        for raw_value in range(SCALING.RAW_MIN, SCALING.RAW_MAX + 1):
+            assert CtrlToolbox.scale_input_trigger(raw_value, SCALING) == _calc(raw_value, SCALING)
+
+# Raw values outside of the Lookup-Table range
+def test_out_of_range_parity():
+    SCALING = CtrlToolbox.XBOXONE_CONST().JOYSTICK_SCALING
+    for raw_value in (SCALING.RAW_MIN - 1, SCALING.RAW_MAX + 1, 1500.5, -40000):
+        assert CtrlToolbox.scale_input_joystick(raw_value, SCALING) == _calc(raw_value, SCALING)
+
+# Lookup-Table rebuilt after change of constants
+def test_lut_rebuilt_on_change():
+    SCALING = CtrlToolbox.XBOXONE_CONST().JOYSTICK_SCALING
+    CtrlToolbox.scale_input_joystick(2000, SCALING)
+    SCALING.RAW_DB = 4000
+    SCALING.MAX = 1.0
+    SCALING.MIN = -1.0
+    for raw_value in (0, 2000, 4001, 20000, -20000, SCALING.RAW_MAX):
+        assert CtrlToolbox.scale_input_joystick(raw_value, SCALING) == _calc(raw_value, SCALING)
+
+# Raw range far from raw value 0: no raw-indexed Lookup-Table allocated
+def test_offset_range():
+    SCALING = CtrlToolbox.XBOXONE_CONST().TRIGGER_SCALING
+    SCALING.RAW_MIN, SCALING.RAW_MAX, SCALING.RAW_DB = 1000000, 1001023, 100
+    assert len(SCALING.get_lut()) == 1024
+    assert SCALING.get_raw_lut() is None and SCALING.get_raw_lut(rounded=True) is None
+    for raw_value in (SCALING.RAW_MIN, 1000050, 1000512, SCALING.RAW_MAX):
+        assert CtrlToolbox.scale_input_trigger(raw_value, SCALING) == _calc(raw_value, SCALING)
+        assert CtrlToolbox.scale_input_rounded(raw_value, SCALING) == CtrlToolbox.round_value(_calc(raw_value, SCALING))
+
+    # Radial Deadzone without Axis Lookup-Table
+    SCALING = CtrlToolbox.XBOXONE_CONST().JOYSTICK_SCALING
+    SCALING.RAW_MIN, SCALING.RAW_MAX, SCALING.DEADZONE = 1000000, 1065535, 'radial'
+    axis_lut, gain_lut = SCALING.get_radial_lut()
+    assert axis_lut is None and len(gain_lut) == SCALING._RADIAL_LUT_SIZE + 1
+    assert abs(CtrlToolbox.scale_input_radial(SCALING.RAW_MAX, 1032768, SCALING)[0] - SCALING.MAX) < 1e-6
+
+# Main Function
+# ------------------------------
+if __name__ == '__main__':
+    test_joystick_lut_parity()
+    test_trigger_lut_parity()
+    test_out_of_range_parity()
+    test_lut_rebuilt_on_change()
+    test_offset_range()
+    print('Scaling Lookup-Table: OK')
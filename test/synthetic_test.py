@@ -0,0 +1,75 @@
+# Synthetic Backend Test
+# ------------------------------
+# Description:
+# Hardware-free test of the Controller with the Synthetic Backend
+# and the Manual Clock
+
+# Version
+# ------------------------------
+# 0.0   -   Initial version
+#           [18.10.2026] - Jan T. Olsen
+
+# Import packages
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from ctrl_main import Controller
+from lib.clock import ManualClock
+from lib.record import ReplayBackend
+from lib.synthetic import SyntheticBackend
+
+# Scripted reports with named Event-Keys
+def test_scripted_reports():
+    backend = SyntheticBackend('XBOX', reports=[[('Absolute', 'ABS_X', 1000), ('Key', 'BTN_SOUTH', 1)],
+                                                [('Absolute', 'ABS_RZ', 255)]])
+    controller = Controller(backend)
+    assert backend.finished.wait(timeout=5.0)
+    frame = controller.get_frame()
+    assert controller.gamepad_type == 'XBOX'
+    assert (frame.JoyL.X, frame.Button.A, frame.TrigR.VAL) == (1000, 1, 255)
+
+# Random reports of the PS3 profile
+def test_random_reports_ps3():
+    backend = SyntheticBackend('PS3', count=5000, seed=1)
+    controller = Controller(backend)
+    assert backend.finished.wait(timeout=10.0)
+    assert controller.gamepad_type == 'PS3'
+    assert controller.get_frame().version > 0
+
+# Rate with Manual Clock: 10 seconds of reports run faster than real time
+def test_rate_manual_clock():
+    clock = ManualClock()
+    backend = SyntheticBackend('XBOX', rate=1000.0, count=10000, seed=2, clock=clock)
+    Controller(backend)
+    assert backend.finished.wait(timeout=10.0)
+    assert abs(clock.time() - 9.999) < 1e-6
+
+# Recording and real-time replay on the Manual Clock
+def test_replay_manual_clock():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'record.bin')
+        clock = ManualClock()
+        backend = SyntheticBackend('XBOX', rate=100.0, count=500, seed=3, clock=clock)
+        live = Controller(backend, monitor=False)
+        live.start_recording(path, clock=clock)
+        for _ in range(backend.count):
+            live._process_events(backend.read())
+        live.stop_recording()
+
+        replay_clock = ManualClock()
+        replay = ReplayBackend(path, clock=replay_clock)
+        controller = Controller(replay)
+        assert replay.finished.wait(timeout=10.0)
+        assert abs(replay_clock.time() - clock.time()) < 1e-6
+        assert controller.get_frame().JoyL == live.get_frame().JoyL
+
+# Main Function
+# ------------------------------
+if __name__ == '__main__':
+    test_scripted_reports()
+    test_random_reports_ps3()
+    test_rate_manual_clock()
+    test_replay_manual_clock()
+    print('Synthetic Backend: OK')
@@ -0,0 +1,82 @@
+# Wait for Change Test
+# ------------------------------
+# Description:
+# Test of Controller.wait_for_change():
+# timeout, wake-up by the controller-monitor-thread and Component filter
+
+# Version
+# ------------------------------
+# 0.1   -   Test gamepad of the shared test helpers
+#           [18.10.2026] - Jan T. Olsen
+# 0.0   -   Initial version
+#           [18.10.2026] - Jan T. Olsen
+
+# Import packages
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import ctrl_toolbox as CtrlToolbox
+from helpers import get_controller
+
+# Send a report after a delay
+def _send_later(gamepad, *events, delay = 0.05):
+    timer = threading.Timer(delay, gamepad.send, args=events)
+    timer.start()
+    return timer
+
+# Timeout expires without published Frame
+def test_wait_timeout():
+    controller, _ = get_controller()
+    controller.update()
+    start = time.monotonic()
+    assert not controller.wait_for_change(timeout=0.05)
+    assert time.monotonic() - start >= 0.04
+    assert controller._frame_waiters == 0
+
+# Waiting thread is woken by the published Frame
+def test_wait_wakeup():
+    controller, gamepad = get_controller()
+    controller.update()
+    timer = _send_later(gamepad, ('Absolute', 'ABS_X', 12000))
+    start = time.monotonic()
+    assert controller.wait_for_change(timeout=5.0)
+    assert time.monotonic() - start < 4.0
+    timer.join()
+
+    # Change not consumed by update(): returns immediately
+    assert controller.wait_for_change(timeout=0.0)
+    assert controller.update()
+    assert controller.JoyLeft.X > 0.0
+    assert not controller.wait_for_change(timeout=0.0)
+
+# Only changes to the given Components wake the waiting thread
+def test_wait_components():
+    controller, gamepad = get_controller()
+    controller.update()
+    triggers = CtrlToolbox.COMPONENT_TRIG_L | CtrlToolbox.COMPONENT_TRIG_R
+
+    # Button change does not wake a wait for the Triggers
+    timer = _send_later(gamepad, ('Key', 'BTN_SOUTH', 1))
+    assert not controller.wait_for_change(timeout=0.2, components=triggers)
+    timer.join()
+    assert controller.wait_for_change(timeout=0.0, components=CtrlToolbox.COMPONENT_BUTTON)
+
+    # Trigger change wakes it
+    timer = _send_later(gamepad, ('Absolute', 'ABS_Z', 200))
+    assert controller.wait_for_change(timeout=5.0, components=CtrlToolbox.COMPONENT_TRIG_L)
+    timer.join()
+
+    # Consumed changes
+    controller.update()
+    assert not controller.wait_for_change(timeout=0.0)
+
+# Main Function
+# ------------------------------
+if __name__ == '__main__':
+    test_wait_timeout()
+    test_wait_wakeup()
+    test_wait_components()
+    print('Wait for Change: OK')